@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Batch balance simulator.
+Runs seeded headless games across modes and bot policies in parallel and
+writes one row per run (CSV, or Parquet when pandas is installed).
+
+    python balance_sweep.py --modes Easy Normal Hard --seeds 16 --duration 300 --out results.csv
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+from core.game_modes import GAME_MODES
+from core.bot import POLICIES
+from core.headless import run_headless
+
+FIELDS = ['mode', 'seed', 'policy', 'survived_s', 'died', 'kills', 'damage_taken',
+          'peak_enemies', 'mean_tick_ms', 'p95_tick_ms']
+
+
+def _run_job(job):
+    mode, seed, policy, duration = job
+    # Keep worker output to the progress lines printed by the parent
+    with open(os.devnull, 'w') as devnull:
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            return run_headless(mode, seed, policy, duration)
+        finally:
+            sys.stdout = stdout
+
+
+def write_results(rows, path):
+    if path.endswith('.parquet'):
+        try:
+            import pandas as pd
+        except ImportError:
+            raise SystemExit("Parquet output needs pandas (and pyarrow); use a .csv path instead")
+        pd.DataFrame(rows, columns=FIELDS).to_parquet(path, index=False)
+        return
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def summarize(rows):
+    """Print mean metrics per (mode, policy)."""
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['mode'], row['policy']), []).append(row)
+    print(f"{'mode':<8} {'policy':<16} {'runs':>4} {'survived_s':>10} {'died%':>6} {'kills':>7} {'dmg_taken':>9} {'tick_ms':>8}")
+    for (mode, policy), group in sorted(groups.items()):
+        n = len(group)
+        print(f"{mode:<8} {policy:<16} {n:>4} "
+              f"{sum(r['survived_s'] for r in group) / n:>10.1f} "
+              f"{100 * sum(r['died'] for r in group) / n:>6.0f} "
+              f"{sum(r['kills'] for r in group) / n:>7.1f} "
+              f"{sum(r['damage_taken'] for r in group) / n:>9.1f} "
+              f"{sum(r['mean_tick_ms'] for r in group) / n:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless balance sweeps across game modes.")
+    parser.add_argument('--modes', nargs='+', default=list(GAME_MODES), choices=list(GAME_MODES))
+    parser.add_argument('--policies', nargs='+', default=list(POLICIES), choices=list(POLICIES))
+    parser.add_argument('--seeds', type=int, default=8, help="Runs per (mode, policy), seeded 0..N-1")
+    parser.add_argument('--duration', type=float, default=300.0, help="Simulated seconds per run")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Worker processes (default: all cores)")
+    parser.add_argument('--out', default='balance_results.csv', help="Output .csv or .parquet path")
+    args = parser.parse_args()
+    out_path = os.path.abspath(args.out)
+    # Sprites and sounds are loaded by relative path; workers inherit the cwd
+    os.chdir(REPO_DIR)
+
+    jobs = [(mode, seed, policy, args.duration)
+            for mode, policy, seed in itertools.product(args.modes, args.policies, range(args.seeds))]
+    print(f"[SWEEP] {len(jobs)} runs on {args.workers} workers, {args.duration:.0f}s simulated each")
+    start = time.perf_counter()
+    rows = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(_run_job, job) for job in jobs]
+        for done, future in enumerate(as_completed(futures), 1):
+            row = future.result()
+            rows.append(row)
+            print(f"[SWEEP] {done}/{len(jobs)} {row['mode']} {row['policy']} seed={row['seed']} "
+                  f"survived={row['survived_s']}s kills={row['kills']}")
+    rows.sort(key=lambda r: (r['mode'], r['policy'], r['seed']))
+    write_results(rows, out_path)
+    print(f"[SWEEP] Wrote {out_path} in {time.perf_counter() - start:.1f}s")
+    summarize(rows)
+
+
+if __name__ == '__main__':
+    main()
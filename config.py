@@ -1,15 +1,6 @@
 # Enemy Type Config
-ENEMY_TYPE_CONFIG = {
-	'Plant': {
-		'max_health': 25,
-		'size': 48,
-		'speed': 75,
-		'color': (80, 200, 80),
-		'attack_range': 32,  # Only attack if player is within 32px
-		'attack_damage': 5,
-	},
-	# Add more enemy types here
-}
+ENEMY_DATA_PATH = 'resources/data/enemies.json'  # Enemy definitions (stats, sprites, logic class)
+SKILL_DATA_PATH = 'resources/data/skills.json'  # Skill definitions (cooldown, cast time, hit shape, damage, targeting)
 # Enemy Spawner Config
 SPAWNER_DEFAULT_INTERVAL = 1.0  # seconds between spawns
 SPAWNER_ENEMY_WEIGHTS = {
@@ -21,14 +12,99 @@ SPAWNER_TIME_WEIGHT_EVENTS = [
 	('Plant', 60, 2.0),  # After 60s, double plant spawn chance
 	# Add more events as needed
 ]
+SPAWNER_WAVE_CURVE = [
+	# (time_seconds, spawns_per_second) - linearly interpolated between points
+	(0, 1.0 / SPAWNER_DEFAULT_INTERVAL),
+	(60, 2.0),
+	(180, 4.0),
+	(600, 10.0),
+]
+SPAWNER_SURGES = [
+	# (time_seconds, enemy_count) - one-off bursts on top of the curve
+	(120, 40),
+	(300, 150),
+]
+SPAWNER_MAX_SPAWNS_PER_TICK = 64  # Surge backlog drains over several ticks
+SPAWNER_ELITE_BASE_CHANCE = 0.02  # Scaled by the elite_spawn_rate event multiplier
+SPAWNER_ELITE_HEALTH_MULTIPLIER = 3.0
+SPAWNER_ELITE_DAMAGE_MULTIPLIER = 2.0
+# Enemy level-of-detail config
+ENEMY_LOD_NEAR_RADIUS = 700  # Visible enemies within this distance of the player update every tick
+ENEMY_LOD_FAR_UPDATE_INTERVAL = 4  # Far/off-screen enemies update every Nth tick with accumulated dt
+ENEMY_LOD_VIEW_MARGIN = 64  # Extra pixels around the viewport still treated as visible
+# Crowd steering config
+SPATIAL_CELL_SIZE = 64  # Cell size of the per-tick enemy spatial index
+ENEMY_SEPARATION_RADIUS = 40  # Enemies closer than this push each other apart
+ENEMY_SEPARATION_MAX_NEIGHBORS = 6  # Neighbors considered per enemy (keeps steering O(k))
+ENEMY_SEPARATION_STRENGTH = 1.2  # Weight of separation relative to the pull toward the player
+ENEMY_STEERING_REFRESH_INTERVAL = 2  # Recompute each enemy's separation every Nth tick (staggered)
+# Player-enemy body collision (see systems/collision.py)
+PLAYER_COLLIDER_RADIUS = 12  # Player body circle (px)
+ENEMY_COLLIDER_SCALE = 0.25  # Enemy body radius as a fraction of its size; keep bodies apart by less than attack_range
+COLLISION_ITERATIONS = 3  # Push-out passes per tick
+COLLISION_PLAYER_SHARE = 0.3  # Part of each overlap the player gives way; enemies take the rest
+COLLISION_MAX_CANDIDATES = 64  # Broad-phase cap on enemies examined around the player
+CONTACT_DAMAGE_INTERVAL = 0.5  # Seconds between contact damage ticks
+# Skill target acquisition (see skills/targeting.py)
+TARGET_SEARCH_RADIUS = 600  # Spatial-index search around the player, doubled while nothing is found...
+TARGET_MAX_SEARCH_RADIUS = 2400  # ...up to this radius; enemies farther away are not targeted
+TARGET_SWITCH_RATIO = 0.8  # Auto-aim switches only to an enemy closer than this fraction of the current target's distance
+TARGET_ELITE_PRIORITY = 3.0  # 'priority' targeting weighs elites this many times more than regular enemies
+FLOW_FIELD_CELL_SIZE = 32  # Grid resolution of the shared pathfinding flow field
+FLOW_FIELD_SWEEPS_PER_TICK = 16  # Wavefront sweeps per tick spent rebuilding a field with obstacles (~0.3 ms each)
+# Gameplay event bus (see core/events.py)
+EVENT_QUEUE_CAPACITY = 256  # Preallocated events per type per tick (queues double when exceeded)
+# Loot and XP pickups (see systems/pickups.py)
+PICKUP_BUDGET = 4096  # Pooled pickup slots; a full pool merges XP orbs to make room
+PICKUP_MERGE_THRESHOLD = 600  # Merge XP orbs sharing a cell once more pickups than this lie on the floor
+PICKUP_MERGE_CELL_SIZE = 96  # Cell size (px) of the merge grid
+PICKUP_MAGNET_RADIUS = 160  # Pickups inside this distance fly to the player
+PICKUP_MAGNET_SPEED = 420  # px/s at the magnet edge, doubling as they close in
+PICKUP_COLLECT_RADIUS = 28  # Collected inside this distance
+PICKUP_SCATTER = 10  # Drops land this far (px) around the kill
+PICKUP_GOLD_DROP_CHANCE = 0.15  # Per kill, scaled by the mode and loot event multipliers
+PICKUP_GOLD_VALUE = 1  # Per gold drop, scaled by the mode's gold_multiplier
+PICKUP_ELITE_MULTIPLIER = 3  # Elites drop this many times their type's XP
+PICKUP_SIZES = [4, 5, 7, 9]  # Sprite radii, larger for more valuable (merged) pickups
+PICKUP_COLORS = [
+	(90, 200, 255),   # 0: XP orb
+	(255, 210, 60),   # 1: gold
+]
+# Particle effects
+PARTICLE_BUDGET = 4000  # Hard cap; the oldest particles are overwritten first
+PARTICLE_FADE_STEPS = 4  # Pre-baked alpha variants per sprite
+PARTICLE_SIZES = [2, 3, 5]  # Sprite radii, indexed by an emitter's 'size'
+PARTICLE_COLORS = [
+	(255, 240, 180),  # 0: spark
+	(255, 140, 60),   # 1: ember
+	(120, 220, 90),   # 2: plant sap
+	(60, 140, 50),    # 3: dark sap
+	(140, 200, 255),  # 4: dash
+]
+PARTICLE_EMITTERS = {
+	# count, speed (px/s), life (s), spread (deg), drag (1/s), jitter (px), size index, color indices
+	'hit': {'count': 8, 'speed': 220, 'life': 0.25, 'spread': 90, 'drag': 6.0, 'size': 0, 'colors': [0, 1]},
+	'death': {'count': 24, 'speed': 160, 'life': 0.6, 'spread': 360, 'drag': 3.0, 'jitter': 16, 'size': 1, 'colors': [2, 3]},
+	'dash': {'count': 3, 'speed': 30, 'life': 0.3, 'spread': 360, 'drag': 2.0, 'jitter': 20, 'size': 2, 'colors': [4]},
+}
 # Health and Barrier Bar Colors
 COLOR_HEALTH_BAR_BG = (135, 45, 40)
 COLOR_HEALTH_BAR_FILL = (175, 60, 55)
 COLOR_BARRIER_BAR_BG = (130, 110, 50)
 COLOR_BARRIER_BAR_FILL = (180, 150, 35)
-# HUD toggle key
-import pygame
-HUD_TOGGLE_KEY = pygame.K_TAB
+# HUD toggle key (pygame.K_TAB; a plain int so importing config doesn't import pygame)
+HUD_TOGGLE_KEY = 9
+# Skill bar slots, left to right: (label, 'mouse' button or 'key' code, bound skill).
+# Key codes are pygame's as plain ints; skills without a slot here take the first free one
+SKILL_BINDINGS = [
+	('LMB', 'mouse', 1, 'slash'),
+	('RMB', 'mouse', 3, 'barrier_burst'),
+	('SPACE', 'key', 32, 'dash'),
+	('1', 'key', 49, None),
+	('2', 'key', 50, None),
+	('3', 'key', 51, None),
+	('4', 'key', 52, None),
+]
 # HUD section config
 HUD_TOP_HEIGHT = 80
 HUD_BOTTOM_HEIGHT = 100
@@ -38,6 +114,7 @@ HUD_ALPHA = 120
 HUD_COLOR = (40, 40, 40, HUD_ALPHA)
 HUD_LABEL_COLOR = (200, 200, 200)
 HUD_LABEL_FONT_SIZE = 32
+HUD_TEXT_ALPHA_STEP = 16  # Fading HUD text is rendered once per this many alpha levels
 # Game loop UI and menu config
 GAME_BG_COLOR = (20, 20, 20)
 GAME_OVERLAY_COLOR = (0, 0, 0, 180) # Semi-transparent black
@@ -55,6 +132,38 @@ PLAYER_HURT_ANIMATION_FPS = 12  # Frames per second for hurt
 # FPS options
 GAME_FPS_OPTIONS = [60, 120, 240]
 GAME_DEFAULT_FPS = 60
+FRAME_BUSY_LOOP_MIN_FPS = 144  # At or above this target, pace with Clock.tick_busy_loop (precise, uses more CPU)
+# Render scale: world resolution in percent of the window (HUD stays native, see rendering/render_scale.py)
+RENDER_SCALE_OPTIONS = [50, 75, 100]
+RENDER_SCALE_DEFAULT = 100
+RENDER_SCALE_SMOOTH = False  # Upscale with smoothscale instead of nearest neighbour (softer, costs more)
+# Adaptive quality (see core/quality.py)
+QUALITY_LEVELS = [
+	# Level 0 is full quality; the controller steps down the list when frames run over budget.
+	# render_scale caps the render scale chosen in the settings
+	{'name': 'high', 'particle_budget': 4000, 'lod_near_radius': 700, 'hud_refresh_hz': 30, 'hurt_tint': True, 'render_scale': 100},
+	{'name': 'medium', 'particle_budget': 2000, 'lod_near_radius': 500, 'hud_refresh_hz': 15, 'hurt_tint': True, 'render_scale': 100},
+	{'name': 'low', 'particle_budget': 800, 'lod_near_radius': 350, 'hud_refresh_hz': 8, 'hurt_tint': False, 'render_scale': 75},
+	{'name': 'minimal', 'particle_budget': 200, 'lod_near_radius': 250, 'hud_refresh_hz': 4, 'hurt_tint': False, 'render_scale': 50},
+]
+QUALITY_SAMPLE_WINDOW = 120  # Frames per percentile evaluation
+QUALITY_PERCENTILE = 95
+QUALITY_DOWNGRADE_RATIO = 0.9  # Step down when the percentile exceeds 90% of the frame budget
+QUALITY_UPGRADE_RATIO = 0.6  # Step up only when it is under 60% (hysteresis band)
+QUALITY_CHANGE_COOLDOWN = 180  # Minimum frames between level changes
+# Scripted bot (headless runs, see core/bot.py)
+BOT_THREAT_RADIUS = 300  # Enemies within this distance drive kiting
+BOT_ATTACK_RADIUS = 90  # Slash when an enemy is this close
+BOT_DASH_CROWD = 4  # Dash away when this many enemies are within attack radius
+BOT_EDGE_MARGIN = 200  # Steer back toward the arena this far from its border
+# Soak tests (see soak_test.py)
+SOAK_WARMUP = 120.0  # Simulated seconds before the baseline snapshot (pools, caches fill up)
+SOAK_SAMPLE_INTERVAL = 60.0  # Simulated seconds between memory/object-count samples
+SOAK_MAX_MEMORY_GROWTH_MB = 8.0  # Fail if traced memory grows more than this after warmup
+SOAK_MAX_BLOCK_GROWTH = 50000  # Same for interpreter-allocated blocks (checked when tracemalloc is off)
+SOAK_MAX_TICK_DRIFT = 1.5  # Fail if the last interval's mean tick time exceeds the first by this ratio
+SOAK_ENEMY_CAP = 200  # Live enemy ceiling, reached before warmup ends so tick drift compares equal populations
+SOAK_TOP_ALLOCATIONS = 10  # Growing allocation sites / object types shown in the report
 # Player sprite/animation config
 PLAYER_IDLE_SPRITE = 'resources/images/player/Idle/Slime1_Idle_full.png'
 PLAYER_WALK_SPRITE = 'resources/images/player/Walk/Slime1_Walk_full.png'
@@ -64,6 +173,7 @@ PLAYER_SPRITE_FRAME_WIDTH = 64  # Adjust to your sprite frame width
 PLAYER_SPRITE_FRAME_HEIGHT = 64 # Adjust to your sprite frame height
 PLAYER_IDLE_ANIMATION_FPS = 6   # Frames per second for idle
 PLAYER_WALK_ANIMATION_FPS = 10  # Frames per second for walk
+ANIMATION_LUT_RATE = 240  # Samples per second in animation clip frame lookup tables (see systems/animation.py)
 # General Colors
 COLOR_WHITE = (255, 255, 255)
 COLOR_BLACK = (0, 0, 0)
@@ -87,6 +197,25 @@ FONT_SIZE_SMALL = 32
 # Window size
 WINDOW_WIDTH = 1920
 WINDOW_HEIGHT = 1080
+# World size (the arena can be larger than the window; the camera follows the player)
+WORLD_WIDTH = 5760
+WORLD_HEIGHT = 3240
+CAMERA_FOLLOW_SPEED = 8.0  # Higher = tighter follow; 0 snaps to the player every tick
+ENEMY_SPAWN_VIEW_MARGIN = 48  # Enemies spawn this far outside the camera view
+ENEMY_SPAWN_TRIES = 8  # Spawn positions tried before accepting one on a solid tile
+# Tilemap background
+MAP_PATH = 'resources/data/maps/arena.map'  # Binary tile grid (see rendering/tilemap.py)
+TILE_SIZE = 32
+MAP_CHUNK_SIZE = 512  # Pixel edge of each pre-rendered background chunk
+MAP_CHUNK_CACHE_SIZE = 24  # Baked chunks kept in the LRU (a 1080p view needs ~15)
+TILE_COLORS = [
+	(34, 40, 30),  # 0: ground
+	(38, 46, 32),  # 1: grass
+	(30, 34, 28),  # 2: dark grass
+	(46, 44, 38),  # 3: stones
+	(74, 70, 62),  # 4: rock (solid)
+]
+SOLID_TILES = (4,)  # Tile ids enemies path around (flow field obstacles)
 """
 Game configuration constants and settings.
 """
@@ -97,6 +226,7 @@ PLAYER_START_BARRIER = 50
 PLAYER_BARRIER_DECAY_PERCENT_PER_SEC = 10  # percent per second
 PLAYER_BARRIER_REGEN = 0
 PLAYER_START_EXP = 0
+PLAYER_EXP_FIRST_LEVEL = 10  # XP needed for level 2; each level needs PLAYER_EXP_TO_NEXT_LEVEL_MULT times the last
 PLAYER_EXP_TO_NEXT_LEVEL_MULT = 1.02
 PLAYER_START_LEVEL = 1
 PLAYER_SIZE = 48
@@ -119,9 +249,27 @@ PLAYER_ACTIVE_SKILLS = {
 	'barrier_burst': 0,
 	# Add more actives as needed
 }
+DAMAGE_LOG_MAX_ENTRIES = 256  # Damage history kept per log (oldest entries dropped)
+RECENT_DAMAGE_MAX_ENTRIES = 32
 SAVEGAME_PATH = "savegame.sav"
 
 # Audio settings
 MUSIC_VOLUME = 0.1  # 10%
 SFX_VOLUME = 0.1    # 10%
 BG_MUSIC_PATH = "resources/sounds/bg_music01.mp3"
+SFX_SOUNDS = {
+	# sound id -> file, preloaded into the AudioManager bank at startup
+	'hit': "resources/sounds/hit.mp3",
+	'level_up': "resources/sounds/level_up.mp3",
+	'new_wave': "resources/sounds/new_wave.mp3",
+	'power_up': "resources/sounds/power_up.mp3",
+	'shoot': "resources/sounds/shoot.mp3",
+	'unique_powerup': "resources/sounds/unique_powerup.mp3",
+}
+AUDIO_CHANNEL_GROUPS = {
+	# group -> reserved mixer channels
+	'sfx': 12,
+	'ui': 4,
+}
+AUDIO_MAX_VOICES_PER_SOUND = 3  # Concurrent voices of one sound before stealing
+AUDIO_FREE_CHANNELS = 4  # Unreserved mixer channels left above the groups for Sound.play outside the manager
@@ -0,0 +1,109 @@
+"""
+Scripted player policies for headless runs (balance sweeps, soak tests).
+A policy looks at the game through the shared enemy spatial index and
+returns a movement vector plus the set of skills it wants pressed; wrap it
+in core.input.BotInput to drive the player.
+"""
+import math
+from core.clock import game_clock
+from config import BOT_THREAT_RADIUS, BOT_ATTACK_RADIUS, BOT_DASH_CROWD, BOT_EDGE_MARGIN
+
+
+class BotPolicy:
+    """Base policy: stands still and presses nothing."""
+    name = 'idle'
+    auto_attack = False  # Whether the run enables the player's Auto Attack setting
+
+    def decide(self, game):
+        return (0, 0), set()
+
+    def aim(self, game):
+        """World point to aim at: the nearest threat, else straight ahead."""
+        player = game.player
+        threats = self._enemies_near(game, BOT_THREAT_RADIUS)
+        if threats:
+            nearest = min(threats, key=lambda e: (e.position[0] - player.x) ** 2 + (e.position[1] - player.y) ** 2)
+            return nearest.rect.center
+        dx, dy = player.last_move
+        return (player.x + dx * BOT_ATTACK_RADIUS, player.y + dy * BOT_ATTACK_RADIUS)
+
+    def _enemies_near(self, game, radius):
+        player = game.player
+        return game.enemy_index.query_radius(player.x, player.y, radius)
+
+    def _edge_push(self, game):
+        """Unit-ish vector back toward the arena when the player nears its border."""
+        player = game.player
+        world = game.camera.world_rect
+        px = py = 0.0
+        if player.x < world.left + BOT_EDGE_MARGIN:
+            px = 1.0
+        elif player.x > world.right - BOT_EDGE_MARGIN:
+            px = -1.0
+        if player.y < world.top + BOT_EDGE_MARGIN:
+            py = 1.0
+        elif player.y > world.bottom - BOT_EDGE_MARGIN:
+            py = -1.0
+        return px, py
+
+
+class StandAndFight(BotPolicy):
+    """Hold position and slash whenever an enemy is within reach."""
+    name = 'stand_and_fight'
+
+    def decide(self, game):
+        pressed = {'slash'} if self._enemies_near(game, BOT_ATTACK_RADIUS) else set()
+        return (0, 0), pressed
+
+
+class Kite(BotPolicy):
+    """Back away from the local crowd, slash what gets close, dash out when swarmed."""
+    name = 'kite'
+
+    def decide(self, game):
+        player = game.player
+        threats = self._enemies_near(game, BOT_THREAT_RADIUS)
+        pressed = set()
+        dx = dy = 0.0
+        if threats:
+            cx = sum(e.position[0] for e in threats) / len(threats)
+            cy = sum(e.position[1] for e in threats) / len(threats)
+            dx, dy = player.x - cx, player.y - cy
+            close = [e for e in threats
+                     if (e.position[0] - player.x) ** 2 + (e.position[1] - player.y) ** 2 <= BOT_ATTACK_RADIUS ** 2]
+            if close:
+                pressed.add('slash')
+            if len(close) >= BOT_DASH_CROWD:
+                pressed.add('dash')
+        ex, ey = self._edge_push(game)
+        dx += ex * 200
+        dy += ey * 200
+        return _normalize(dx, dy), pressed
+
+
+class AutoAttack(BotPolicy):
+    """Circle the arena and leave targeting to the game's auto-aim/auto-attack."""
+    name = 'auto_attack'
+    auto_attack = True
+
+    def decide(self, game):
+        angle = game_clock.now() * 0.5
+        ex, ey = self._edge_push(game)
+        return _normalize(math.cos(angle) + ex * 2, math.sin(angle) + ey * 2), set()
+
+
+def _normalize(dx, dy):
+    length = math.hypot(dx, dy)
+    if length < 1e-6:
+        return (0, 0)
+    return (dx / length, dy / length)
+
+
+POLICIES = {policy.name: policy for policy in (StandAndFight, Kite, AutoAttack)}
+
+
+def make_policy(name):
+    try:
+        return POLICIES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown bot policy '{name}' (choose from {', '.join(POLICIES)})")
@@ -0,0 +1,64 @@
+"""
+Camera: maps world coordinates to the screen and follows the player.
+"""
+import math
+import pygame
+from config import CAMERA_FOLLOW_SPEED
+
+
+class Camera:
+    """
+    Viewport into a world that can be larger than the window.
+    rect is the visible area in world coordinates; it is clamped so the
+    camera never shows space outside the world bounds.
+    """
+    def __init__(self, view_width, view_height, world_width, world_height, follow_speed=CAMERA_FOLLOW_SPEED):
+        self.world_rect = pygame.Rect(0, 0, world_width, world_height)
+        self.rect = pygame.Rect(0, 0, view_width, view_height)
+        self.follow_speed = follow_speed  # 0 snaps to the target every tick
+        # Float top-left so slow smoothing does not stall on integer rounding
+        self.x = 0.0
+        self.y = 0.0
+
+    def center_on(self, x, y):
+        self.x = x - self.rect.width / 2
+        self.y = y - self.rect.height / 2
+        self._clamp()
+
+    def follow(self, x, y, dt):
+        """Ease toward centering (x, y); exponential smoothing is frame-rate independent."""
+        if self.follow_speed <= 0:
+            self.center_on(x, y)
+            return
+        t = 1.0 - math.exp(-self.follow_speed * dt)
+        self.x += (x - self.rect.width / 2 - self.x) * t
+        self.y += (y - self.rect.height / 2 - self.y) * t
+        self._clamp()
+
+    def _clamp(self):
+        world = self.world_rect
+        self.x = min(max(self.x, world.left), max(world.left, world.right - self.rect.width))
+        self.y = min(max(self.y, world.top), max(world.top, world.bottom - self.rect.height))
+        self.rect.topleft = (int(self.x), int(self.y))
+
+    @property
+    def offset(self):
+        """Translation to add to world coordinates to get screen coordinates."""
+        return (-self.rect.x, -self.rect.y)
+
+    def world_to_screen(self, x, y):
+        return (x - self.rect.x, y - self.rect.y)
+
+    def screen_to_world(self, x, y):
+        return (x + self.rect.x, y + self.rect.y)
+
+    def mouse_world(self):
+        """Mouse cursor position in world coordinates."""
+        mx, my = pygame.mouse.get_pos()
+        return self.screen_to_world(mx, my)
+
+    def clamp_point(self, x, y, margin=0):
+        """Clamp a world point to the world bounds (inset by margin)."""
+        world = self.world_rect
+        return (min(max(x, world.left + margin), world.right - margin),
+                min(max(y, world.top + margin), world.bottom - margin))
@@ -0,0 +1,24 @@
+"""
+Simulation clock.
+Gameplay timers (skill cooldowns, enemy attack cadence) read this instead of
+wall-clock time, so pausing freezes them and headless runs can simulate
+faster than real time.
+"""
+
+
+class GameClock:
+    """Seconds of simulated game time, advanced by Game.update."""
+    def __init__(self):
+        self.time = 0.0
+
+    def reset(self):
+        self.time = 0.0
+
+    def advance(self, dt):
+        self.time += dt
+
+    def now(self):
+        return self.time
+
+
+game_clock = GameClock()
@@ -0,0 +1,156 @@
+"""
+Archetype-based entity-component-system storage.
+Entities with the same set of components share an Archetype whose
+component fields are dense NumPy columns, so systems iterate arrays
+instead of probing per-entity attributes.
+"""
+import numpy as np
+
+
+class Archetype:
+    """Dense storage for every entity that has exactly this component set."""
+    def __init__(self, component_types, capacity=64):
+        self.component_types = tuple(sorted(component_types, key=lambda c: c.name))
+        self.key = frozenset(c.name for c in self.component_types)
+        self.count = 0
+        self.capacity = capacity
+        self.entities = np.zeros(capacity, dtype=np.int64)
+        # columns[component name][field name] -> array of length capacity
+        self.columns = {
+            c.name: {field: np.zeros(capacity, dtype=dtype) for field, dtype in c.fields.items()}
+            for c in self.component_types
+        }
+
+    def column(self, component, field):
+        """Live view of a field for the entities currently stored."""
+        return self.columns[component.name][field][:self.count]
+
+    def _grow(self):
+        new_capacity = self.capacity * 2
+        entities = np.zeros(new_capacity, dtype=self.entities.dtype)
+        entities[:self.count] = self.entities[:self.count]
+        self.entities = entities
+        for fields in self.columns.values():
+            for field, arr in fields.items():
+                grown = np.zeros(new_capacity, dtype=arr.dtype)
+                grown[:self.count] = arr[:self.count]
+                fields[field] = grown
+        self.capacity = new_capacity
+
+    def append(self, entity, values):
+        """Add an entity; values maps component name -> {field: value}. Returns its row."""
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        self.entities[row] = entity
+        for name, fields in self.columns.items():
+            component_values = values.get(name, {})
+            for field, arr in fields.items():
+                arr[row] = component_values.get(field, 0)
+        self.count += 1
+        return row
+
+    def remove(self, row):
+        """Swap-remove a row. Returns the entity moved into row, or None."""
+        last = self.count - 1
+        moved = None
+        if row != last:
+            self.entities[row] = self.entities[last]
+            for fields in self.columns.values():
+                for arr in fields.values():
+                    arr[row] = arr[last]
+            moved = int(self.entities[row])
+        for fields in self.columns.values():
+            for arr in fields.values():
+                if arr.dtype == object:
+                    arr[last] = None  # Drop the reference so handles can be collected
+        self.count = last
+        return moved
+
+    def row_values(self, row):
+        return {
+            name: {field: arr[row] for field, arr in fields.items()}
+            for name, fields in self.columns.items()
+        }
+
+
+class World:
+    """Owns all archetypes and maps entity ids to (archetype, row)."""
+    def __init__(self):
+        self.archetypes = {}
+        self.locations = {}
+        self._next_id = 0
+        self._query_cache = {}
+
+    def create(self, components):
+        """Create an entity. components maps ComponentType -> {field: value}."""
+        entity = self._next_id
+        self._next_id += 1
+        archetype = self._archetype_for(components.keys())
+        values = {c.name: v for c, v in components.items()}
+        self.locations[entity] = (archetype, archetype.append(entity, values))
+        return entity
+
+    def destroy(self, entity):
+        archetype, row = self.locations.pop(entity)
+        moved = archetype.remove(row)
+        if moved is not None:
+            self.locations[moved] = (archetype, row)
+
+    def is_alive(self, entity):
+        return entity in self.locations
+
+    def add_component(self, entity, component, values=None):
+        archetype, row = self.locations[entity]
+        if component.name in archetype.key:
+            return
+        data = archetype.row_values(row)
+        data[component.name] = values or {}
+        self._move(entity, archetype, row, archetype.component_types + (component,), data)
+
+    def remove_component(self, entity, component):
+        archetype, row = self.locations[entity]
+        if component.name not in archetype.key:
+            return
+        data = archetype.row_values(row)
+        del data[component.name]
+        remaining = tuple(c for c in archetype.component_types if c.name != component.name)
+        self._move(entity, archetype, row, remaining, data)
+
+    def get(self, entity, component, field):
+        archetype, row = self.locations[entity]
+        return archetype.columns[component.name][field][row]
+
+    def set(self, entity, component, field, value):
+        archetype, row = self.locations[entity]
+        archetype.columns[component.name][field][row] = value
+
+    def query(self, *components):
+        """Return the archetypes containing all given components (cached per component set)."""
+        key = frozenset(c.name for c in components)
+        matches = self._query_cache.get(key)
+        if matches is None:
+            matches = [a for a in self.archetypes.values() if key <= a.key]
+            self._query_cache[key] = matches
+        return matches
+
+    def __len__(self):
+        return len(self.locations)
+
+    def _archetype_for(self, component_types):
+        key = frozenset(c.name for c in component_types)
+        archetype = self.archetypes.get(key)
+        if archetype is None:
+            archetype = self.archetypes[key] = Archetype(component_types)
+            # A new archetype may match existing queries
+            for query_key, matches in self._query_cache.items():
+                if query_key <= key:
+                    matches.append(archetype)
+        return archetype
+
+    def _move(self, entity, archetype, row, component_types, data):
+        moved = archetype.remove(row)
+        if moved is not None:
+            self.locations[moved] = (archetype, row)
+        target = self._archetype_for(component_types)
+        self.locations[entity] = (target, target.append(entity, data))
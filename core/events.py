@@ -0,0 +1,144 @@
+"""
+Typed gameplay event bus.
+Events are appended to preallocated per-type queues (one NumPy column per
+field) while the tick runs and dispatched in batches at fixed phases of the
+tick: a listener is called once with every event of its type raised since
+the last dispatch, so it can handle all deaths of a tick in a few array ops.
+"""
+import numpy as np
+from config import EVENT_QUEUE_CAPACITY
+
+# Dispatch phases, in tick order
+PHASE_EARLY = 'early'  # Game.update, after the game event manager ran
+PHASE_LATE = 'late'  # End of GameLogicManager.update, after enemies and skills
+
+
+class EventType:
+    """A named event with typed fields (field name -> NumPy dtype), dispatched at phase."""
+    def __init__(self, name, phase=PHASE_LATE, **fields):
+        self.name = name
+        self.phase = phase
+        self.fields = fields
+
+    def __repr__(self):
+        return f"EventType({self.name})"
+
+
+class EventBatch:
+    """
+    Every queued event of one type; fields read as array views (batch.x).
+    The views are only valid during the listener call.
+    """
+    def __init__(self, event_type, columns, count):
+        self.type = event_type
+        self.columns = columns
+        self.count = count
+
+    def __getattr__(self, field):
+        try:
+            return self.columns[field]
+        except KeyError:
+            raise AttributeError(field) from None
+
+    def __len__(self):
+        return self.count
+
+
+class EventQueue:
+    """Column storage for one event type; grows by doubling past its capacity."""
+    def __init__(self, event_type, capacity=EVENT_QUEUE_CAPACITY):
+        self.type = event_type
+        self.count = 0
+        self.capacity = capacity
+        self.columns = {field: np.zeros(capacity, dtype=dtype) for field, dtype in event_type.fields.items()}
+
+    def append(self, values):
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        for field, arr in self.columns.items():
+            arr[row] = values.get(field, 0)
+        self.count += 1
+
+    def _grow(self):
+        self.capacity *= 2
+        for field, arr in self.columns.items():
+            grown = np.zeros(self.capacity, dtype=arr.dtype)
+            grown[:self.count] = arr[:self.count]
+            self.columns[field] = grown
+
+    def batch(self, count):
+        return EventBatch(self.type, {field: arr[:count] for field, arr in self.columns.items()}, count)
+
+    def consume(self, count):
+        """Drop the first count events (keeping any raised while they were dispatched)."""
+        rest = self.count - count
+        for arr in self.columns.values():
+            if rest:
+                arr[:rest] = arr[count:self.count]
+            if arr.dtype == object:
+                arr[rest:self.count] = None  # Drop references so entities can be collected
+        self.count = rest
+
+    def clear(self):
+        self.consume(self.count)
+
+
+class EventBus:
+    """Per-type event queues plus the listeners subscribed to each type."""
+    def __init__(self, capacity=EVENT_QUEUE_CAPACITY):
+        self.capacity = capacity
+        self.queues = {}
+        self.listeners = {}
+
+    def emit(self, event_type, **values):
+        """Queue an event; it reaches listeners at the next dispatch of its phase."""
+        queue = self.queues.get(event_type)
+        if queue is None:
+            queue = self.queues[event_type] = EventQueue(event_type, self.capacity)
+        queue.append(values)
+
+    def subscribe(self, event_type, listener):
+        """Call listener(batch) with every event of event_type at each dispatch."""
+        self.listeners.setdefault(event_type, []).append(listener)
+
+    def unsubscribe(self, event_type, listener):
+        listeners = self.listeners.get(event_type)
+        if listeners and listener in listeners:
+            listeners.remove(listener)
+
+    def dispatch(self, phase):
+        """
+        Hand each queued type of this phase to its listeners as one batch, then
+        empty the queue (events nobody listens to are dropped). Events raised by
+        listeners wait for the next dispatch unless their type comes later in
+        this one.
+        """
+        for event_type, queue in list(self.queues.items()):
+            if event_type.phase != phase or not queue.count:
+                continue
+            count = queue.count
+            listeners = self.listeners.get(event_type)
+            if listeners:
+                batch = queue.batch(count)
+                for listener in listeners:
+                    listener(batch)
+            queue.consume(count)
+
+    def reset(self):
+        """Drop all queued events and listeners (a new run subscribes again)."""
+        self.listeners.clear()
+        for queue in self.queues.values():
+            queue.clear()
+
+
+# Gameplay events
+EnemySpawned = EventType('enemy_spawned', x=np.float64, y=np.float64, type_id=np.int16, enemy=object)
+EnemyHit = EventType('enemy_hit', x=np.float64, y=np.float64, amount=np.float32, enemy=object)
+EnemyDied = EventType('enemy_died', x=np.float64, y=np.float64, type_id=np.int16, enemy=object)
+PlayerLeveledUp = EventType('player_leveled_up', level=np.int32)
+# absorbed: part of amount taken by the barrier
+PlayerHit = EventType('player_hit', amount=np.float32, absorbed=np.float32, source=object)
+# Timed game events (core/game_events.py); kind is the event type name
+GameEventStarted = EventType('game_event_started', phase=PHASE_EARLY, kind=object, value=np.float64)
+GameEventEnded = EventType('game_event_ended', phase=PHASE_EARLY, kind=object)
@@ -4,38 +4,67 @@ Handles FPS control and timing calculations.
 """
 
 import json
+import os
 import pygame
+from config import FRAME_BUSY_LOOP_MIN_FPS, RENDER_SCALE_DEFAULT
 
 
 class FrameTimer:
     """Manages frame timing, FPS control, and time accumulation."""
-    
-    def __init__(self, settings_path):
+
+    def __init__(self, settings_path, busy_loop_min_fps=FRAME_BUSY_LOOP_MIN_FPS):
         self.settings_path = settings_path
         self.clock = pygame.time.Clock()
         self.time_accum = 0.0
         self.target_fps = 60  # Default FPS
-        
-    def tick(self):
-        """Advance one frame and return timing information."""
-        # Load current FPS setting
-        self.target_fps = self._load_fps_setting()
-        
-        # Calculate frame delta time
-        dt = self.clock.tick(self.target_fps) / 1000.0
+        self.render_scale = RENDER_SCALE_DEFAULT  # Percent, from the settings like the FPS cap
+        self.busy_loop_min_fps = busy_loop_min_fps
+        self.work_ms = 0.0  # Time spent in the last frame excluding the pacing delay
+        self._settings_mtime = None
+
+    @property
+    def budget_ms(self):
+        return 1000.0 / self.target_fps
+
+    def tick(self, fps=None):
+        """Advance one frame and return timing information. fps overrides the settings cap (menus)."""
+        # Load current FPS setting (re-read only when the settings file changes)
+        self._refresh_fps_setting()
+        fps = fps or self.target_fps
+
+        # Calculate frame delta time; sleep-based tick() can overshoot by a
+        # millisecond or more, which is a large share of a 240 FPS frame
+        if fps >= self.busy_loop_min_fps:
+            dt = self.clock.tick_busy_loop(fps) / 1000.0
+        else:
+            dt = self.clock.tick(fps) / 1000.0
+        self.work_ms = self.clock.get_rawtime()
         self.time_accum += dt
-        
+
         return dt, self.time_accum, self.clock.get_fps()
-    
-    def _load_fps_setting(self):
-        """Load FPS setting from configuration file."""
+
+    def restart(self):
+        """Time the next frame from now, so work done between frames (building a scene) isn't counted in its dt."""
+        self.clock.tick()
+
+    def _refresh_fps_setting(self):
+        try:
+            mtime = os.path.getmtime(self.settings_path)
+        except OSError:
+            mtime = None
+        if mtime != self._settings_mtime:
+            self._settings_mtime = mtime
+            self.target_fps, self.render_scale = self._load_settings()
+
+    def _load_settings(self):
+        """Load the FPS and render scale settings from configuration file."""
         try:
             with open(self.settings_path, 'r') as f:
                 settings = json.load(f)
-            return int(settings.get('fps', 60))
+            return int(settings.get('fps', 60)), int(settings.get('render_scale', RENDER_SCALE_DEFAULT))
         except Exception:
-            return 60  # Fallback to 60 FPS
-            
+            return 60, RENDER_SCALE_DEFAULT  # Fallback to 60 FPS at full resolution
+
     def get_accumulated_time(self):
         """Get total accumulated game time."""
         return self.time_accum
@@ -4,11 +4,29 @@ Handles player, monsters, loot, skills, and inventory.
 """
 
 import pygame
+import numpy as np
 from entities.player import Player
 from rendering.player_render import draw_player_idle, draw_player_walk
 from core.player_movement import handle_player_movement
 from core.game_modes import get_game_mode_config
 from core.game_events import GameEventManager
+from core.events import (
+    EventBus, PHASE_EARLY, EnemyHit, EnemyDied, PlayerHit, GameEventStarted, GameEventEnded
+)
+from systems.flow_field import FlowField
+from core.state import GameState
+from core.clock import game_clock
+from systems.particles import ParticleSystem
+from systems.pickups import PickupSystem, PICKUP_XP, PICKUP_GOLD
+from core.quality import QualityController
+from core.camera import Camera
+from core.input import InputSource
+from rendering.tilemap import load_tilemap
+from systems.tile_collision import TileCollider
+from rendering.menu import resource_path
+from config import (
+    WORLD_WIDTH, WORLD_HEIGHT, MAP_PATH, PICKUP_GOLD_DROP_CHANCE, PICKUP_GOLD_VALUE, PICKUP_ELITE_MULTIPLIER
+)
 
 class Game:
     def __init__(self, screen, slot, mode):
@@ -21,30 +39,52 @@ class Game:
         print(f"[GAME MODE] Starting {self.mode_config['display_name']}")
         print(f"[GAME MODE] {self.mode_config['description']}")
         
+        # Gameplay event bus (hits, deaths, spawns, timed game events)
+        self.events = EventBus()
         # Initialize game event manager
-        self.event_manager = GameEventManager(mode)
+        self.event_manager = GameEventManager(mode, self.events)
+        # Gameplay timers run on simulated time from here on
+        game_clock.reset()
         
         # Initialize player with mode-specific stats
         self.player = Player()
         self._apply_mode_modifiers()
         
         self.game_over = False
+        # Background map (memory-mapped tile grid); its solid tiles block movement and pathing
+        self.tilemap = load_tilemap(resource_path(MAP_PATH), WORLD_WIDTH, WORLD_HEIGHT)
+        self.tiles = TileCollider(self.tilemap)
+        # ECS world and per-tick systems (enemy movement, hurt feedback)
+        self.state = GameState(self.tiles)
+        # Hit, death and dash effects
+        self.particles = ParticleSystem()
+        # XP orbs and gold dropped by dying enemies
+        self.pickups = PickupSystem()
+        self._attach_effects()
+        self._subscribe_events()
+        # Adaptive quality level (fed by the frame timer in the game loop)
+        self.quality = QualityController()
+        # HUD values last sampled by the renderer ('time' is game time, None to resample next frame)
+        self.hud_snapshot = {'time': None, 'fps': None, 'active_events': None, 'event_notifications': None}
+        # Shared pathfinding field toward the player (obstacles come with the map)
+        self.flow_field = FlowField(WORLD_WIDTH, WORLD_HEIGHT)
+        self.flow_field.bind_tilemap(self.tilemap)
+        # Camera follows the player around a world larger than the window
+        self.camera = Camera(screen.get_width(), screen.get_height(), WORLD_WIDTH, WORLD_HEIGHT)
+        self.camera.center_on(self.player.x, self.player.y)
+        # Where movement, aim and held skills come from (set by the game loop or a headless run)
+        self.input = InputSource()
         # TODO: Initialize monsters, loot, map, etc.
 
     def _apply_mode_modifiers(self):
         """Apply game mode modifiers to player stats"""
         # Modify player stats based on game mode
         original_health = self.player.max_health
-        original_damage = getattr(self.player, 'base_damage', 10)  # Default if not set
         
         # Apply multipliers
         self.player.max_health = int(original_health * self.mode_config['player_health_multiplier'])
         self.player.health = self.player.max_health  # Set current health to new max
         
-        # Store base damage if not already stored
-        if not hasattr(self.player, 'base_damage'):
-            self.player.base_damage = original_damage
-        
         # Store mode multipliers for use during gameplay
         self.player.mode_damage_multiplier = self.mode_config['player_damage_multiplier']
         self.player.mode_speed_multiplier = self.mode_config['player_speed_multiplier']
@@ -56,28 +96,115 @@ class Game:
         """Reset the game state except for settings."""
         self.player = Player()
         self._apply_mode_modifiers()
-        self.event_manager = GameEventManager(self.mode)
+        self.events.reset()
+        self.event_manager = GameEventManager(self.mode, self.events)
         self.game_over = False
+        game_clock.reset()
+        self.pickups.clear()
+        self.hud_snapshot['time'] = None
+        self._attach_effects()
+        self._subscribe_events()
+        self.camera.center_on(self.player.x, self.player.y)
         # TODO: Reset monsters, loot, map, etc.
 
     def update(self, dt):
         if not self.game_over:
-            # Update event manager
+            game_clock.advance(dt)
+            
+            # Update event manager (starts and ends arrive as events)
             self.event_manager.update(dt)
+            self.events.dispatch(PHASE_EARLY)
             
             # Apply healing shrine effect if active
-            is_healing, heal_rate = self.event_manager.is_healing_shrine_active()
-            if is_healing and self.player.health < self.player.max_health:
-                heal_amount = heal_rate * dt
+            if self.heal_rate and self.player.health < self.player.max_health:
+                heal_amount = self.heal_rate * dt
                 self.player.health = min(self.player.max_health, self.player.health + heal_amount)
             
             self.player.update(dt)
+            self._keep_player_in_world()
+            self.camera.follow(self.player.x, self.player.y, dt)
+            
+            # Integrate ECS components (enemy movement, hurt timers)
+            self.state.update(dt)
+            self.particles.update(dt)
+            self._collect_pickups(dt)
+            
+            # Retarget the flow field if the player changed cell; rebuilds are spread over ticks
+            self.flow_field.update(self.player.position[0], self.player.position[1])
+            self.flow_field.step()
             
             # Check for player death
             if self.player.health <= 0:
                 self.game_over = True
         # TODO: Update monsters, loot, etc.
     
+    def _attach_effects(self):
+        """Give the current player's skills access to the particle system and the map's solid tiles."""
+        for skill in self.player.skills.values():
+            skill.particles = self.particles
+            skill.tiles = self.tiles
+
+    def _subscribe_events(self):
+        """Route gameplay events to their handlers (again after a reset, which drops listeners)."""
+        self.heal_rate = 0.0  # Healing shrine HP/s while one is active
+        self.player.events = self.events
+        self.events.subscribe(PlayerHit, self.player.on_hits)
+        self.events.subscribe(EnemyHit, self._on_enemies_hit)
+        self.events.subscribe(EnemyDied, self._on_enemies_died)
+        self.events.subscribe(GameEventStarted, self._on_game_events_started)
+        self.events.subscribe(GameEventEnded, self._on_game_events_ended)
+
+    def _on_enemies_hit(self, batch):
+        for enemy in batch.enemy:
+            # Skip enemies a later hit of the same tick killed
+            if enemy.alive and enemy.logic is not None:
+                enemy.logic.on_hurt()
+        # Sparks fly away from the player (the usual damage source), all hits in one emit
+        self.particles.emit_many('hit', batch.x, batch.y, batch.x - self.player.x, batch.y - self.player.y)
+
+    def _on_enemies_died(self, batch):
+        for enemy in batch.enemy:
+            if enemy.logic is not None:
+                enemy.logic.on_death()
+        self.particles.emit_many('death', batch.x, batch.y, batch.x - self.player.x, batch.y - self.player.y)
+        self._drop_loot(batch)
+
+    def _drop_loot(self, batch):
+        """One XP orb per death (worth the type's xp, more for elites) and a chance of gold."""
+        count = len(batch)
+        xp = np.fromiter((enemy.type.xp * (PICKUP_ELITE_MULTIPLIER if enemy.elite else 1) for enemy in batch.enemy),
+                         dtype=np.float32, count=count)
+        self.pickups.spawn_many(PICKUP_XP, batch.x, batch.y, xp)
+        gold = np.flatnonzero(np.random.random(count) < PICKUP_GOLD_DROP_CHANCE * self.get_loot_drop_multiplier())
+        if gold.size:
+            value = PICKUP_GOLD_VALUE * self.mode_config['gold_multiplier']
+            self.pickups.spawn_many(PICKUP_GOLD, batch.x[gold], batch.y[gold], np.full(gold.size, value))
+
+    def _collect_pickups(self, dt):
+        player = self.player
+        xp, gold = self.pickups.update(dt, player.x, player.y)
+        if xp:
+            player.gain_exp(xp * self.mode_config['experience_multiplier'])
+        if gold:
+            player.gold += gold
+
+    def _on_game_events_started(self, batch):
+        for kind, value in zip(batch.kind, batch.value):
+            if kind == 'healing_shrine':
+                self.heal_rate = float(value)
+
+    def _on_game_events_ended(self, batch):
+        if 'healing_shrine' in batch.kind:
+            self.heal_rate = 0.0
+
+    def _keep_player_in_world(self):
+        player = self.player
+        x, y = self.camera.clamp_point(player.x, player.y, player.size // 2)
+        if (x, y) != (player.x, player.y):
+            player.x, player.y = x, y
+            player.position = [x, y]
+            player.rect.center = (int(x), int(y))
+
     def get_effective_damage(self, base_damage):
         """Calculate effective damage with mode and event multipliers"""
         multipliers = self.event_manager.get_active_multipliers()
@@ -6,6 +6,7 @@ Handles special events that can occur during gameplay based on game mode.
 import pygame
 import random
 from core.game_modes import GAME_EVENTS, get_game_mode_config
+from core.events import GameEventStarted, GameEventEnded
 
 class GameEvent:
     def __init__(self, event_type, config):
@@ -34,8 +35,9 @@ class GameEvent:
         return f"{self.name} - {minutes:02d}:{seconds:02d}"
 
 class GameEventManager:
-    def __init__(self, game_mode):
+    def __init__(self, game_mode, events=None):
         self.game_mode = game_mode
+        self.events = events  # EventBus notified when events start and end (optional)
         self.mode_config = get_game_mode_config(game_mode)
         self.active_events = []
         self.event_check_timer = 0.0
@@ -48,7 +50,13 @@ class GameEventManager:
     def update(self, dt):
         """Update all active events and check for new ones"""
         # Update existing events
-        self.active_events = [event for event in self.active_events if event.update(dt)]
+        still_active = []
+        for event in self.active_events:
+            if event.update(dt):
+                still_active.append(event)
+            elif self.events is not None:
+                self.events.emit(GameEventEnded, kind=event.type)
+        self.active_events = still_active
         
         # Update notifications
         self.recent_notifications = [
@@ -88,6 +96,8 @@ class GameEventManager:
             config = GAME_EVENTS[event_type]
             new_event = GameEvent(event_type, config)
             self.active_events.append(new_event)
+            if self.events is not None:
+                self.events.emit(GameEventStarted, kind=event_type, value=new_event.effect_value)
             
             # Add notification
             notification_text = f"Event Started: {new_event.name}"
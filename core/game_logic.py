@@ -3,10 +3,18 @@ Game logic update system.
 Handles all non-rendering game state updates.
 """
 
-import pygame
 import time
+import numpy as np
 from entities.spawner import EnemySpawner
-from entities.enemy import PlantType
+from systems.lod import EnemyLOD
+from systems.spatial import SpatialHash
+from systems.crowd import CrowdSteering
+from systems.collision import BodyCollision
+from systems.corpses import CorpseStore
+from rendering.audio import get_audio
+from config import SPATIAL_CELL_SIZE
+from skills.targeting import TargetAcquisition
+from core.events import PHASE_LATE
 
 
 class GameLogicManager:
@@ -20,15 +28,27 @@ class GameLogicManager:
         self.enemies = []
         self.game.enemies = self.enemies
         self.spawner = EnemySpawner(
-            [PlantType], 
             get_game_time_fn=lambda: self.game_time,
             screen=screen,
             game=game
         )
+        self.lod = EnemyLOD()
+        # Dying enemies leave self.enemies for a render-only store until their death animation ends
+        self.corpses = CorpseStore(self.spawner.release)
+        self.game.corpses = self.corpses
+        # Spatial index of living enemies, rebuilt once per tick and shared
+        self.enemy_index = SpatialHash(SPATIAL_CELL_SIZE)
+        self.game.enemy_index = self.enemy_index
+        self.crowd = CrowdSteering(self.enemy_index)
+        self.collision = BodyCollision(self.enemy_index, tiles=game.tiles)
+        # Skill targets, gathered once per tick and kept between ticks
+        self.targets = TargetAcquisition(self.enemy_index)
         self.game_time = 0.0
+        self.kills = 0
+        self.enemy_cap = None  # Optional ceiling on live enemies (soak tests hold the population steady)
 
     def update(self, dt, event_handler):
-        """Update all game logic for this frame."""
+        """Update all game logic for this frame (held skills and aim come from game.input)."""
         self.game_time += dt
         
         if self.game.game_over or event_handler.paused:
@@ -41,59 +61,68 @@ class GameLogicManager:
         self._update_enemies(dt)
         
         # Update player skills with auto-targeting
-        self._update_player_skills(dt, event_handler)
+        self._update_player_skills(dt)
         
-        # Update player animation timers
-        if self.game.player.anim_lock:
-            self.game.player.anim_timer += dt
+        # Hand this tick's hits, deaths and spawns to their listeners in batches
+        self.game.events.dispatch(PHASE_LATE)
+        
+        # Start the sounds requested this tick
+        get_audio().update()
+
+    def apply_quality(self, settings):
+        """Apply a quality level from the QualityController."""
+        self.lod.near_radius = settings['lod_near_radius']
+        self.game.particles.set_limit(settings['particle_budget'])
 
     def _update_enemies(self, dt):
         """Handle enemy spawning and updates."""
-        # Spawn new enemies
-        new_enemy = self.spawner.spawn_if_ready()
-        if new_enemy:
-            self.enemies.append(new_enemy)
-            self.game.enemies = self.enemies
+        # Enemies killed since the last tick stop being simulated
+        self.corpses.collect(self.enemies)
+
+        # Spawn new enemies (the wave director may batch several per tick)
+        room = None if self.enemy_cap is None else self.enemy_cap - len(self.enemies)
+        spawned = self.spawner.spawn_tick(dt, room)
+        self.enemies.extend(spawned)
+        self.lod.add(spawned)
             
-        # Update existing enemies
-        for enemy in self.enemies[:]:
-            enemy.update(dt, self.game.player)
-            if hasattr(enemy, 'dead') and enemy.dead:
-                self.enemies.remove(enemy)
-                
+        # Rebuild the spatial index, push bodies apart around the player and refresh crowd separation
+        self.enemy_index.rebuild(self.enemies)
+        self.collision.update(self.game.player, dt)
+        self.crowd.update(self.enemies)
+
+        # Update existing enemies (far/off-screen ones at a reduced rate)
+        self.lod.update(self.game.player, dt, self.game.camera.rect, self.enemy_index)
+
+        # Corpses whose death animation finished go back to the pool
+        self.kills += self.corpses.update(self.game.camera.rect)
         self.game.enemies = self.enemies
 
-    def _update_player_skills(self, dt, event_handler):
-        """Update player skills with auto-aim and auto-attack."""
-        now = pygame.time.get_ticks() / 1000
+    def _update_player_skills(self, dt):
+        """Advance cooldowns, cast the ready skills that are held or auto-cast, update the active ones."""
+        book = self.game.player.skills
         
         # Get player settings
         auto_attack, auto_aim = self._get_player_settings()
         
-        # Handle pressed skills
-        for skill_name in ['slash', 'dash']:
-            if (event_handler.is_skill_pressed(skill_name) and 
-                skill_name in self.game.player.skills):
-                
-                skill = self.game.player.skills[skill_name]
-                if skill.can_use(now):
-                    target = self._get_skill_target(skill, auto_aim)
-                    if target is not None:
-                        skill.use(target_pos=target)
-        
-        # Handle auto-attack
+        # Every cooldown advances in one array op; ready, held and auto-cast skills are masks
+        book.tick(dt)
+        wanted = book.pressed(self.game.input)
         if auto_attack:
-            for name, skill in self.game.player.skills.items():
-                if getattr(skill, 'is_movement_skill', False):
-                    continue
-                if skill.can_use(now):
-                    target = self._get_skill_target(skill, auto_aim)
-                    if target is not None:
-                        skill.use(target_pos=target)
+            wanted |= ~book.movement
+        casting = np.flatnonzero(book.ready() & wanted)
+        if casting.size:
+            # Targets are gathered once and shared by every skill cast this tick
+            targets = self.targets
+            targets.begin_tick(self.game.player, self.game.input.state.aim, auto_aim)
+            for slot in casting:
+                skill = book.slots[slot]
+                target = targets.resolve(skill)
+                if target is not None:
+                    skill.use(target_pos=target)
         
-        # Update all skills
-        for skill in self.game.player.skills.values():
-            skill.update(dt, self.enemies)
+        # Update active skills
+        for slot in np.flatnonzero(book.active):
+            book.slots[slot].update(dt, self.enemies)
 
     def _get_player_settings(self):
         """Extract auto-attack and auto-aim settings from player."""
@@ -108,37 +137,3 @@ class GameLogicManager:
                     auto_aim = opt.get('checked', False)
                     
         return auto_attack, auto_aim
-
-    def _get_skill_target(self, skill, auto_aim):
-        """Determine the target for a skill based on settings."""
-        # Movement skills always target mouse position
-        if getattr(skill, 'is_movement_skill', False):
-            return pygame.mouse.get_pos()
-            
-        # Auto-aim targets closest enemy
-        if auto_aim:
-            closest = self._get_closest_enemy()
-            if closest:
-                return closest.rect.center
-            return None  # No target available
-            
-        # Default to mouse position
-        return pygame.mouse.get_pos()
-
-    def _get_closest_enemy(self):
-        """Find the closest enemy to the player."""
-        if not self.enemies:
-            return None
-            
-        # Get player position
-        if hasattr(self.game.player, 'x') and hasattr(self.game.player, 'y'):
-            px, py = int(self.game.player.x), int(self.game.player.y)
-        else:
-            px, py = self.game.player.rect.center
-            
-        # Find closest enemy by distance
-        closest = min(
-            self.enemies, 
-            key=lambda e: (e.rect.centerx - px) ** 2 + (e.rect.centery - py) ** 2
-        )
-        return closest
@@ -1,92 +1,150 @@
 """
 Clean game loop implementation.
-Orchestrates all game systems with clear separation of concerns.
+Gameplay and its pause overlay as scenes on the shared SceneManager loop.
 """
 
 import pygame
-from core.player_movement import handle_player_movement, get_movement_vector
+from core.player_movement import handle_player_movement
+from core.input import KeyboardMouseInput
 from core.init import initialize_game_state
-from rendering.game_render import draw_game
+from core.scenes import Scene, SceneManager
+from rendering.game_render import draw_game, draw_pause_menu
 from core.event_handler import GameEventHandler
 from core.game_logic import GameLogicManager
-from core.frame_timer import FrameTimer
-
-
-def run_game(screen, slot, mode):
-    """
-    Main game loop with clean architecture.
-    
-    Args:
-        screen: Pygame display surface
-        slot: Save slot index
-        mode: Game difficulty mode ('Easy', 'Normal', 'Hard')
-    """
-    # Initialize game state
-    (
-        game, running, should_exit, last_move, time_accum, clock, paused, pause_menu_selected,
-        pause_menu_options, pause_menu_rects, in_settings_menu, settings_menu, hud_visible, settings_path
-    ) = initialize_game_state(screen, slot, mode)
-    
-    # Initialize system managers
-    event_handler = GameEventHandler(game, screen)
-    game_logic = GameLogicManager(game, screen)
-    frame_timer = FrameTimer(settings_path)
-    
-    # Sync initial state with event handler
-    event_handler.running = running
-    event_handler.should_exit = should_exit
-    event_handler.paused = paused
-    event_handler.pause_menu_selected = pause_menu_selected
-    event_handler.pause_menu_options = pause_menu_options
-    event_handler.pause_menu_rects = pause_menu_rects
-    event_handler.in_settings_menu = in_settings_menu
-    event_handler.settings_menu = settings_menu
-    event_handler.hud_visible = hud_visible
-    
-    # Main game loop
-    while event_handler.running:
-        # Get frame timing
-        dt, time_accum, fps = frame_timer.tick()
-        
-        # Handle all input events
-        event_handler.handle_all_events()
-        
-        # Skip rest of frame if in settings menu
-        if event_handler.show_settings_menu_if_active():
-            continue
-            
+from config import PAUSE_MENU_OPTIONS
+
+
+class GameplayScene(Scene):
+    """One run of the game; popped on game over confirmation or surrender."""
+
+    def __init__(self, screen, slot, mode, input_source=None):
+        """
+        Args:
+            screen: Pygame display surface
+            slot: Save slot index
+            mode: Game difficulty mode ('Easy', 'Normal', 'Hard')
+            input_source: core.input source driving the player (default: keyboard and mouse)
+        """
+        super().__init__()
+        self.screen = screen
+        self.game = initialize_game_state(screen, slot, mode)[0]
+
+        # Initialize system managers
+        self.event_handler = GameEventHandler(self.game, screen)
+        self.game_logic = GameLogicManager(self.game, screen)
+        self.game.input = input_source if input_source is not None else KeyboardMouseInput(self.game.player.skills)
+        self.last_move = (0, 0)
+        self.pause = PauseScene(self)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and not self.game.game_over:
+            self.manager.push(self.pause)
+            return
+        self.event_handler.handle_event(event)
+        if self.event_handler.should_exit:
+            self.manager.pop()
+
+    def update(self, dt):
+        game = self.game
+        frame_timer = self.manager.frame_timer
+
+        # Shed or restore optional work based on recent frame times
+        if game.quality.observe(frame_timer.work_ms, frame_timer.budget_ms):
+            self.game_logic.apply_quality(game.quality.settings)
+
         # Handle player movement
-        if not game.game_over and not event_handler.paused:
-            move_dx, move_dy = get_movement_vector()
-            
+        if not game.game_over:
+            move_dx, move_dy = game.input.poll(game).move
+
             # Update player movement state
             if (move_dx, move_dy) != (0, 0):
                 game.player.last_move = (move_dx, move_dy)
-            last_move = (move_dx, move_dy)
-            
+            self.last_move = (move_dx, move_dy)
+
             # Apply movement
-            handle_player_movement(game.player, dt)
-        
+            handle_player_movement(game.player, dt, (move_dx, move_dy), game.tiles)
+
         # Update game logic
-        game_logic.update(dt, event_handler)
-        
-        # Render everything
+        self.game_logic.update(dt, self.event_handler)
+
+    def draw(self, screen):
+        frame_timer = self.manager.frame_timer
+        # The quality level may lower the render scale below the one chosen in the settings
+        render_scale = min(frame_timer.render_scale, self.game.quality.settings['render_scale'])
         draw_game(
             screen=screen,
-            game=game,
-            last_move=last_move,
-            time_accum=time_accum,
-            paused=event_handler.paused,
-            pause_menu_selected=event_handler.pause_menu_selected,
-            pause_menu_options=event_handler.pause_menu_options,
-            pause_menu_rects=event_handler.pause_menu_rects,
-            hud_visible=event_handler.hud_visible,
-            fps=fps
+            game=self.game,
+            last_move=self.last_move,
+            time_accum=frame_timer.time_accum,
+            hud_visible=self.event_handler.hud_visible,
+            fps=self.manager.fps,
+            flip=False,
+            render_scale=render_scale / 100
         )
-        
-        # Check for exit condition
-        if event_handler.should_exit:
-            break
+
+
+class PauseScene(Scene):
+    """Pause menu drawn over the frozen gameplay scene."""
+    opaque = False
+    fps = 60
+
+    def __init__(self, gameplay, options=PAUSE_MENU_OPTIONS):
+        super().__init__()
+        self.gameplay = gameplay
+        self.options = options
+        self.selected = 0
+        self.rects = []
+
+    def enter(self, manager):
+        super().enter(manager)
+        self.selected = 0
+        # Held skill buttons would otherwise stay down after resuming
+        self.gameplay.game.input.release_all()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop()
+            elif event.key == pygame.K_UP:
+                self.selected = (self.selected - 1) % len(self.options)
+            elif event.key == pygame.K_DOWN:
+                self.selected = (self.selected + 1) % len(self.options)
+            elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                self._select(self.options[self.selected])
+
+        elif event.type == pygame.MOUSEMOTION:
+            for i, rect in enumerate(self.rects):
+                if rect.collidepoint(event.pos):
+                    self.selected = i
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            for i, rect in enumerate(self.rects):
+                if rect.collidepoint(event.pos):
+                    self._select(self.options[i])
+                    break
+
+    def _select(self, option):
+        """Execute the selected pause menu option."""
+        from rendering.menu import get_menu, SettingsScene
+
+        if option == "Resume":
+            self.manager.pop()
+        elif option == "Surrender":
+            self.manager.pop(2)  # Pause and gameplay, back to the main menu
+        elif option == "Settings":
+            self.manager.push(SettingsScene(get_menu(self.manager.screen)))
+        elif option == "Quit":
+            self.manager.quit()
+
+    def draw(self, screen):
+        draw_pause_menu(screen, self.selected, self.options, self.rects)
+
+
+def run_game(screen, slot, mode, input_source=None):
+    """Run a single game on its own scene loop (the app pushes GameplayScene from the menu instead)."""
+    manager = SceneManager(screen)
+    manager.push(GameplayScene(screen, slot, mode, input_source))
+    manager.run()
 
 
 # Backwards compatibility - keep original function signature
@@ -1,10 +1,10 @@
 import pygame
 import os
-from config import BG_MUSIC_PATH, MUSIC_VOLUME, WINDOW_WIDTH, WINDOW_HEIGHT, PAUSE_MENU_OPTIONS
-from rendering.menu import resource_path, Menu
-from core.game import Game
+from config import BG_MUSIC_PATH, WINDOW_WIDTH, WINDOW_HEIGHT, PAUSE_MENU_OPTIONS
+from rendering.audio import get_audio
 
 def initialize_game_state(screen, slot, mode):
+    from core.game import Game  # Gameplay modules load on first game start, not with the menu
     game = Game(screen, slot, mode)
     running = True
     should_exit = False
@@ -26,14 +26,20 @@ def initialize_game_state(screen, slot, mode):
 Pygame and audio initialization logic.
 """
 def init_pygame():
-    pygame.init()
+    # Only display and fonts: the mixer is started by init_audio once the menu is on screen
+    pygame.display.init()
+    pygame.font.init()
     flags = pygame.HWSURFACE | pygame.DOUBLEBUF
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), flags)
     pygame.display.set_caption("SLL")
-    # Load and play background music
-    pygame.mixer.init()
-    music_path = resource_path(BG_MUSIC_PATH)
-    pygame.mixer.music.load(music_path)
-    pygame.mixer.music.set_volume(MUSIC_VOLUME)
-    pygame.mixer.music.play(-1)  # Loop forever
     return screen
+
+def init_audio():
+    # Preload sound effects, then stream background music in on a worker thread
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"[AUDIO] Mixer init failed: {e}")
+    audio = get_audio()
+    audio.start()
+    audio.play_music(BG_MUSIC_PATH)
@@ -0,0 +1,169 @@
+"""
+Player input sources.
+The game reads movement, aim and held skills from one InputSource per tick
+instead of polling pygame directly, so keyboard/mouse, a recorded replay or
+a scripted bot can all drive the same game.
+"""
+import json
+import pygame
+from config import SKILL_BINDINGS
+
+
+class InputState:
+    """One tick of player intent: movement vector, aim point (world space) and held skills."""
+    __slots__ = ('move', 'aim', 'pressed')
+
+    def __init__(self, move=(0, 0), aim=None, pressed=frozenset()):
+        self.move = move
+        self.aim = aim
+        self.pressed = pressed
+
+    def to_list(self):
+        return [self.move[0], self.move[1],
+                None if self.aim is None else [self.aim[0], self.aim[1]],
+                sorted(self.pressed)]
+
+    @classmethod
+    def from_list(cls, row):
+        dx, dy, aim, pressed = row
+        return cls((dx, dy), None if aim is None else tuple(aim), frozenset(pressed))
+
+
+IDLE = InputState()
+
+
+class InputSource:
+    """Base source: no movement, no aim, nothing pressed."""
+    def __init__(self):
+        self.state = IDLE
+
+    def poll(self, game):
+        """Sample this tick's input; the result is also kept in self.state."""
+        self.state = self._read(game)
+        return self.state
+
+    def _read(self, game):
+        return IDLE
+
+    def is_skill_pressed(self, skill_name):
+        return skill_name in self.state.pressed
+
+    def handle_event(self, event):
+        """Gameplay pygame events are offered to the source (only live input uses them)."""
+
+    def release_all(self):
+        """Forget held skills (e.g. when the game is paused mid-press)."""
+
+
+def skill_slots(skill_names, bindings=SKILL_BINDINGS):
+    """
+    Skill bar slots as (label, kind, code, skill name or None). Skills bound in
+    config keep their slot if the user has them; the user's other skills fill
+    the free slots in order, so a skill declared only in data is still usable.
+    """
+    skill_names = list(skill_names)
+    slots = [(label, kind, code, name if name in skill_names else None) for label, kind, code, name in bindings]
+    bound = {slot[3] for slot in slots}
+    unbound = [name for name in skill_names if name not in bound]
+    for i, (label, kind, code, name) in enumerate(slots):
+        if name is None and unbound:
+            slots[i] = (label, kind, code, unbound.pop(0))
+    return slots
+
+
+class KeyboardMouseInput(InputSource):
+    """
+    WASD movement, mouse aim; a skill is pressed while its bound key or button
+    is held. A press is also kept until the next poll, so a click that goes
+    down and up between two ticks still casts.
+    """
+    def __init__(self, skill_names=()):
+        super().__init__()
+        # ('mouse', button) or ('key', key code) -> skill name
+        self.bindings = {(kind, code): name for _, kind, code, name in skill_slots(skill_names) if name}
+        self.held = set()
+        self.tapped = set()
+
+    def handle_event(self, event):
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            name = self.bindings.get(('mouse', event.button))
+        elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            name = self.bindings.get(('key', event.key))
+        else:
+            return
+        if name is None:
+            return
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+            self.held.add(name)
+            self.tapped.add(name)
+        else:
+            self.held.discard(name)
+
+    def release_all(self):
+        self.held.clear()
+        self.tapped.clear()
+
+    def _read(self, game):
+        from core.player_movement import get_movement_vector
+        pressed = frozenset(self.held | self.tapped)
+        self.tapped.clear()
+        return InputState(get_movement_vector(), game.camera.mouse_world(), pressed)
+
+
+class BotInput(InputSource):
+    """Wraps a core.bot policy, which reads the game through the enemy spatial index."""
+    def __init__(self, policy):
+        super().__init__()
+        self.policy = policy
+
+    def _read(self, game):
+        move, pressed = self.policy.decide(game)
+        return InputState(move, self.policy.aim(game), frozenset(pressed))
+
+
+class RecordingInput(InputSource):
+    """Passes another source through and keeps every tick for later replay."""
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self.frames = []
+
+    def handle_event(self, event):
+        self.source.handle_event(event)
+
+    def release_all(self):
+        self.source.release_all()
+
+    def _read(self, game):
+        state = self.source.poll(game)
+        self.frames.append(state)
+        return state
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump([state.to_list() for state in self.frames], f)
+        print(f"[INPUT] Recorded {len(self.frames)} ticks to {path}")
+
+
+class ReplayInput(InputSource):
+    """Plays back recorded ticks in order, then goes idle."""
+    def __init__(self, frames):
+        super().__init__()
+        self.frames = frames
+        self.index = 0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            return cls([InputState.from_list(row) for row in json.load(f)])
+
+    @property
+    def finished(self):
+        return self.index >= len(self.frames)
+
+    def _read(self, game):
+        if self.finished:
+            return IDLE
+        state = self.frames[self.index]
+        self.index += 1
+        return state
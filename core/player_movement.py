@@ -2,6 +2,7 @@
 Player movement logic (input and movement updates).
 """
 import pygame
+from config import PLAYER_COLLIDER_RADIUS
 
 def get_movement_vector():
     """Return (dx, dy) movement vector based on WASD keys, normalized for diagonal movement."""
@@ -20,12 +21,20 @@ def get_movement_vector():
         dy *= 0.7071
     return dx, dy
 
-def handle_player_movement(player, dt):
-    """Handle WASD movement input for the player. dt is delta time in seconds."""
-    dx, dy = get_movement_vector()
+def handle_player_movement(player, dt, vector=None, tiles=None):
+    """
+    Handle WASD movement input for the player. dt is delta time in seconds.
+    vector: optional (dx, dy) to use instead of the keyboard (scripted runs).
+    tiles: optional TileCollider; the player slides along solid tiles instead of entering them.
+    """
+    dx, dy = vector if vector is not None else get_movement_vector()
     # Update last_move if there is movement
     if (dx, dy) != (0, 0):
         player.last_move = (dx, dy)
-    player.x += dx * player.movement_speed * dt * 60
-    player.y += dy * player.movement_speed * dt * 60
+    x = player.x + dx * player.movement_speed * dt * 60
+    y = player.y + dy * player.movement_speed * dt * 60
+    if tiles is not None:
+        x, y = tiles.slide(player.x, player.y, x, y, PLAYER_COLLIDER_RADIUS)
+    player.x, player.y = x, y
     player.position = [player.x, player.y]
+    player.rect.center = (int(player.x), int(player.y))
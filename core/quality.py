@@ -0,0 +1,64 @@
+"""
+Adaptive quality controller.
+Watches a rolling percentile of frame work time and steps optional work
+(particles, full-rate enemy radius, HUD refresh, hurt tint) down when frames
+run over budget and back up when there is headroom.
+"""
+import numpy as np
+from config import (
+    QUALITY_LEVELS, QUALITY_SAMPLE_WINDOW, QUALITY_PERCENTILE,
+    QUALITY_DOWNGRADE_RATIO, QUALITY_UPGRADE_RATIO, QUALITY_CHANGE_COOLDOWN
+)
+
+
+class QualityController:
+    """
+    Level 0 is full quality; higher levels shed more work.
+    Downgrades trigger when the percentile exceeds down_ratio * budget and
+    upgrades only below up_ratio * budget; together with the cooldown and
+    the sample reset after each change this keeps the level from oscillating.
+    """
+    def __init__(self, levels=QUALITY_LEVELS, window=QUALITY_SAMPLE_WINDOW, percentile=QUALITY_PERCENTILE,
+                 down_ratio=QUALITY_DOWNGRADE_RATIO, up_ratio=QUALITY_UPGRADE_RATIO, cooldown=QUALITY_CHANGE_COOLDOWN):
+        self.levels = levels
+        self.percentile = percentile
+        self.down_ratio = down_ratio
+        self.up_ratio = up_ratio
+        self.cooldown = cooldown
+        self.samples = np.zeros(window, dtype=np.float32)
+        self.count = 0
+        self.index = 0
+        self.level = 0
+        self.frames_since_change = 0
+        self.last_percentile_ms = 0.0
+        self.last_decision = None  # Human-readable reason for the last change (profiler overlay)
+
+    @property
+    def settings(self):
+        return self.levels[self.level]
+
+    def observe(self, work_ms, budget_ms):
+        """Record one frame's work time. Returns True if the quality level changed."""
+        self.samples[self.index] = work_ms
+        self.index = (self.index + 1) % len(self.samples)
+        self.count = min(self.count + 1, len(self.samples))
+        self.frames_since_change += 1
+        if self.count < len(self.samples) or self.frames_since_change < self.cooldown:
+            return False
+        p = float(np.percentile(self.samples, self.percentile))
+        self.last_percentile_ms = p
+        if p > budget_ms * self.down_ratio and self.level < len(self.levels) - 1:
+            return self._change(self.level + 1, f"p{self.percentile} {p:.1f}ms > {budget_ms * self.down_ratio:.1f}ms")
+        if p < budget_ms * self.up_ratio and self.level > 0:
+            return self._change(self.level - 1, f"p{self.percentile} {p:.1f}ms < {budget_ms * self.up_ratio:.1f}ms")
+        return False
+
+    def _change(self, level, reason):
+        old = self.settings['name']
+        self.level = level
+        self.last_decision = f"{old} -> {self.settings['name']} ({reason})"
+        # Judge the new level on fresh samples only
+        self.count = 0
+        self.index = 0
+        self.frames_since_change = 0
+        return True
@@ -0,0 +1,103 @@
+"""
+Scene stack.
+Menus, gameplay and overlays are scenes that are created once and pushed or
+popped on a SceneManager, which runs the one event loop of the application.
+"""
+
+import os
+import pygame
+from core.frame_timer import FrameTimer
+
+
+class Scene:
+    """Base scene: ignores input and draws nothing."""
+    opaque = True  # Scenes below an opaque scene are not drawn
+    fps = None  # Frame cap while on top (None: the FPS from settings.json)
+
+    def __init__(self):
+        self.manager = None
+
+    def enter(self, manager):
+        """Called when pushed onto the stack."""
+        self.manager = manager
+
+    def exit(self):
+        """Called when popped off the stack."""
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def draw(self, screen):
+        pass
+
+
+class SceneManager:
+    """Owns the scene stack, the frame timer and the shared event loop."""
+
+    def __init__(self, screen, settings_path=None):
+        self.screen = screen
+        if settings_path is None:
+            settings_path = os.path.join(os.path.dirname(__file__), '..', 'settings.json')
+        self.frame_timer = FrameTimer(settings_path)
+        self.stack = []
+        self.running = True
+        self.dt = 0.0
+        self.fps = 0.0
+
+    @property
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        self.stack.append(scene)
+        scene.enter(self)
+        self.frame_timer.restart()
+
+    def pop(self, count=1):
+        """Pop count scenes; quits when the stack runs empty."""
+        for _ in range(min(count, len(self.stack))):
+            self.stack.pop().exit()
+        if not self.stack:
+            self.running = False
+        self.frame_timer.restart()
+
+    def replace(self, scene):
+        """Swap the top scene for another (e.g. mode select -> gameplay)."""
+        if self.stack:
+            self.stack.pop().exit()
+        self.push(scene)
+
+    def quit(self):
+        self.running = False
+
+    def run(self, on_first_frame=None):
+        """Run until quit or the stack is empty. on_first_frame runs once after the first flip."""
+        while self.running and self.stack:
+            self.dt, _, self.fps = self.frame_timer.tick(self.top.fps)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    break
+                # Events after a transition go to the new top scene
+                self.top.handle_event(event)
+                if not self.running or not self.stack:
+                    break
+            if not self.running or not self.stack:
+                break
+            self.top.update(self.dt)
+            self._draw()
+            pygame.display.flip()
+            if on_first_frame is not None:
+                on_first_frame()
+                on_first_frame = None
+
+    def _draw(self):
+        # Draw from the topmost opaque scene upward so overlays sit on what they cover
+        first = len(self.stack) - 1
+        while first > 0 and not self.stack[first].opaque:
+            first -= 1
+        for scene in self.stack[first:]:
+            scene.draw(self.screen)
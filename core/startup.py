@@ -0,0 +1,44 @@
+"""
+Startup timing.
+Records how long each import and init phase takes on the way to the first
+menu frame; `python main.py --startup-report` prints the breakdown. For
+per-module import detail use `python -X importtime main.py`.
+Only imports the standard library so it can be loaded before anything else.
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupReport:
+    """Ordered list of (phase, ms, modules imported during the phase)."""
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []
+        self._printed = 0
+
+    @contextmanager
+    def phase(self, name):
+        modules_before = len(sys.modules)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - t0) * 1000
+            self.phases.append((name, ms, len(sys.modules) - modules_before))
+
+    def mark(self, name):
+        """Record a milestone as the time since process start of this report."""
+        self.phases.append((name, None, (time.perf_counter() - self.start) * 1000))
+
+    def print_report(self):
+        """Print the phases recorded since the last call."""
+        for name, ms, extra in self.phases[self._printed:]:
+            if ms is None:
+                print(f"[STARTUP] {name:<24} at {extra:8.1f} ms")
+            else:
+                print(f"[STARTUP] {name:<24} {ms:8.1f} ms  (+{extra} modules)")
+        self._printed = len(self.phases)
+
+
+startup = StartupReport()
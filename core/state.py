@@ -1,7 +1,23 @@
 """
 Game state representation.
 """
+from core.ecs import World
+from systems.animation import animation_system
+from systems.combat import hurt_feedback_system
+from systems.movement import movement_system
+
+
 class GameState:
-    def __init__(self):
-        # Store all relevant game state here
-        pass
+    """Holds the ECS world and runs the per-tick systems over it."""
+    def __init__(self, tiles=None):
+        self.world = World()
+        self.tiles = tiles  # TileCollider moving entities are kept out of (None: open ground)
+        # Systems run in this order every tick
+        self.systems = [hurt_feedback_system, animation_system, self._movement]
+
+    def _movement(self, world, dt):
+        movement_system(world, dt, self.tiles)
+
+    def update(self, dt):
+        for system in self.systems:
+            system(self.world, dt)
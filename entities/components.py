@@ -1,7 +1,30 @@
 """
 Shared components for entities (e.g., health, position).
+Each component is a named set of typed fields; the ECS world stores every
+field as a dense column per archetype (see core/ecs.py).
 """
-class HealthComponent:
-    def __init__(self, max_health):
-        self.max_health = max_health
-        self.current_health = max_health
+import numpy as np
+
+
+class ComponentType:
+    def __init__(self, name, **fields):
+        self.name = name
+        self.fields = fields  # field name -> NumPy dtype
+
+    def __repr__(self):
+        return f"ComponentType({self.name})"
+
+
+Position = ComponentType('position', x=np.float64, y=np.float64)
+Velocity = ComponentType('velocity', x=np.float64, y=np.float64)
+Health = ComponentType('health', current=np.float64, max=np.float64)
+# Playing clip (systems/animation.py clip_library id) and its start time; frame and
+# done (ONCE clip completion reported) are written by animation_system. Plus the hurt tint countdown
+Animation = ComponentType('animation', clip=np.int16, start=np.float64, frame=np.int16, done=np.int8,
+                          hurt_timer=np.float32)
+Faction = ComponentType('faction', id=np.int8)
+# Back-reference to the Python object (e.g. Enemy) that owns the entity
+Handle = ComponentType('handle', obj=object)
+
+FACTION_PLAYER = 0
+FACTION_ENEMY = 1
@@ -1,17 +1,22 @@
-# Import plant logic
-from entities.plant_logic import PlantEnemyLogic
-from config import ENEMY_TYPE_CONFIG
 """
 Enemy entity and logic.
+Enemy types are defined in data files and loaded by entities/enemy_registry.py.
 """
 import pygame
+import random
+from entities.components import Position, Velocity, Health, Animation, Faction, Handle, FACTION_ENEMY
+from core.clock import game_clock
+from core.events import EnemyHit, EnemyDied
 
 
 
 # EnemyType: defines archetype attributes and skills for enemies
 class EnemyType:
-    def __init__(self, name, max_health, size, skills=None, speed=1.0, color=(255,0,0), logic_cls=None, attack_range=32, attack_damage=5):
+    def __init__(self, name, max_health, size, skills=None, speed=1.0, color=(255,0,0), logic_cls=None, attack_range=32, attack_damage=5,
+                 attack_trigger_range=40, attack_cooldown=1.0, attack_impact_frame=3, frame_time=0.1, xp=1, contact_damage=0,
+                 sprite_dir=None, animations=None, type_id=-1):
         self.name = name
+        self.type_id = type_id  # Row in the registry's compiled stat table
         self.max_health = max_health
         self.size = size
         self.skills = skills or []
@@ -19,70 +24,182 @@ class EnemyType:
         self.color = color
         self.logic_cls = logic_cls
         self.attack_range = attack_range
+        self.attack_trigger_range = attack_trigger_range
         self.attack_damage = attack_damage
+        self.attack_cooldown = attack_cooldown
+        self.attack_impact_frame = attack_impact_frame
+        self.frame_time = frame_time
+        self.xp = xp  # Experience dropped on death
+        self.contact_damage = contact_damage  # Damage per contact tick while touching the player
+        self.sprite_dir = sprite_dir
+        # {state: (sprite sheet file, frame count)}
+        self.animations = animations or {}
+        self.frame_counts = {state: frames for state, (_, frames) in self.animations.items()}
+        self.stats = None  # EnemyStatTable, set when the registry compiles
 
 # Enemy: instance of an enemy in the game, based on EnemyType
 class Enemy:
+    """
+    Handle for an enemy entity. Position, velocity, health and the hurt tint
+    timer live in the ECS world; this object holds the per-enemy behaviour
+    and copies of the scalars its logic reads every tick (position, health,
+    hurt timer, animation frame). Setters write through to the columns, and
+    the systems that change columns in bulk refresh the copies of the rows
+    they changed, so reads never go through a world.locations lookup.
+    """
+    __slots__ = (
+        'type', 'logic', 'game', 'world', 'entity', 'rect', 'position', 'size', 'facing_angle',
+        'skills', 'speed', 'color', 'mode_damage_multiplier', 'mode_speed_multiplier', 'elite',
+        'visible', 'lod_time', 'lod_slot', 'steer', 'alive', 'dead',
+        '_health', '_max_health', '_hurt_timer', 'anim_frame',
+    )
+
     def take_damage(self, amount, source=None):
         # If already dead or in death animation, ignore further damage
-        if self.dead or (self.logic and hasattr(self.logic, 'state') and self.logic.state == 'death'):
+        if not self.alive:
             return
             
-        self.health -= amount
+        health = self.health - amount
+        self.health = health
         
-        # Handle death or hurt visual feedback
-        if self.logic and hasattr(self.logic, 'state'):
-            if self.health <= 0:
-                # Death overrides everything
-                self.logic.state = 'death'
-                self.logic.anim_frame = 0
-                self.logic.anim_timer = 0.0
-                # Fix position for death animation to prevent jitter
-                if hasattr(self.logic, 'fixed_draw_pos'):
-                    self.logic.fixed_draw_pos = (int(self.position[0]), int(self.position[1]))
+        # Death and hurt feedback run when the game's event bus dispatches them
+        if health <= 0:
+            self.alive = False
+        if self.game is not None:
+            x, y = self.position
+            if health <= 0:
+                self.game.events.emit(EnemyDied, x=x, y=y, type_id=self.type.type_id, enemy=self)
             else:
-                # Trigger hurt overlay without changing state
-                if hasattr(self.logic, 'hurt_overlay_timer') and hasattr(self.logic, 'hurt_overlay_duration'):
-                    self.logic.hurt_overlay_timer = self.logic.hurt_overlay_duration
+                self.game.events.emit(EnemyHit, x=x, y=y, amount=amount, enemy=self)
         
         # Don't set dead = True here, let the death animation complete first
-    def __init__(self, enemy_type, position=(0, 0)):
+    def __init__(self, enemy_type, position, world):
+        self.type = None
+        self.logic = None
+        self.game = None  # Set by EnemySpawner; gives the AI access to shared world state
+        self.world = world
+        self.entity = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(enemy_type, position)
+
+    def reset(self, enemy_type, position=(0, 0)):
+        """(Re)initialize this instance so pooled enemies can be reused."""
+        same_logic = self.type is not None and self.type.logic_cls is enemy_type.logic_cls
+        self.despawn()
         self.type = enemy_type
-        self.health = enemy_type.max_health
+        self.entity = self.world.create({
+            Position: {'x': position[0], 'y': position[1]},
+            Velocity: {},
+            Health: {'current': enemy_type.max_health, 'max': enemy_type.max_health},
+            Animation: {},
+            Faction: {'id': FACTION_ENEMY},
+            Handle: {'obj': self},
+        })
+        self._health = self._max_health = float(enemy_type.max_health)
+        self._hurt_timer = 0.0
+        self.anim_frame = 0  # Frame index of the playing clip (kept current by systems/animation.py)
         self.position = position
         self.size = enemy_type.size
-        self.rect = pygame.Rect(self.position[0] - self.size // 2, self.position[1] - self.size // 2, self.size, self.size)
+        self.rect.update(self.position[0] - self.size // 2, self.position[1] - self.size // 2, self.size, self.size)
         self.facing_angle = 0
         self.skills = {name: skill for name, skill in (enemy_type.skills or [])}
         self.speed = enemy_type.speed
         self.color = enemy_type.color
-        self.logic = enemy_type.logic_cls(self) if enemy_type.logic_cls else None
+        self.mode_damage_multiplier = 1.0
+        self.mode_speed_multiplier = 1.0
+        self.elite = False
+        # Level-of-detail bookkeeping (see systems/lod.py)
+        self.visible = False  # Set by the LOD pass when the enemy is on screen
+        self.lod_time = 0.0  # Simulated time of the last update (set by EnemyLOD.add)
+        self.lod_slot = random.randrange(1 << 16)
+        # Separation vector from the crowd steering system (systems/crowd.py)
+        self.steer = (0.0, 0.0)
+        self.alive = True  # False from the killing blow on (death animation may still play)
+        if same_logic and self.logic is not None:
+            self.logic.reset()
+        else:
+            self.logic = enemy_type.logic_cls(self) if enemy_type.logic_cls else None
         self.dead = False
-        # ...other attributes...
 
-    def update(self, dt, player):
-        if self.logic:
-            self.logic.update(dt, player)
+    def despawn(self):
+        """Remove the backing entity from the world (called before pooling)."""
+        if self.entity is not None:
+            self.world.destroy(self.entity)
+            self.entity = None
+
+    # --- ECS-backed fields (reads come from the handle's copy) ---
+    def _set(self, component, field, value):
+        archetype, row = self.world.locations[self.entity]
+        archetype.columns[component.name][field][row] = value
+
+    @property
+    def health(self):
+        return self._health
+
+    @health.setter
+    def health(self, value):
+        self._health = float(value)
+        self._set(Health, 'current', value)
+
+    @property
+    def max_health(self):
+        return self._max_health
+
+    @max_health.setter
+    def max_health(self, value):
+        self._max_health = float(value)
+        self._set(Health, 'max', value)
+
+    @property
+    def hurt_timer(self):
+        """Hurt tint countdown (hurt_feedback_system refreshes it while it runs)."""
+        return self._hurt_timer
+
+    @hurt_timer.setter
+    def hurt_timer(self, value):
+        self._hurt_timer = float(value)
+        self._set(Animation, 'hurt_timer', value)
+
+    def play(self, clip_id):
+        """Start a clip_library clip from its first frame now."""
+        archetype, row = self.world.locations[self.entity]
+        animation = archetype.columns[Animation.name]
+        animation['clip'][row] = clip_id
+        animation['start'][row] = game_clock.now()
+        animation['frame'][row] = 0
+        animation['done'][row] = 0
+        self.anim_frame = 0
+
+    def on_animation_end(self, clip_id):
+        if self.logic is not None:
+            self.logic.on_animation_end(clip_id)
+
+    def set_velocity(self, vx, vy):
+        """Set the velocity the movement system integrates every tick (px/s)."""
+        archetype, row = self.world.locations[self.entity]
+        velocity = archetype.columns[Velocity.name]
+        velocity['x'][row] = vx
+        velocity['y'][row] = vy
+
+    def teleport(self, x, y):
+        """Move instantly, bypassing velocity integration."""
+        archetype, row = self.world.locations[self.entity]
+        position = archetype.columns[Position.name]
+        position['x'][row] = x
+        position['y'][row] = y
+        self.position = (x, y)
+        self.rect.center = (int(x), int(y))
+
+    def update(self, dt, player, animate=True):
+        if self.logic is not None:
+            self.logic.update(dt, player, animate)
         # Don't automatically set dead = True here, let the logic handle it
         # after death animation completes
 
-    def draw(self, surface):
+    def draw(self, surface, offset=(0, 0)):
         # Use sprite logic if available, else fallback to debug circle
-        if self.logic and hasattr(self.logic, 'draw'):
-            self.logic.draw(surface)
+        if self.logic is not None:
+            self.logic.draw(surface, offset)
         else:
-            x, y = int(self.position[0]), int(self.position[1])
+            x, y = int(self.position[0]) + offset[0], int(self.position[1]) + offset[1]
             pygame.draw.circle(surface, (220, 40, 40), (x, y), self.size // 2)
-
-# Register the Plant enemy type using config
-plant_cfg = ENEMY_TYPE_CONFIG['Plant']
-PlantType = EnemyType(
-    name='Plant',
-    max_health=plant_cfg['max_health'],
-    size=plant_cfg['size'],
-    speed=plant_cfg['speed'],
-    color=plant_cfg['color'],
-    logic_cls=PlantEnemyLogic,
-    attack_range=plant_cfg.get('attack_range', 32),
-    attack_damage=plant_cfg.get('attack_damage', 5)
-)
@@ -0,0 +1,165 @@
+"""
+Data-driven enemy type registry.
+Loads enemy definitions from JSON, validates them and compiles flat
+per-type stat tables indexed by EnemyType.type_id.
+"""
+import importlib
+import json
+import os
+import numpy as np
+from config import ENEMY_DATA_PATH
+from entities.enemy import EnemyType
+
+# field: (accepted types, default or _REQUIRED)
+_REQUIRED = object()
+_FIELDS = {
+    'max_health': ((int, float), _REQUIRED),
+    'size': ((int,), _REQUIRED),
+    'speed': ((int, float), _REQUIRED),
+    'logic': ((str,), _REQUIRED),
+    'animations': ((dict,), _REQUIRED),
+    'sprite_dir': ((str,), _REQUIRED),
+    'color': ((list, tuple), (255, 0, 0)),
+    'attack_range': ((int, float), 32),
+    'attack_trigger_range': ((int, float), 40),
+    'attack_damage': ((int, float), 5),
+    'attack_cooldown': ((int, float), 1.0),
+    'attack_impact_frame': ((int,), 3),
+    'frame_time': ((int, float), 0.1),
+    'xp': ((int, float), 1),
+    'contact_damage': ((int, float), 0),
+}
+
+# Numeric stats compiled into the per-type tables
+TABLE_FIELDS = (
+    'max_health', 'size', 'speed', 'attack_range', 'attack_trigger_range',
+    'attack_damage', 'attack_cooldown', 'attack_impact_frame', 'frame_time', 'xp',
+    'contact_damage',
+)
+
+
+class EnemyStatTable:
+    """
+    Flat per-type stats, row = EnemyType.type_id.
+    Each field is a list for scalar lookups in per-enemy logic and a NumPy
+    array in .arrays for vectorized batch updates.
+    """
+    def __init__(self, types):
+        self.arrays = {}
+        for field in TABLE_FIELDS:
+            values = [getattr(etype, field) for etype in types]
+            setattr(self, field, values)
+            self.arrays[field] = np.asarray(values, dtype=np.float32)
+        # Per-type {state: frame count}
+        self.frame_counts = [dict(etype.frame_counts) for etype in types]
+
+    def __len__(self):
+        return len(self.frame_counts)
+
+
+class EnemyRegistry:
+    """Holds every EnemyType known to the game, in type_id order."""
+    def __init__(self):
+        self.types = []
+        self._by_name = {}
+        self.table = EnemyStatTable([])
+
+    def load(self, path):
+        """Load, validate and register every definition in a JSON file, then compile."""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: expected an object mapping enemy names to definitions")
+        for name, definition in data.items():
+            self.register(name, definition)
+        self.compile()
+        return self
+
+    def register(self, name, definition):
+        """Validate a single definition and add it as a new EnemyType."""
+        if name in self._by_name:
+            raise ValueError(f"Enemy type '{name}' is already registered")
+        fields = _validate(name, definition)
+        logic_cls = _resolve_logic(name, fields.pop('logic'))
+        animations = fields.pop('animations')
+        required = getattr(logic_cls, 'REQUIRED_ANIMATIONS', ())
+        missing = [state for state in required if state not in animations]
+        if missing:
+            raise ValueError(f"Enemy '{name}': {logic_cls.__name__} needs animations {missing}")
+        etype = EnemyType(
+            name=name,
+            logic_cls=logic_cls,
+            color=tuple(fields.pop('color')),
+            animations={state: (anim['file'], anim['frames']) for state, anim in animations.items()},
+            type_id=len(self.types),
+            **fields
+        )
+        self.types.append(etype)
+        self._by_name[name] = etype
+        return etype
+
+    def compile(self):
+        """Rebuild the stat tables and hand them to every type."""
+        self.table = EnemyStatTable(self.types)
+        for etype in self.types:
+            etype.stats = self.table
+        return self.table
+
+    def get(self, name):
+        return self._by_name.get(name)
+
+    def all(self):
+        return list(self.types)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __len__(self):
+        return len(self.types)
+
+
+def _validate(name, definition):
+    if not isinstance(definition, dict):
+        raise ValueError(f"Enemy '{name}': definition must be an object")
+    unknown = set(definition) - set(_FIELDS)
+    if unknown:
+        raise ValueError(f"Enemy '{name}': unknown fields {sorted(unknown)}")
+    fields = {}
+    for field, (types, default) in _FIELDS.items():
+        if field not in definition:
+            if default is _REQUIRED:
+                raise ValueError(f"Enemy '{name}': missing required field '{field}'")
+            fields[field] = default
+            continue
+        value = definition[field]
+        # bool is an int subclass; never accept it for numeric stats
+        if isinstance(value, bool) or not isinstance(value, types):
+            raise ValueError(f"Enemy '{name}': field '{field}' has invalid type {type(value).__name__}")
+        if isinstance(value, (int, float)) and value < 0:
+            raise ValueError(f"Enemy '{name}': field '{field}' must not be negative")
+        fields[field] = value
+    for state, anim in fields['animations'].items():
+        if (not isinstance(anim, dict) or not isinstance(anim.get('file'), str)
+                or not isinstance(anim.get('frames'), int) or anim['frames'] <= 0):
+            raise ValueError(f"Enemy '{name}': animation '{state}' needs a 'file' and a positive 'frames' count")
+    if len(fields['color']) not in (3, 4):
+        raise ValueError(f"Enemy '{name}': color must have 3 or 4 components")
+    return fields
+
+
+def _resolve_logic(name, dotted_path):
+    module_name, _, cls_name = dotted_path.rpartition('.')
+    try:
+        return getattr(importlib.import_module(module_name), cls_name)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise ValueError(f"Enemy '{name}': cannot resolve logic class '{dotted_path}': {e}")
+
+
+def load_enemy_registry(path=ENEMY_DATA_PATH):
+    """Build a registry from a data file (relative paths resolve against the project root)."""
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(__file__), '..', path)
+    return EnemyRegistry().load(path)
+
+
+ENEMY_REGISTRY = load_enemy_registry()
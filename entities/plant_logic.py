@@ -1,49 +1,95 @@
 import pygame
 import os
+from systems.ai import run_enemy_ai
+from systems.combat import resolve_combat
+from core.clock import game_clock
+from systems.animation import AnimationClip, LOOP, ONCE, clip_library
 
 
 class PlantEnemyLogic:
     """
     Handles movement, animation, and attack logic for Plant enemies.
     """
-    SPRITE_PATH = os.path.join('resources', 'images', 'enemies', 'Plant')
-    ANIMATIONS = {
-        'idle': 'Plant_Idle_full.png',
-        'walk': 'Plant_Walk_full.png',
-        'run': 'Plant_Run_full.png',
-        'death': 'Plant_Death_full.png',
-        'attack': 'Plant_Attack_full.png',
-    }
-    FRAME_COUNTS = {
-        'idle': 8,  # 256px / 8 = 32px per frame
-        'walk': 6,  # Updated: 6 frames per direction
-        'run': 8,
-        'death': 10,  # Updated: 10 frames per direction
-        'attack': 7,  # 448px / 7 = 64px per frame
-    }
-    # Class-level sprite cache
-    _sprite_cache = None
+    # Animation states this logic drives; the enemy registry checks data files provide them
+    REQUIRED_ANIMATIONS = ('walk', 'run', 'death', 'attack')
+    # Animations that repeat; the rest play once and end with a completion event
+    LOOPING_ANIMATIONS = ('idle', 'walk', 'run')
+    # Class-level sprite cache, keyed by enemy type name
+    _sprite_cache = {}
+    # clip_library ids per enemy type name: {state: clip id}
+    _clip_cache = {}
+    # Hurt-tinted copies of sprite frames, keyed by the source frame
+    _hurt_cache = {}
 
     def __init__(self, enemy):
         self.enemy = enemy
+        self.reset()
+
+    def reset(self):
+        """Reset per-life state (used when a pooled enemy is respawned)."""
+        etype = self.enemy.type
+        sprites = PlantEnemyLogic._sprite_cache.get(etype.name)
+        if sprites is None:
+            sprites = PlantEnemyLogic._sprite_cache[etype.name] = self._load_sprites(etype)
+        self.sprites = sprites
+        clips = PlantEnemyLogic._clip_cache.get(etype.name)
+        if clips is None:
+            clips = PlantEnemyLogic._clip_cache[etype.name] = self._register_clips(etype, sprites)
+        self.clips = clips
         self.state = 'idle'
-        self.anim_frame = 0
-        self.anim_timer = 0.0
-        if PlantEnemyLogic._sprite_cache is None:
-            PlantEnemyLogic._sprite_cache = self._load_sprites()
-        self.sprites = PlantEnemyLogic._sprite_cache
-        # Use attack_cooldown from type if available, else default
-        self.attack_cooldown = getattr(self.enemy.type, 'attack_cooldown', 1.0)
+        self.direction = 0
+        self._damage_dealt = False
         self.last_attack = -float('inf')
         
         # Store fixed position during hurt/death animations to prevent jitter
         self.fixed_draw_pos = None
         
-        # Hurt overlay system (instead of hurt state)
-        self.hurt_overlay_timer = 0.0
+        # Hurt overlay system (instead of hurt state); the timer lives in the
+        # enemy's Animation component and is counted down by hurt_feedback_system
         self.hurt_overlay_duration = 0.5  # 500ms red tint
 
-    def _load_sprites(self):
+    def on_hurt(self):
+        self.enemy.hurt_timer = self.hurt_overlay_duration
+
+    def on_death(self):
+        # Death overrides everything and cannot be interrupted
+        self._play('death')
+        self.enemy.set_velocity(0.0, 0.0)
+        # Fix position for death animation to prevent jitter
+        self.fixed_draw_pos = (int(self.enemy.position[0]), int(self.enemy.position[1]))
+
+    def on_animation_end(self, clip_id):
+        """Completion event from animation_system for a clip that plays once."""
+        if clip_id != self.clips.get(self.state):
+            return  # Stale event for a clip that was already replaced
+        if self.state == 'death':
+            # Death animation complete, mark for removal
+            self.enemy.dead = True
+        elif self.state == 'attack':
+            # Return to movement and start the cooldown
+            self._play(self._movement_state())
+            self._damage_dealt = False
+            self.last_attack = game_clock.now()
+
+    def _play(self, state):
+        self.state = state
+        self.enemy.play(self.clips.get(state, 0))
+
+    def _movement_state(self):
+        etype = self.enemy.type
+        speed = etype.stats.speed[etype.type_id] * self.enemy.mode_speed_multiplier
+        return 'run' if speed > 4 else 'walk'
+
+    @classmethod
+    def _register_clips(cls, etype, sprites):
+        clips = {}
+        for state, (fname, frame_count) in etype.animations.items():
+            mode = LOOP if state in cls.LOOPING_ANIMATIONS else ONCE
+            clip = AnimationClip(sprites.get(state, []), etype.frame_time, mode, count=frame_count)
+            clips[state] = clip_library.register(clip)
+        return clips
+
+    def _load_sprites(self, etype):
         sprites = {}
         directions = 4  # Down, Up, Left, Right (top to bottom in image)
         
@@ -51,12 +97,11 @@ class PlantEnemyLogic:
         STANDARD_FRAME_WIDTH = 64
         STANDARD_FRAME_HEIGHT = 64
         
-        for state, fname in self.ANIMATIONS.items():
-            path = os.path.join(self.SPRITE_PATH, fname)
+        for state, (fname, frame_count) in etype.animations.items():
+            path = os.path.join(etype.sprite_dir, fname)
             
             if os.path.exists(path):
                 img = pygame.image.load(path).convert_alpha()
-                frame_count = self.FRAME_COUNTS[state]
                 img_w, img_h = img.get_width(), img.get_height()
                 
                 if img_w % frame_count == 0 and img_h % directions == 0:
@@ -95,17 +140,21 @@ class PlantEnemyLogic:
         
         return sprites
 
-    def update(self, dt, player):
+    def update(self, dt, player, animate=True):
+        """
+        Advance movement and attack by dt.
+        Animation frames come from the enemy's clip start time (systems/animation.py),
+        so LOD-reduced updates don't change them; animate is kept for the LOD interface.
+        """
         # Movement towards player
         dx = player.position[0] - self.enemy.position[0]
         dy = player.position[1] - self.enemy.position[1]
         dist = (dx**2 + dy**2) ** 0.5
-        # Calculate speed based on distance to player
-        speed = self.enemy.type.speed
-        
+        # Per-type stats come from the registry's compiled table
+        stats = self.enemy.type.stats
+        type_id = self.enemy.type.type_id
         # Apply game mode speed multiplier
-        if hasattr(self.enemy, 'mode_speed_multiplier'):
-            speed *= self.enemy.mode_speed_multiplier
+        speed = stats.speed[type_id] * self.enemy.mode_speed_multiplier
         # Map movement to sprite row: 0=down, 1=up, 2=left, 3=right
         if abs(dx) > abs(dy):
             if dx > 0:
@@ -118,129 +167,90 @@ class PlantEnemyLogic:
             else:
                 direction = 1  # up
         self.direction = direction
-        now = pygame.time.get_ticks() / 1000
-        attack_trigger_range = 40
-        attack_damage_range = 25
-        attack_frames = self.FRAME_COUNTS['attack']
-        impact_frame = attack_frames // 2
-
-        # Check for death first - death overrides everything
-        if self.enemy.health <= 0 and self.state != 'death':
-            self.state = 'death'
-            self.anim_frame = 0
-            self.anim_timer = 0.0
-            # Fix position for death animation to prevent jitter
-            self.fixed_draw_pos = (int(self.enemy.position[0]), int(self.enemy.position[1]))
-
-        # Handle death animation - cannot be interrupted
+        now = game_clock.now()
+        attack_trigger_range = stats.attack_trigger_range[type_id]
+        attack_damage_range = stats.attack_range[type_id]
+        impact_frame = stats.attack_impact_frame[type_id]
+
+        # Death animation cannot be interrupted; its completion event marks the enemy dead
         if self.state == 'death':
-            self.anim_timer += dt
-            if self.anim_timer > 0.1:
-                self.anim_frame += 1
-                self.anim_timer = 0.0
-                if self.anim_frame >= self.FRAME_COUNTS['death']:
-                    # Death animation complete, mark for removal
-                    self.enemy.dead = True
             return  # Don't process any other logic during death
 
-        # Update hurt overlay timer
-        if self.hurt_overlay_timer > 0:
-            self.hurt_overlay_timer -= dt
-
-        # Normal movement and attack logic - only when not hurt or dead
-        prev_state = self.state
-        # Always move toward player unless dead or hurt
+        # Always move toward player unless dead (flow field + crowd separation)
         min_dist = attack_damage_range
-        if dist > min_dist:
-            move_x = dx / dist
-            move_y = dy / dist
-            self.enemy.position = (
-                self.enemy.position[0] + move_x * speed * dt,
-                self.enemy.position[1] + move_y * speed * dt
-            )
-            self.enemy.rect.center = (int(self.enemy.position[0]), int(self.enemy.position[1]))
+        if self.enemy.game is not None:
+            move_x, move_y = run_enemy_ai(self.enemy, self.enemy.game, min_dist)
+        elif dist > min_dist:
+            move_x, move_y = dx / dist, dy / dist
+        else:
+            move_x = move_y = 0.0
+        # Velocity is integrated by the ECS movement system (systems/movement.py)
+        self.enemy.set_velocity(move_x * speed, move_y * speed)
         
-        # Set movement state unless attacking
+        # Set movement state unless attacking (the clip restarts only on a state change)
         if self.state != 'attack':
             new_state = 'run' if speed > 4 else 'walk'
             if self.state != new_state:
-                self.state = new_state
-        
-        # Only reset animation if state actually changed
-        if self.state != prev_state:
-            self.anim_frame = 0
-            self.anim_timer = 0.0
+                self._play(new_state)
 
         # Attack logic
         if self.state == 'attack':
-            # On impact frame, deal damage if player is in range and not already hit
-            impact_frame = 3
-            if self.anim_frame == impact_frame and not getattr(self, '_damage_dealt', False):
+            # On impact frame, deal damage if player is in range and not already hit;
+            # the attack clip's completion event returns to movement
+            if self.enemy.anim_frame >= impact_frame and not self._damage_dealt:
                 if dist < attack_damage_range:
-                    # Calculate damage with mode multiplier
-                    base_damage = 5
-                    mode_multiplier = getattr(self.enemy, 'mode_damage_multiplier', 1.0)
-                    final_damage = int(base_damage * mode_multiplier)
-                    player.take_damage(final_damage, source=self.enemy)
+                    resolve_combat(self.enemy, player, stats.attack_damage[type_id])
                 self._damage_dealt = True
-            # After animation, return to movement and set cooldown
-            if self.anim_frame >= attack_frames - 1:
-                self.state = 'run' if speed > 4 else 'walk'
-                self._damage_dealt = False
-                self.last_attack = now
-                self.anim_frame = 0
-                self.anim_timer = 0.0
-        elif self.state != 'attack' and dist < attack_trigger_range and (now - self.last_attack > self.attack_cooldown):
+        elif dist < attack_trigger_range and (now - self.last_attack > stats.attack_cooldown[type_id]):
             # Start attack animation
-            self.state = 'attack'
-            self.anim_frame = 0
-            self.anim_timer = 0.0
+            self._play('attack')
             self._damage_dealt = False
-        
-        # Animation update for normal states (walk/run/attack)
-        if self.state in ['walk', 'run', 'attack']:
-            self.anim_timer += dt
-            frames = self.FRAME_COUNTS[self.state]
-            if self.anim_timer > 0.1:
-                if self.state == 'attack':
-                    # Attack animation doesn't loop
-                    if self.anim_frame < frames - 1:
-                        self.anim_frame += 1
-                else:
-                    # Movement animations loop
-                    self.anim_frame = (self.anim_frame + 1) % frames
-                self.anim_timer = 0.0
-
-    def draw(self, surface):
-        # Use direction-aware sprites
-        state_sprites = self.sprites.get(self.state, [[] for _ in range(4)])
-        direction = getattr(self, 'direction', 0)
-        frame_list = state_sprites[direction] if direction < len(state_sprites) else []
-        
-        if frame_list:
-            frame_idx = min(self.anim_frame, len(frame_list) - 1)
-            frame = frame_list[frame_idx]
-            
-            # Use fixed position during death animations to prevent jitter
-            if self.fixed_draw_pos is not None:
-                enemy_center_x, enemy_center_y = self.fixed_draw_pos
-            else:
-                enemy_center_x = int(self.enemy.position[0])
-                enemy_center_y = int(self.enemy.position[1])
-            
-            # Since all frames are now 64x64 and bottom-aligned, positioning is consistent
-            rect = frame.get_rect()
-            rect.centerx = enemy_center_x
-            rect.bottom = enemy_center_y + (self.enemy.size // 2)
-            
-            # Apply hurt overlay if active
-            if self.hurt_overlay_timer > 0:
-                # Create a red-tinted version of the frame
-                hurt_frame = frame.copy()
-                # Create red overlay surface
-                red_overlay = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
-                red_overlay.fill((255, 100, 100, 128))  # Red with transparency
-                hurt_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                surface.blit(hurt_frame, rect)
-            else:
-                surface.blit(frame, rect)
+
+    def current_frame(self, hurt_tint=True):
+        """Return the sprite to draw this frame (hurt-tinted if needed), or None."""
+        state_sprites = self.sprites.get(self.state)
+        if not state_sprites or self.direction >= len(state_sprites):
+            return None
+        frame_list = state_sprites[self.direction]
+        if not frame_list:
+            return None
+        frame = frame_list[min(self.enemy.anim_frame, len(frame_list) - 1)]
+        # Apply hurt overlay if active
+        if hurt_tint and self.enemy.hurt_timer > 0:
+            return self._hurt_frame(frame)
+        return frame
+
+    def draw_anchor(self):
+        """(center x, center y, size) the sprite is bottom-aligned to."""
+        # Use fixed position during death animations to prevent jitter
+        if self.fixed_draw_pos is not None:
+            x, y = self.fixed_draw_pos
+        else:
+            x, y = self.enemy.position
+        return (int(x), int(y), self.enemy.size)
+
+    @staticmethod
+    def _hurt_frame(frame):
+        # Red-tinted frames are built once per source frame and cached
+        tinted = PlantEnemyLogic._hurt_cache.get(frame)
+        if tinted is None:
+            tinted = frame.copy()
+            # Create red overlay surface
+            red_overlay = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
+            red_overlay.fill((255, 100, 100, 128))  # Red with transparency
+            tinted.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            PlantEnemyLogic._hurt_cache[frame] = tinted
+        return tinted
+
+    def draw(self, surface, offset=(0, 0)):
+        frame = self.current_frame()
+        if frame is None:
+            return
+        x, y, size = self.draw_anchor()
+        x += offset[0]
+        y += offset[1]
+        # Since all frames are now 64x64 and bottom-aligned, positioning is consistent
+        rect = frame.get_rect()
+        rect.centerx = x
+        rect.bottom = y + size // 2
+        surface.blit(frame, rect)
@@ -3,25 +3,30 @@ Player entity and logic.
 """
 
 import pygame
+from collections import deque
 from config import (
-    WINDOW_WIDTH, WINDOW_HEIGHT,
+    WORLD_WIDTH, WORLD_HEIGHT,
     PLAYER_START_HEALTH, PLAYER_START_BARRIER, PLAYER_BARRIER_DECAY_PERCENT_PER_SEC, PLAYER_BARRIER_REGEN,
-    PLAYER_START_EXP, PLAYER_EXP_TO_NEXT_LEVEL_MULT, PLAYER_START_LEVEL, PLAYER_SIZE, PLAYER_MOVEMENT_SPEED,
+    PLAYER_START_EXP, PLAYER_EXP_FIRST_LEVEL, PLAYER_EXP_TO_NEXT_LEVEL_MULT, PLAYER_START_LEVEL, PLAYER_SIZE, PLAYER_MOVEMENT_SPEED,
     PLAYER_DAMAGE_REDUCTION, PLAYER_COOLDOWN, PLAYER_ATTACK_SPEED, PLAYER_CRIT_CHANCE, PLAYER_CRIT_DAMAGE,
-    PLAYER_START_SKILL_POINTS, PLAYER_PASSIVE_SKILLS, PLAYER_ACTIVE_SKILLS
+    PLAYER_START_SKILL_POINTS, PLAYER_PASSIVE_SKILLS, PLAYER_ACTIVE_SKILLS,
+    DAMAGE_LOG_MAX_ENTRIES, RECENT_DAMAGE_MAX_ENTRIES
 )
 
 
 
 from skills.registry import get_skill
+from skills.book import SkillBook
+from systems.animation import Animator
+from rendering.player_render import player_clips
+from core.clock import game_clock
+from core.events import PlayerHit, PlayerLeveledUp
 
 
 class Player:
 
     def update(self, dt):
         # Barrier decay (float, smooth)
-        if not hasattr(self, '_barrier_decay_accum'):
-            self._barrier_decay_accum = 0.0
         if self.barrier > 0:
             decay = self.barrier * (self.barrier_decay_percent_per_sec / 100) * dt
             self._barrier_decay_accum += decay
@@ -39,9 +44,9 @@ class Player:
 
 
     def __init__(self):
-        # Start in the middle of the game window
-        self.x = WINDOW_WIDTH // 2
-        self.y = WINDOW_HEIGHT // 2
+        # Start in the middle of the world
+        self.x = WORLD_WIDTH // 2
+        self.y = WORLD_HEIGHT // 2
         self.size = PLAYER_SIZE
         self.rect = pygame.Rect(self.x - self.size // 2, self.y - self.size // 2, self.size, self.size)
         self.facing_angle = 0  # Degrees, 0 = right
@@ -50,11 +55,11 @@ class Player:
         self.passive_skills = PLAYER_PASSIVE_SKILLS.copy()
         self.active_skills = PLAYER_ACTIVE_SKILLS.copy()
         # Skills system
-        self.skills = {}
+        self.skills = SkillBook()
         for skill_name in self.active_skills:
-            skill_cls = get_skill(skill_name)
-            if skill_cls:
-                self.skills[skill_name] = skill_cls(self)
+            skill_def = get_skill(skill_name)
+            if skill_def:
+                self.skills.add(skill_def(self))
 
         self.health = PLAYER_START_HEALTH
         self.max_health = PLAYER_START_HEALTH  # Add max_health attribute
@@ -62,8 +67,10 @@ class Player:
         self.barrier_decay_percent_per_sec = PLAYER_BARRIER_DECAY_PERCENT_PER_SEC
         self.barrier_regen = PLAYER_BARRIER_REGEN
         self.exp = PLAYER_START_EXP
+        self.exp_to_next_level = PLAYER_EXP_FIRST_LEVEL
         self.exp_to_next_level_mult = PLAYER_EXP_TO_NEXT_LEVEL_MULT
         self.level = PLAYER_START_LEVEL
+        self.gold = 0
         self.movement_speed = PLAYER_MOVEMENT_SPEED
         self.buffs = []  # List of current temporary positive effects
         self.debuffs = []  # List of current temporary negative effects
@@ -73,19 +80,29 @@ class Player:
         self.attack_speed = PLAYER_ATTACK_SPEED
         self.crit_chance = PLAYER_CRIT_CHANCE
         self.crit_damage = PLAYER_CRIT_DAMAGE
+        self.base_damage = 10
+        # Game mode multipliers (set by Game._apply_mode_modifiers)
+        self.mode_damage_multiplier = 1.0
+        self.mode_speed_multiplier = 1.0
+        self._barrier_decay_accum = 0.0
 
         # For compatibility with old code
         self.position = [self.x, self.y]  # Make this a mutable list
-        self.damage_log = []
-        self.recent_damage = []
+        # Bounded: an unbounded history grows for the whole session
+        self.damage_log = deque(maxlen=DAMAGE_LOG_MAX_ENTRIES)
+        self.damage_taken = 0  # Running total (balance sims read this)
+        self.recent_damage = deque(maxlen=RECENT_DAMAGE_MAX_ENTRIES)
         # Track last nonzero movement vector for dash direction
         self.last_move = (1, 0)
 
 
         # Animation state
         self.anim_state = self.ANIM_IDLE
-        self.anim_timer = 0.0  # Time since animation started
         self.anim_lock = False  # If True, animation cannot be interrupted
+        # Plays the hurt clips on the game clock; the renderer raises the completion event
+        self.animator = Animator(player_clips, on_complete=self._on_animation_end)
+        # Game event bus for PlayerHit (set by the Game)
+        self.events = None
 
         # Settings checkboxes (auto aim, auto attack) - sync with menu if possible
         try:
@@ -104,6 +121,37 @@ class Player:
             ]
 
 
+    def _play_locked(self, state):
+        """Start a non-interruptible animation (hurt)."""
+        self.anim_state = state
+        self.anim_lock = True
+        self.animator.play(state, game_clock.now())
+
+    def gain_exp(self, amount):
+        """Add experience, levelling up (one skill point each) as often as it covers. Returns levels gained."""
+        self.exp += amount
+        gained = 0
+        while self.exp >= self.exp_to_next_level:
+            self.exp -= self.exp_to_next_level
+            self.exp_to_next_level *= self.exp_to_next_level_mult
+            self.level += 1
+            self.skill_points += 1
+            gained += 1
+            if self.events is not None:
+                self.events.emit(PlayerLeveledUp, level=self.level)
+        return gained
+
+    def on_hits(self, batch):
+        """PlayerHit listener: the first hit of the tick starts the hurt animation."""
+        if self.anim_lock:
+            return
+        self._play_locked(self.ANIM_HURT_BARRIER if batch.absorbed[0] > 0 else self.ANIM_HURT_HP)
+
+    def _on_animation_end(self, state):
+        self.anim_lock = False
+        self.anim_state = self.ANIM_IDLE
+        self.animator.stop()
+
     def take_damage(self, amount, source=None, barrier_damage=False):
         # Barrier absorbs damage first unless barrier_damage is True
         damage_to_health = amount
@@ -111,16 +159,13 @@ class Player:
             absorbed = min(self.barrier, amount)
             self.barrier -= absorbed
             damage_to_health -= absorbed
-            if absorbed > 0 and not self.anim_lock:
-                self.anim_state = self.ANIM_HURT_BARRIER
-                self.anim_timer = 0.0
-                self.anim_lock = True
+        else:
+            absorbed = 0
         if damage_to_health > 0:
-            if not self.anim_lock:
-                self.anim_state = self.ANIM_HURT_HP
-                self.anim_timer = 0.0
-                self.anim_lock = True
             self.health -= damage_to_health
+        if amount > 0 and self.events is not None:
+            self.events.emit(PlayerHit, amount=amount, absorbed=absorbed, source=source)
+        self.damage_taken += amount
         self.damage_log.append((amount, source))
         self.recent_damage.append((amount, source))
         # ...handle death, clear recent_damage, etc...
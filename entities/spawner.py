@@ -1,51 +1,60 @@
+import random
+from config import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, ENEMY_SPAWN_VIEW_MARGIN, ENEMY_SPAWN_TRIES,
+    SPAWNER_ELITE_BASE_CHANCE, SPAWNER_ELITE_HEALTH_MULTIPLIER, SPAWNER_ELITE_DAMAGE_MULTIPLIER
+)
+from entities.enemy import EnemyType, Enemy
+from entities.enemy_registry import ENEMY_REGISTRY
+from entities.wave_director import WaveDirector
+from core.ecs import World
+from core.events import EnemySpawned
 
 
-import random
-import time
-from config import SPAWNER_DEFAULT_INTERVAL, SPAWNER_ENEMY_WEIGHTS, SPAWNER_TIME_WEIGHT_EVENTS, WINDOW_WIDTH, WINDOW_HEIGHT
-from entities.enemy import PlantType, EnemyType, Enemy
+class EnemyPool:
+    """Free list of dead Enemy instances, reused instead of reallocated."""
+    def __init__(self):
+        self._free = []
+
+    def acquire(self, enemy_type, position, world):
+        if self._free:
+            enemy = self._free.pop()
+            enemy.world = world
+            enemy.reset(enemy_type, position)
+            return enemy
+        return Enemy(enemy_type, position, world)
+
+    def release(self, enemy):
+        enemy.despawn()
+        self._free.append(enemy)
+
+    def __len__(self):
+        return len(self._free)
 
 
 class EnemySpawner:
-    def __init__(self, enemy_types, get_game_time_fn=None, screen=None, game=None):
+    def __init__(self, enemy_types=None, get_game_time_fn=None, screen=None, game=None):
         """
-        enemy_types: list of EnemyType
+        enemy_types: list of EnemyType (defaults to every registered type)
         get_game_time_fn: function returning current run time in seconds (optional)
         screen: pygame display surface (optional, for dynamic size)
         game: Game instance (for mode multipliers)
         """
-        self.enemy_types = enemy_types
+        self.enemy_types = enemy_types if enemy_types is not None else ENEMY_REGISTRY.all()
         self.get_game_time = get_game_time_fn or (lambda: 0)
-        self.last_spawn_time = 0
-        self.spawn_interval = SPAWNER_DEFAULT_INTERVAL
         self.screen = screen
         self.game = game  # Store game instance for mode multipliers
+        # Enemies live in the game's ECS world (a private one when running without a game)
+        self.world = game.state.world if game is not None else World()
+        self.director = WaveDirector(self.enemy_types)
+        self.pool = EnemyPool()
 
     def choose_enemy_type(self):
-        t = self.get_game_time()
-        weights = []
-        for etype in self.enemy_types:
-            weight = SPAWNER_ENEMY_WEIGHTS.get(etype.name, 1.0)
-            for event in SPAWNER_TIME_WEIGHT_EVENTS:
-                enemy_name, time_threshold, multiplier = event
-                if etype.name == enemy_name and t > time_threshold:
-                    weight *= multiplier
-            weights.append(weight)
-        total = sum(weights)
-        r = random.uniform(0, total)
-        upto = 0
-        for etype, w in zip(self.enemy_types, weights):
-            if upto + w >= r:
-                return etype
-            upto += w
-        return self.enemy_types[0]  # fallback
-
-    def can_spawn(self):
-        now = time.time()
-        return (now - self.last_spawn_time) >= self.spawn_interval
-
+        return self.director.weight_table_at(self.get_game_time()).sample()
 
     def random_edge_position(self):
+        # Spawn just outside the camera view when the game has a camera
+        if self.game is not None:
+            return self._view_edge_position(self.game.camera)
         # Use actual window size if screen is available
         if self.screen:
             width, height = self.screen.get_width(), self.screen.get_height()
@@ -61,20 +70,69 @@ class EnemySpawner:
         else:
             return (width, random.randint(0, height))
 
-    def spawn_if_ready(self):
-        if not self.can_spawn():
-            return None
-        etype = self.choose_enemy_type()
-        self.last_spawn_time = time.time()
-        pos = self.random_edge_position()
-        enemy = Enemy(etype, position=pos)
-        
-        # Apply game mode multipliers if game instance is available
-        if self.game and hasattr(self.game, 'mode_config'):
-            self._apply_mode_multipliers(enemy)
-        
-        return enemy
-    
+    def _view_edge_position(self, camera):
+        view = camera.rect.inflate(ENEMY_SPAWN_VIEW_MARGIN * 2, ENEMY_SPAWN_VIEW_MARGIN * 2)
+        tiles = getattr(self.game, 'tiles', None)
+        for _ in range(ENEMY_SPAWN_TRIES):
+            edge = random.choice(['top', 'bottom', 'left', 'right'])
+            if edge == 'top':
+                pos = (random.randint(view.left, view.right), view.top)
+            elif edge == 'bottom':
+                pos = (random.randint(view.left, view.right), view.bottom)
+            elif edge == 'left':
+                pos = (view.left, random.randint(view.top, view.bottom))
+            else:
+                pos = (view.right, random.randint(view.top, view.bottom))
+            # Near the world border the view edge may lie outside; pull it back in
+            pos = camera.clamp_point(pos[0], pos[1])
+            # Pick again if it landed on rock (the last try is kept; movement lets it walk out)
+            if tiles is None or not tiles.blocked(pos[0], pos[1]):
+                break
+        return pos
+
+    def spawn_tick(self, dt, limit=None):
+        """Advance the wave director by dt and return the enemies spawned this tick (at most limit)."""
+        t = self.get_game_time()
+        table = self.director.weight_table_at(t)
+        if not table:
+            # No enemy types to choose from: leave the director's budget untouched
+            return []
+        rate_multiplier, elite_multiplier = self._get_rate_multipliers()
+        # Spawns held back by limit stay in the director's backlog
+        count = self.director.plan(t, dt, rate_multiplier, limit)
+        if not count:
+            return []
+        elite_chance = SPAWNER_ELITE_BASE_CHANCE * elite_multiplier
+        apply_mode = self.game is not None and hasattr(self.game, 'mode_config')
+        spawned = []
+        for _ in range(count):
+            enemy = self.pool.acquire(table.sample(), self.random_edge_position(), self.world)
+            enemy.game = self.game
+            # Apply game mode multipliers if game instance is available
+            if apply_mode:
+                self._apply_mode_multipliers(enemy)
+            if random.random() < elite_chance:
+                self._make_elite(enemy)
+            if self.game is not None:
+                x, y = enemy.position
+                self.game.events.emit(EnemySpawned, x=x, y=y, type_id=enemy.type.type_id, enemy=enemy)
+            spawned.append(enemy)
+        return spawned
+
+    def release(self, enemy):
+        """Return a dead enemy to the pool."""
+        self.pool.release(enemy)
+
+    def schedule_surge(self, count, at_time=None):
+        """Script a burst of enemies (spread over ticks by the director)."""
+        self.director.schedule_surge(count, at_time)
+
+    def _get_rate_multipliers(self):
+        """Return (spawn_rate_multiplier, elite_spawn_rate) from mode and events."""
+        if self.game and hasattr(self.game, 'get_enemy_spawn_rate_multiplier'):
+            return self.game.get_enemy_spawn_rate_multiplier()
+        return 1.0, 1.0
+
     def _apply_mode_multipliers(self, enemy):
         """Apply game mode multipliers to a spawned enemy"""
         config = self.game.mode_config
@@ -87,13 +145,15 @@ class EnemySpawner:
         # Store multipliers for damage and speed (applied during gameplay)
         enemy.mode_damage_multiplier = config['enemy_damage_multiplier']
         enemy.mode_speed_multiplier = config['enemy_speed_multiplier']
-        
-        # Apply speed multiplier to the enemy's type speed
-        if hasattr(enemy, 'logic') and enemy.logic:
-            # Speed will be applied in the logic update methods
-            pass
+
+    def _make_elite(self, enemy):
+        """Promote a freshly spawned enemy to an elite."""
+        enemy.elite = True
+        enemy.health = int(enemy.health * SPAWNER_ELITE_HEALTH_MULTIPLIER)
+        enemy.max_health = enemy.health
+        enemy.mode_damage_multiplier *= SPAWNER_ELITE_DAMAGE_MULTIPLIER
 
 # Example usage:
-# from entities.enemy import PlantType
-# spawner = EnemySpawner([PlantType])
-# enemy = spawner.spawn((x, y))
+# from entities.enemy_registry import ENEMY_REGISTRY
+# spawner = EnemySpawner([ENEMY_REGISTRY.get('Plant')])
+# new_enemies = spawner.spawn_tick(dt)
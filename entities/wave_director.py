@@ -0,0 +1,137 @@
+"""
+Wave director: time-indexed spawn curves, scripted surges and
+precomputed per-segment enemy weight tables.
+"""
+import bisect
+import random
+from config import (
+    SPAWNER_DEFAULT_INTERVAL, SPAWNER_ENEMY_WEIGHTS, SPAWNER_TIME_WEIGHT_EVENTS,
+    SPAWNER_WAVE_CURVE, SPAWNER_SURGES, SPAWNER_MAX_SPAWNS_PER_TICK
+)
+
+
+class AliasTable:
+    """
+    Weighted sampler using Vose's alias method.
+    Built once in O(n), every sample afterwards is O(1). An empty table
+    samples None.
+    """
+    def __init__(self, items, weights):
+        self.items = list(items)
+        n = len(self.items)
+        total = float(sum(weights))
+        if total <= 0:
+            # Degenerate weights: fall back to uniform sampling
+            weights = [1.0] * n
+            total = float(max(n, 1))
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # Leftovers are 1.0 up to float error
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self):
+        return len(self.items)
+
+    def sample(self, rng=random):
+        if not self.items:
+            return None
+        i = int(rng.random() * len(self.items))
+        if rng.random() < self.prob[i]:
+            return self.items[i]
+        return self.items[self.alias[i]]
+
+
+class WaveDirector:
+    """
+    Decides how many enemies to spawn each tick and which types.
+
+    The spawn rate follows a piecewise-linear curve over run time, scripted
+    surges are queued into a backlog that drains at most max_per_tick enemies
+    per tick, and enemy type weights are precomputed for every time segment
+    between SPAWNER_TIME_WEIGHT_EVENTS thresholds.
+    """
+    def __init__(self, enemy_types, curve=None, surges=None, max_per_tick=SPAWNER_MAX_SPAWNS_PER_TICK):
+        self.enemy_types = list(enemy_types)
+        curve = sorted(curve or SPAWNER_WAVE_CURVE or [(0, 1.0 / SPAWNER_DEFAULT_INTERVAL)])
+        self._curve_times = [t for t, _ in curve]
+        self._curve_rates = [r for _, r in curve]
+        self._surges = sorted(surges if surges is not None else SPAWNER_SURGES)
+        self.max_per_tick = max_per_tick
+        self.spawn_budget = 0.0  # Fractional spawns carried between ticks
+        self.backlog = 0  # Surge enemies waiting for a free tick
+        self._segment_starts, self._segment_tables = self._build_weight_tables()
+
+    def _build_weight_tables(self):
+        """Build one AliasTable per time segment between weight events."""
+        thresholds = sorted({threshold for _, threshold, _ in SPAWNER_TIME_WEIGHT_EVENTS})
+        tables = []
+        # Segment i covers times after i thresholds have been passed
+        for i in range(len(thresholds) + 1):
+            passed = set(thresholds[:i])
+            weights = []
+            for etype in self.enemy_types:
+                weight = SPAWNER_ENEMY_WEIGHTS.get(etype.name, 1.0)
+                for enemy_name, time_threshold, multiplier in SPAWNER_TIME_WEIGHT_EVENTS:
+                    if etype.name == enemy_name and time_threshold in passed:
+                        weight *= multiplier
+                weights.append(weight)
+            tables.append(AliasTable(self.enemy_types, weights))
+        return thresholds, tables
+
+    def weight_table_at(self, t):
+        """Return the precomputed AliasTable for run time t."""
+        # Thresholds are exclusive (t must be strictly greater), hence bisect_left
+        return self._segment_tables[bisect.bisect_left(self._segment_starts, t)]
+
+    def spawn_rate_at(self, t):
+        """Spawns per second at run time t (linear between curve points)."""
+        times, rates = self._curve_times, self._curve_rates
+        i = bisect.bisect_right(times, t)
+        if i == 0:
+            return rates[0]
+        if i == len(times):
+            return rates[-1]
+        t0, t1 = times[i - 1], times[i]
+        r0, r1 = rates[i - 1], rates[i]
+        return r0 + (r1 - r0) * (t - t0) / (t1 - t0)
+
+    def schedule_surge(self, count, at_time=None):
+        """Queue a burst of count enemies, immediately or at a given run time."""
+        if at_time is None:
+            self.backlog += count
+        else:
+            bisect.insort(self._surges, (at_time, count))
+
+    def plan(self, t, dt, rate_multiplier=1.0, limit=None):
+        """
+        Return the number of enemies to spawn this tick: at most max_per_tick,
+        and at most limit (e.g. room under an enemy cap). Whatever is due but
+        not returned stays in the backlog for later ticks.
+        """
+        self.spawn_budget += self.spawn_rate_at(t) * rate_multiplier * dt
+        count = int(self.spawn_budget)
+        self.spawn_budget -= count
+        while self._surges and self._surges[0][0] <= t:
+            self.backlog += self._surges.pop(0)[1]
+        count += self.backlog
+        allowed = self.max_per_tick if limit is None else min(self.max_per_tick, max(0, limit))
+        if count > allowed:
+            self.backlog = count - allowed
+            count = allowed
+        else:
+            self.backlog = 0
+        return count
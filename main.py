@@ -1,22 +1,40 @@
-
-import pygame
-from core.init import init_pygame
-from rendering.menu import Menu
-from core.game import Game
-from core.game_loop_clean import run_game
+import sys
+from core.startup import startup
 
 def main():
-    screen = init_pygame()
+    show_report = '--startup-report' in sys.argv[1:]
+
+    # Only what the menu needs is loaded before the first frame; gameplay
+    # modules are imported when a game starts and audio once the menu is up
+    with startup.phase('import pygame'):
+        import pygame
+    with startup.phase('import menu'):
+        from core.init import init_pygame, init_audio
+        from core.scenes import SceneManager
+        from rendering.menu import get_menu, MainMenuScene
+    with startup.phase('display init'):
+        screen = init_pygame()
+
+    def on_first_frame():
+        startup.mark('first menu frame')
+        with startup.phase('audio init'):
+            init_audio()
+        if show_report:
+            startup.print_report()
 
     def start_game(slot, mode):
-        run_game(screen, slot, mode)
+        with startup.phase('import gameplay'):
+            from core.game_loop_clean import GameplayScene
+        if show_report:
+            startup.print_report()
+        return GameplayScene(screen, slot, mode)
 
-    while True:
-        menu = Menu(screen, start_game_callback=start_game)
-        menu.run()  # Handles menu loop and transitions
-        # If the user closed the window or chose Quit, pygame.get_init() will be False
-        if not pygame.get_init():
-            break
+    # Scenes are built once and pushed/popped on one shared loop
+    with startup.phase('menu init'):
+        scenes = SceneManager(screen)
+        scenes.push(MainMenuScene(get_menu(screen), start_game))
+    scenes.run(on_first_frame=on_first_frame)
+    pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
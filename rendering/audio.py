@@ -1,10 +1,181 @@
 """
 Audio playback logic.
+Sound effects are preloaded into a bank and played through fixed channel
+groups. Requests made during a tick are coalesced and flushed once per tick
+by AudioManager.update, with a per-sound voice cap and priority stealing so
+bursts of identical hits cannot exhaust the mixer.
 """
-def play_sound(sound_id):
-    # Play a sound effect
-    pass
+import io
+import threading
+import pygame
+from config import (
+    SFX_VOLUME, MUSIC_VOLUME, SFX_SOUNDS, AUDIO_CHANNEL_GROUPS, AUDIO_MAX_VOICES_PER_SOUND, AUDIO_FREE_CHANNELS
+)
+from rendering.menu import resource_path
 
-def play_music(track_id):
-    # Play background music
-    pass
+
+class AudioManager:
+    """Owns the SFX bank, channel groups and background music loading."""
+    def __init__(self, sounds=SFX_SOUNDS, channel_groups=AUDIO_CHANNEL_GROUPS,
+                 max_voices=AUDIO_MAX_VOICES_PER_SOUND, sfx_volume=SFX_VOLUME, music_volume=MUSIC_VOLUME):
+        self.enabled = False
+        self.sounds = sounds
+        self.channel_groups = channel_groups
+        self.max_voices = max_voices
+        self.sfx_volume = sfx_volume
+        self.music_volume = music_volume
+        self.bank = {}
+        self.groups = {}
+        # (sound_id) -> list of active voices [channel, priority, start tick]
+        self.voices = {}
+        # Requests queued this tick: sound_id -> [group, priority, volume]
+        self._pending = {}
+        self._tick = 0
+        self._music_thread = None
+        self.dropped = 0  # Requests rejected by voice limiting (stats)
+        if pygame.mixer.get_init() is not None:
+            self.start()
+
+    def start(self):
+        """Reserve channels and preload the bank once the mixer is up (startup defers it past the menu)."""
+        if self.enabled:
+            return
+        if pygame.mixer.get_init() is None:
+            print("[AUDIO] Mixer not initialized, audio disabled")
+            return
+        self.enabled = True
+        self._reserve_channels(self.channel_groups)
+        self.preload(self.sounds)
+        pygame.mixer.music.set_volume(self.music_volume)
+
+    def _reserve_channels(self, channel_groups, free=AUDIO_FREE_CHANNELS):
+        total = sum(channel_groups.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total + free))
+        # Keep find_channel() (used by stray Sound.play calls) off the grouped channels;
+        # the channels above them stay free for it
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for name, count in channel_groups.items():
+            self.groups[name] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+
+    def preload(self, sounds):
+        for sound_id, path in sounds.items():
+            try:
+                self.bank[sound_id] = pygame.mixer.Sound(resource_path(path))
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"[AUDIO] Could not load '{sound_id}' from {path}: {e}")
+
+    def play(self, sound_id, group='sfx', priority=0, volume=1.0):
+        """
+        Request a sound for this tick. Repeated requests for the same sound
+        before update() collapse into one voice at the highest priority.
+        """
+        if not self.enabled or sound_id not in self.bank:
+            return
+        pending = self._pending.get(sound_id)
+        if pending is None:
+            self._pending[sound_id] = [group, priority, volume]
+        else:
+            pending[1] = max(pending[1], priority)
+            pending[2] = max(pending[2], volume)
+
+    def update(self):
+        """Start the voices requested since the last update (call once per tick)."""
+        self._tick += 1
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = {}
+        # Higher priority requests claim channels first
+        for sound_id, (group, priority, volume) in sorted(pending.items(), key=lambda item: -item[1][1]):
+            self._start(sound_id, group, priority, volume)
+
+    def _start(self, sound_id, group, priority, volume):
+        sound = self.bank[sound_id]
+        voices = [v for v in self.voices.get(sound_id, ()) if v[0].get_sound() is sound]
+        self.voices[sound_id] = voices
+        channel = None
+        if len(voices) >= self.max_voices:
+            # At the per-sound cap: restart the oldest voice if we outrank it
+            victim = min(voices, key=lambda v: (v[1], v[2]))
+            if victim[1] > priority:
+                self.dropped += 1
+                return
+            voices.remove(victim)
+            channel = victim[0]
+        if channel is None:
+            channel = self._free_channel(group, priority)
+            if channel is None:
+                self.dropped += 1
+                return
+        channel.set_volume(self.sfx_volume * volume)
+        channel.play(sound)
+        voices.append([channel, priority, self._tick])
+
+    def _free_channel(self, group, priority):
+        channels = self.groups.get(group) or self.groups.get('sfx', [])
+        for channel in channels:
+            if not channel.get_busy():
+                return channel
+        # Group full: steal the lowest priority, oldest voice we outrank
+        best = None
+        for voices in self.voices.values():
+            for voice in voices:
+                if voice[0] in channels and voice[1] <= priority:
+                    if best is None or (voice[1], voice[2]) < (best[1], best[2]):
+                        best = voice
+        if best is None:
+            return None
+        for voices in self.voices.values():
+            if best in voices:
+                voices.remove(best)
+                break
+        best[0].stop()
+        return best[0]
+
+    def set_sfx_volume(self, volume):
+        self.sfx_volume = volume
+
+    def set_music_volume(self, volume):
+        self.music_volume = volume
+        if self.enabled:
+            pygame.mixer.music.set_volume(volume)
+
+    def play_music(self, path, loops=-1):
+        """Read and start a music track on a background thread so startup is not blocked."""
+        if not self.enabled:
+            return
+        self._music_thread = threading.Thread(target=self._load_music, args=(path, loops), daemon=True)
+        self._music_thread.start()
+
+    def _load_music(self, path, loops):
+        try:
+            with open(resource_path(path), 'rb') as f:
+                data = io.BytesIO(f.read())
+            pygame.mixer.music.load(data)
+            pygame.mixer.music.set_volume(self.music_volume)
+            pygame.mixer.music.play(loops)
+        except (OSError, pygame.error) as e:
+            print(f"[AUDIO] Could not play music {path}: {e}")
+
+
+_audio = None
+
+
+def get_audio():
+    """Return the shared AudioManager, creating it on first use."""
+    global _audio
+    if _audio is None:
+        _audio = AudioManager()
+    return _audio
+
+
+def play_sound(sound_id, priority=0):
+    # Play a sound effect (coalesced until the next AudioManager.update)
+    get_audio().play(sound_id, priority=priority)
+
+
+def play_music(track_path):
+    # Play background music (loaded on a background thread)
+    get_audio().play_music(track_path)
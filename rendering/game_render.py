@@ -1,28 +1,51 @@
 import pygame
 from config import (
-    PLAYER_HURT_ANIMATION_FPS, PLAYER_SPRITE_FRAME_WIDTH, GAME_BG_COLOR, GAME_OVERLAY_COLOR, PAUSE_OVERLAY_COLOR, GAME_OVER_FONT_SIZE, PAUSE_FONT_SIZE, MENU_FONT_SIZE, PAUSE_MENU_HIGHLIGHT_COLOR, PAUSE_MENU_TEXT_COLOR
+    GAME_OVERLAY_COLOR, PAUSE_OVERLAY_COLOR, GAME_OVER_FONT_SIZE, PAUSE_FONT_SIZE, MENU_FONT_SIZE, PAUSE_MENU_HIGHLIGHT_COLOR, PAUSE_MENU_TEXT_COLOR
 )
 from rendering.player_render import draw_player_idle, draw_player_walk, draw_player_run, draw_player_hurt
 from rendering.ui import draw_hud
+from rendering.render_queue import RenderQueue, LAYER_EFFECTS
+from rendering.tilemap import TileMapRenderer
+from rendering.render_scale import ScaledSurface
+from core.clock import game_clock
 
 
 # --- Resource cache ---
 _game_render_cache = {
-    'hurt_hp_img': None,
-    'hurt_barrier_img': None,
     'game_over_font': None,
     'menu_font': None,
-    'pause_font': None
+    'pause_font': None,
+    'map_renderer': None,
+    'world_target': None
 }
+# Sprites for the world (player, skills, enemies) are queued and drawn in one batch
+_render_queue = RenderQueue()
 
-def draw_game(screen, game, last_move, time_accum, paused=False, pause_menu_selected=0, pause_menu_options=None, pause_menu_rects=None, hud_visible=True, fps=None):
-    screen.fill(GAME_BG_COLOR)
+def _world_target(screen, render_scale):
+    """Where the world is drawn: the screen itself at full scale, else a cached ScaledSurface."""
+    if render_scale >= 1.0:
+        return screen
+    target = _game_render_cache['world_target']
+    if target is None or target.scale != render_scale or target.size != screen.get_size():
+        target = _game_render_cache['world_target'] = ScaledSurface(screen.get_size(), render_scale)
+    return target
+
+
+def draw_game(screen, game, last_move, time_accum, paused=False, pause_menu_selected=0, pause_menu_options=None, pause_menu_rects=None, hud_visible=True, fps=None, flip=True, render_scale=1.0):
+    """
+    Draw one frame. The world is drawn at render_scale of the window resolution
+    and upscaled (see rendering/render_scale.py); HUD and overlays stay native.
+    """
     player = game.player
     global _game_render_cache
-    if _game_render_cache['hurt_hp_img'] is None:
-        _game_render_cache['hurt_hp_img'] = pygame.image.load('resources/images/player/Hurt/Slime1_Hurt_full_hp.png').convert_alpha()
-    if _game_render_cache['hurt_barrier_img'] is None:
-        _game_render_cache['hurt_barrier_img'] = pygame.image.load('resources/images/player/Hurt/Slime1_Hurt_full_barrier.png').convert_alpha()
+    world = _world_target(screen, render_scale)
+    # Background: baked map chunks around the camera (the map covers the whole world, so no clear)
+    map_renderer = _game_render_cache['map_renderer']
+    if map_renderer is None or map_renderer.tilemap is not game.tilemap:
+        map_renderer = _game_render_cache['map_renderer'] = TileMapRenderer(game.tilemap)
+    map_renderer.draw(world, game.camera)
+    # Dropped XP and gold lie on the floor, under every sprite
+    game.pickups.draw(world, game.camera)
     if _game_render_cache['game_over_font'] is None:
         _game_render_cache['game_over_font'] = pygame.font.SysFont(None, GAME_OVER_FONT_SIZE)
     if _game_render_cache['menu_font'] is None:
@@ -30,46 +53,54 @@ def draw_game(screen, game, last_move, time_accum, paused=False, pause_menu_sele
     if _game_render_cache['pause_font'] is None:
         _game_render_cache['pause_font'] = pygame.font.SysFont(None, PAUSE_FONT_SIZE)
 
-    if hud_visible:
-        game_mode = game.mode
-        active_events = game.get_active_events_for_display()
-        event_notifications = game.get_event_notifications()
-        draw_hud(screen, player, fps=fps, game_mode=game_mode, active_events=active_events, event_notifications=event_notifications)
+    queue = _render_queue
     # Handle hurt animation (non-interruptible)
     if player.anim_state in ('hurt_hp', 'hurt_barrier'):
-        # Determine number of frames for current hurt animation
-        if player.anim_state == 'hurt_hp':
-            img = _game_render_cache['hurt_hp_img']
-        else:
-            img = _game_render_cache['hurt_barrier_img']
-        num_frames = img.get_width() // PLAYER_SPRITE_FRAME_WIDTH
-        duration = num_frames / PLAYER_HURT_ANIMATION_FPS
-        draw_player_hurt(screen, player, player.anim_timer, barrier_damage=(player.anim_state=='hurt_barrier'))
-        # Unlock animation if finished
-        if player.anim_timer >= duration:
-            player.anim_lock = False
-            player.anim_state = 'idle'
-            player.anim_timer = 0.0
+        now = game_clock.now()
+        draw_player_hurt(queue, player, player.animator.elapsed(now), barrier_damage=(player.anim_state=='hurt_barrier'))
+        # The clip's completion event unlocks the animation once it has played through
+        player.animator.update(now)
     else:
         if last_move != (0, 0):
             if getattr(player, 'movement_speed', 0) >= 5:
-                draw_player_run(screen, player, time_accum)
+                draw_player_run(queue, player, time_accum)
             else:
-                draw_player_walk(screen, player, time_accum)
+                draw_player_walk(queue, player, time_accum)
         else:
-            draw_player_idle(screen, player, time_accum)
+            draw_player_idle(queue, player, time_accum)
 
-    # Draw all player skills (e.g., slash animation), pass last_move for direction
+    # Draw all player skills (e.g., slash animation) above entities, pass last_move for direction
+    effects = queue.on_layer(LAYER_EFFECTS)
     for skill in player.skills.values():
         if hasattr(skill, 'draw'):
-            skill.draw(screen, last_move=last_move)
-    # Draw enemies and debug overlays
-    if hasattr(game, 'enemies'):
-        enemies = game.enemies
-    else:
-        enemies = []
-    for enemy in getattr(game, 'enemies', []):
-        enemy.draw(screen)
+            skill.draw(effects, last_move=last_move)
+    # Queue enemies the LOD pass marked as visible; sprite-less ones draw their fallback after the world
+    offset = game.camera.offset
+    hurt_tint = game.quality.settings['hurt_tint']
+    fallback = queue.submit_enemies(getattr(game, 'enemies', []), hurt_tint=hurt_tint)
+    # Dying enemies play their death animation from the corpse store
+    fallback += queue.submit_enemies(getattr(game, 'corpses', []), hurt_tint=hurt_tint)
+    # Player, skills and enemies in one depth-sorted blits call, shifted into view
+    queue.flush(world, offset)
+    # Particles on top of sprites
+    game.particles.draw(world, game.camera)
+    if world is not screen:
+        world.present(screen)
+    for enemy in fallback:
+        enemy.draw(screen, offset)
+
+    if hud_visible:
+        # Sample the HUD's changing values at the quality level's refresh rate of game time
+        # (a restarted game clock resamples at once); between samples the cached text surfaces are reused
+        now = game_clock.now()
+        hud = game.hud_snapshot
+        if hud['time'] is None or not 0 <= now - hud['time'] < 1.0 / game.quality.settings['hud_refresh_hz']:
+            hud['time'] = now
+            hud['fps'] = fps
+            hud['active_events'] = game.get_active_events_for_display()
+            hud['event_notifications'] = game.get_event_notifications()
+        draw_hud(screen, player, fps=hud['fps'], game_mode=game.mode, active_events=hud['active_events'],
+                 event_notifications=hud['event_notifications'], quality=game.quality)
     # ...removed enemy count and player position debug overlays...
 
     # Draw GAME OVER overlay if needed
@@ -88,24 +119,34 @@ def draw_game(screen, game, last_move, time_accum, paused=False, pause_menu_sele
 
     # Draw pause menu overlay if paused
     if paused and not getattr(game, 'game_over', False):
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill(PAUSE_OVERLAY_COLOR)
-        screen.blit(overlay, (0, 0))
-        font = _game_render_cache['pause_font']
-        text = font.render("Paused", True, PAUSE_MENU_TEXT_COLOR)
-        text_rect = text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2 - 120))
-        screen.blit(text, text_rect)
-        font2 = _game_render_cache['menu_font']
-        rects = []
-        for i, option in enumerate(pause_menu_options or []):
-            color = PAUSE_MENU_HIGHLIGHT_COLOR if i == pause_menu_selected else PAUSE_MENU_TEXT_COLOR
-            opt_text = font2.render(option, True, color)
-            opt_rect = opt_text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2 - 30 + i * 60))
-            screen.blit(opt_text, opt_rect)
-            # Add a slightly larger rect for mouse hitbox
-            rects.append(opt_rect.inflate(40, 20))
-        if pause_menu_rects is not None:
-            pause_menu_rects.clear()
-            pause_menu_rects.extend(rects)
+        draw_pause_menu(screen, pause_menu_selected, pause_menu_options, pause_menu_rects)
+
+    if flip:
+        pygame.display.flip()
+
 
-    pygame.display.flip()
+def draw_pause_menu(screen, selected, options, rects_out=None):
+    """Dim the frame and draw the pause menu; option hitboxes are written to rects_out."""
+    if _game_render_cache['pause_font'] is None:
+        _game_render_cache['pause_font'] = pygame.font.SysFont(None, PAUSE_FONT_SIZE)
+    if _game_render_cache['menu_font'] is None:
+        _game_render_cache['menu_font'] = pygame.font.SysFont(None, MENU_FONT_SIZE)
+    overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+    overlay.fill(PAUSE_OVERLAY_COLOR)
+    screen.blit(overlay, (0, 0))
+    font = _game_render_cache['pause_font']
+    text = font.render("Paused", True, PAUSE_MENU_TEXT_COLOR)
+    text_rect = text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2 - 120))
+    screen.blit(text, text_rect)
+    font2 = _game_render_cache['menu_font']
+    rects = []
+    for i, option in enumerate(options or []):
+        color = PAUSE_MENU_HIGHLIGHT_COLOR if i == selected else PAUSE_MENU_TEXT_COLOR
+        opt_text = font2.render(option, True, color)
+        opt_rect = opt_text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2 - 30 + i * 60))
+        screen.blit(opt_text, opt_rect)
+        # Add a slightly larger rect for mouse hitbox
+        rects.append(opt_rect.inflate(40, 20))
+    if rects_out is not None:
+        rects_out.clear()
+        rects_out.extend(rects)
@@ -11,6 +11,7 @@ from config import (
     COLOR_BLACK, COLOR_GRAY,
     FONT_SIZE_LARGE, FONT_SIZE_SMALL, WINDOW_WIDTH, WINDOW_HEIGHT
 )
+from core.scenes import Scene
 
 # Helper for resource paths
 
@@ -26,7 +27,7 @@ class Menu:
     """
     Handles the main menu, savegame, and settings UI and logic.
     """
-    def __init__(self, screen, start_game_callback=None):
+    def __init__(self, screen):
         self.screen = screen
         self.state = 'main'  # 'main', 'savegame', 'settings'
         self.selected = 0
@@ -82,89 +83,18 @@ class Menu:
         self.checkbox_y_start = self.sfx_label_y + 50
         self.checkbox_spacing = 40
         self.checkbox_size = 28
-        from config import GAME_FPS_OPTIONS, GAME_DEFAULT_FPS
+        from config import GAME_FPS_OPTIONS, GAME_DEFAULT_FPS, RENDER_SCALE_OPTIONS, RENDER_SCALE_DEFAULT
         self._settings_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'settings.json')
         self.fps_options = GAME_FPS_OPTIONS
         self.fps = GAME_DEFAULT_FPS
+        self.render_scale_options = RENDER_SCALE_OPTIONS
+        self.render_scale = RENDER_SCALE_DEFAULT
         self.load_settings()
         # Ensure music volume matches loaded setting
         try:
             pygame.mixer.music.set_volume(self.music_volume / 100)
         except Exception:
             pass
-        # Menu exit/callback logic (must be last)
-        self._should_exit = False
-        self._real_start_game_callback = start_game_callback
-        self.start_game_callback = self._wrap_start_game_callback()
-    def _wrap_start_game_callback(self):
-        def wrapped(slot, mode):
-            self._should_exit = True
-            if self._real_start_game_callback:
-                self._real_start_game_callback(slot, mode)
-        return wrapped
-        btn_w, btn_h = 292, 145
-        btn_x = (WINDOW_WIDTH - btn_w) // 2
-        btn_y_start = 100
-        btn_gap = 30
-        # Use a larger font for main menu buttons
-        self.main_menu_font = pygame.font.SysFont(None, int(FONT_SIZE_LARGE * 1.5))
-        self.main_menu_buttons = [
-            Button((btn_x, btn_y_start + 0*(btn_h+btn_gap), btn_w, btn_h), 'New Game', self.main_menu_font, COLOR_BG, COLOR_HIGHLIGHT, self._main_menu_button_img),
-            Button((btn_x, btn_y_start + 1*(btn_h+btn_gap), btn_w, btn_h), 'Settings', self.main_menu_font, COLOR_BG, COLOR_HIGHLIGHT, self._main_menu_button_img),
-            Button((btn_x, btn_y_start + 2*(btn_h+btn_gap), btn_w, btn_h), 'Quit', self.main_menu_font, COLOR_BG, COLOR_HIGHLIGHT, self._main_menu_button_img),
-        ]
-    # Removed savegame/slot selection UI
-        # Gamemode menu
-        # Use the same button image and sizing for gamemode buttons and back button
-        gm_btn_w, gm_btn_h = 292, 145
-        gm_btn_gap = 30
-        total_width = 3 * gm_btn_w + 2 * gm_btn_gap
-        # Center the button group vertically
-        group_height = gm_btn_h + gm_btn_gap + 80 + 2 * gm_btn_gap  # 3 buttons + gap + back button + gap
-        gm_btn_y = (WINDOW_HEIGHT - group_height) // 2
-        gm_btn_x_start = (WINDOW_WIDTH - total_width) // 2
-        self.gamemode_buttons = [
-            Button((gm_btn_x_start + i * (gm_btn_w + gm_btn_gap), gm_btn_y, gm_btn_w, gm_btn_h), label, self.main_menu_font, COLOR_BG, COLOR_HIGHLIGHT, self._main_menu_button_img)
-            for i, label in enumerate(['Easy', 'Normal', 'Hard'])
-        ]
-        # Smaller back button
-        back_w, back_h = 180, 80
-        back_x = (WINDOW_WIDTH - back_w) // 2
-        back_y = gm_btn_y + gm_btn_h + 2 * gm_btn_gap
-        # Scale the button image for back button if available
-        back_img = None
-        if self._main_menu_button_img:
-            back_img = pygame.transform.smoothscale(self._main_menu_button_img, (back_w, back_h))
-        # Use a smaller font for the back button
-        back_font = pygame.font.SysFont(None, int(FONT_SIZE_LARGE * 0.9))
-        self.gamemode_back_button = Button((back_x, back_y, back_w, back_h), 'Back', back_font, COLOR_BG, COLOR_HIGHLIGHT, back_img)
-        self.selected_slot = None  # Track which slot was selected
-        # Use the same back button as the gamemode menu for settings
-        self.settings_back_button = Button((back_x, back_y, back_w, back_h), 'Back', back_font, COLOR_BG, COLOR_HIGHLIGHT, back_img)
-        self.dragging_music = False
-        self.dragging_sfx = False
-        # Slider positions and sizes
-        self.slider_label_x = 100
-        self.music_label_y = 110
-        self.sfx_label_y = 170
-        self.slider_x = 380
-        self.slider_width = 200
-        self.slider_height = 20
-        self.checkbox_x = self.slider_x
-        self.checkbox_y_start = self.sfx_label_y + 50
-        self.checkbox_spacing = 40
-        self.checkbox_size = 28
-        from config import GAME_FPS_OPTIONS, GAME_DEFAULT_FPS
-        self._settings_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'settings.json')
-        self.fps_options = GAME_FPS_OPTIONS
-        self.fps = GAME_DEFAULT_FPS
-        self.load_settings()
-        self.start_game_callback = start_game_callback
-        # Ensure music volume matches loaded setting
-        try:
-            pygame.mixer.music.set_volume(self.music_volume / 100)
-        except Exception:
-            pass
 
     def load_settings(self):
         try:
@@ -178,6 +108,7 @@ class Menu:
             self.sfx_volume = int(round(float(sv)))
             self.sfx_volume = min(100, max(0, (self.sfx_volume // 5) * 5))
             self.fps = int(data.get('fps', self.fps_options[0]))
+            self.render_scale = int(data.get('render_scale', self.render_scale))
             self.checkbox_options = [
                 {"label": "Auto Aim", "checked": bool(data.get('auto_aim', True))},
                 {"label": "Auto Attack", "checked": bool(data.get('auto_attack', True))},
@@ -190,12 +121,20 @@ class Menu:
                 {"label": "Auto Aim", "checked": True},
                 {"label": "Auto Attack", "checked": True},
             ]
+        self._apply_audio_settings()
+
+    def _apply_audio_settings(self):
+        from rendering.audio import get_audio
+        audio = get_audio()
+        audio.set_music_volume(self.music_volume / 100)
+        audio.set_sfx_volume(self.sfx_volume / 100)
 
     def save_settings(self):
         data = {
             'music_volume': int(self.music_volume),
             'sfx_volume': int(self.sfx_volume),
             'fps': int(self.fps),
+            'render_scale': int(self.render_scale),
             'auto_aim': self.checkbox_options[0]["checked"],
             'auto_attack': self.checkbox_options[1]["checked"]
         }
@@ -204,25 +143,10 @@ class Menu:
                 json.dump(data, f, indent=4)
         except Exception as e:
             pass
-
-    def run(self):
-        """Main menu loop. Handles events and drawing until quit or game start."""
-        clock = pygame.time.Clock()
-        running = True
-        while running and not self._should_exit:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                else:
-                    self.handle_event(event)
-            self.draw()
-            clock.tick(60)
-        # Only quit pygame if the whole app is closing, not if starting the game
-        if not self._should_exit:
-            pygame.quit()
+        self._apply_audio_settings()
 
     def draw(self):
-        """Draws the current menu state to the screen."""
+        """Draws the current menu state to the screen (the SceneManager flips the display)."""
         self.screen.fill(COLOR_BG)
         if self.state == 'main':
             self.draw_main_menu()
@@ -230,7 +154,6 @@ class Menu:
             self.draw_settings_menu()
         elif self.state == 'gamemode':
             self.draw_gamemode_menu()
-        pygame.display.flip()
 
     def draw_gamemode_menu(self):
         title = self.font.render('Select Game Mode', True, COLOR_TEXT)
@@ -283,8 +206,20 @@ class Menu:
             label_rect = label.get_rect(center=rect.center)
             self.screen.blit(label, label_rect)
             self.fps_rects.append(rect)
+        # Render scale buttons (percent of the window resolution the world is drawn at)
+        scale_label_y = top_y + spacing_y
+        scale_label = self.small_font.render('Render Scale:', True, COLOR_TEXT)
+        self.screen.blit(scale_label, (self.slider_label_x, scale_label_y))
+        self.render_scale_rects = []
+        for i, scale in enumerate(self.render_scale_options):
+            rect = pygame.Rect(fps_btn_x + i*(btn_w+10), scale_label_y - 6, btn_w, btn_h)
+            selected = self.render_scale == scale
+            pygame.draw.rect(self.screen, COLOR_HIGHLIGHT if selected else COLOR_GRAY, rect, border_radius=6)
+            label = self.small_font.render(f'{scale}%', True, COLOR_BLACK if selected else COLOR_TEXT)
+            self.screen.blit(label, label.get_rect(center=rect.center))
+            self.render_scale_rects.append(rect)
         # Music/SFX sliders and labels (move down)
-        self.music_label_y = top_y + spacing_y
+        self.music_label_y = scale_label_y + spacing_y
         self.sfx_label_y = self.music_label_y + spacing_y
         music_label = self.small_font.render(f'Music Volume: {int(self.music_volume)}%', True, COLOR_TEXT)
         sfx_label = self.small_font.render(f'SFX Volume: {int(self.sfx_volume)}%', True, COLOR_TEXT)
@@ -313,33 +248,27 @@ class Menu:
         self.settings_back_button.draw(self.screen)
 
     def handle_event(self, event):
-        """Returns True if the settings menu should exit (e.g. back button or ESC), else False."""
-        """Handles user input events for the menu."""
+        """
+        Handles user input events for the current menu state.
+        Returns the transition the event asks for ('gamemode', 'settings',
+        'back', 'quit' or ('start', mode)), or None. The menu scenes act on it.
+        """
         if self.state == 'main':
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mouse_pos = event.pos
                 if self.main_menu_buttons[0].is_clicked(mouse_pos):
-                    self.state = 'gamemode'
-                    self.selected = 0
+                    return 'gamemode'
                 elif self.main_menu_buttons[1].is_clicked(mouse_pos):
-                    self.state = 'settings'
-                    self.selected = 0
+                    return 'settings'
                 elif self.main_menu_buttons[2].is_clicked(mouse_pos):
-                    pygame.event.post(pygame.event.Event(pygame.QUIT))
+                    return 'quit'
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_DOWN:
                     self.selected = (self.selected + 1) % 3
                 elif event.key == pygame.K_UP:
                     self.selected = (self.selected - 1) % 3
                 elif event.key == pygame.K_RETURN:
-                    if self.selected == 0:
-                        self.state = 'gamemode'
-                        self.selected = 0
-                    elif self.selected == 1:
-                        self.state = 'settings'
-                        self.selected = 0
-                    elif self.selected == 2:
-                        pygame.event.post(pygame.event.Event(pygame.QUIT))
+                    return ('gamemode', 'settings', 'quit')[self.selected]
         elif self.state == 'savegame':
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_DOWN:
@@ -380,17 +309,14 @@ class Menu:
                 for idx, button in enumerate(self.gamemode_buttons):
                     if button.is_clicked(mouse_pos):
                         # Start new game with selected mode
-                        if self.start_game_callback:
-                            self.start_game_callback(self.selected_slot, button.text)
-                        self.state = 'main'  # Optionally reset menu state
-                        return
+                        return ('start', button.text)
                 if self.gamemode_back_button.is_clicked(mouse_pos):
-                    self.state = 'main'
-                    self.selected = 0
+                    return 'back'
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                return 'back'
         elif self.state == 'settings':
             # Always update slider/fps rects before handling events
             self.draw_settings_menu()
-            pygame.display.flip()
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_DOWN:
                     self.selected = (self.selected + 1) % 2
@@ -413,9 +339,7 @@ class Menu:
                         self.sfx_volume = min(100, self.sfx_volume + 5)
                         self.save_settings()
                 elif event.key == pygame.K_ESCAPE:
-                    self.state = 'main'
-                    self.selected = 0
-                    return True
+                    return 'back'
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mouse_pos = event.pos
                 # Check if user clicked on the music volume slider
@@ -440,6 +364,13 @@ class Menu:
                             self.fps = self.fps_options[i]
                             self.save_settings()
                             break
+                # Render scale buttons
+                elif hasattr(self, 'render_scale_rects') and any(r.collidepoint(mouse_pos) for r in self.render_scale_rects):
+                    for i, rect in enumerate(self.render_scale_rects):
+                        if rect.collidepoint(mouse_pos):
+                            self.render_scale = self.render_scale_options[i]
+                            self.save_settings()
+                            break
                 # Checkboxes
                 else:
                     for i, opt in enumerate(self.checkbox_options):
@@ -450,9 +381,7 @@ class Menu:
                             self.save_settings()
                             break
                 if self.settings_back_button.is_clicked(mouse_pos):
-                    self.state = 'main'
-                    self.selected = 0
-                    return True
+                    return 'back'
             elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
                 self.dragging_music = False
                 self.dragging_sfx = False
@@ -469,7 +398,85 @@ class Menu:
                     percent = int(round((rel_x / self.slider_width) * 100 / 5) * 5)
                     self.sfx_volume = min(100, max(0, percent))
                     self.save_settings()
-            return False
+        return None
+
+_menu = None
+
+
+def get_menu(screen):
+    """Return the shared Menu (fonts, button images, settings), creating it on first use."""
+    global _menu
+    if _menu is None or _menu.screen is not screen:
+        _menu = Menu(screen)
+    return _menu
+
+
+class MenuScene(Scene):
+    """A Menu state shown as a scene; the shared Menu keeps its resources between visits."""
+    state = 'main'
+    fps = 60
+
+    def __init__(self, menu):
+        super().__init__()
+        self.menu = menu
+
+    def enter(self, manager):
+        super().enter(manager)
+        self.menu.state = self.state
+        self.menu.selected = 0
+
+    def handle_event(self, event):
+        self.menu.state = self.state
+        action = self.menu.handle_event(event)
+        if action is not None:
+            self.on_action(action)
+
+    def on_action(self, action):
+        if action == 'back':
+            self.manager.pop()
+        elif action == 'quit':
+            self.manager.quit()
+
+    def draw(self, screen):
+        self.menu.state = self.state
+        self.menu.draw()
+
+
+class SettingsScene(MenuScene):
+    state = 'settings'
+
+
+class ModeSelectScene(MenuScene):
+    """Picking a mode replaces this scene with the one built by start_game(slot, mode)."""
+    state = 'gamemode'
+
+    def __init__(self, menu, start_game):
+        super().__init__(menu)
+        self.start_game = start_game
+
+    def on_action(self, action):
+        if isinstance(action, tuple) and action[0] == 'start':
+            self.manager.replace(self.start_game(self.menu.selected_slot, action[1]))
+        else:
+            super().on_action(action)
+
+
+class MainMenuScene(MenuScene):
+    state = 'main'
+
+    def __init__(self, menu, start_game):
+        super().__init__(menu)
+        self.mode_select = ModeSelectScene(menu, start_game)
+        self.settings = SettingsScene(menu)
+
+    def on_action(self, action):
+        if action == 'gamemode':
+            self.manager.push(self.mode_select)
+        elif action == 'settings':
+            self.manager.push(self.settings)
+        else:
+            super().on_action(action)
+
 
 class Button:
     def __init__(self, rect, text, font, color, highlight_color, bg_image=None):
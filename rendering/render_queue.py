@@ -0,0 +1,117 @@
+"""
+Render queue: collects sprite blits for a frame, sorts them by layer and
+depth (bottom y), and submits them to the screen in a single Surface.blits call.
+"""
+import numpy as np
+import pygame
+
+# Draw layers, lowest first; within a layer sprites are ordered by bottom y
+LAYER_GROUND = 0
+LAYER_ENTITIES = 1
+LAYER_EFFECTS = 2
+
+
+class _LayerTarget:
+    """Surface-like adapter so existing draw(surface) code can queue onto a fixed layer."""
+    def __init__(self, queue, layer):
+        self.queue = queue
+        self.layer = layer
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.queue.blit(source, dest, layer=self.layer, area=area, special_flags=special_flags)
+
+
+class RenderQueue:
+    """
+    Per-frame list of (surface, dest) pairs.
+    Exposes blit(source, dest) so it can stand in for a Surface in the
+    existing draw functions; batched enemy sprites go through submit_enemies.
+    Blits with a source area or blend flags keep them in a sparse side table.
+    """
+    def __init__(self):
+        self.surfaces = []
+        self.dests = []
+        self.layers = []
+        self.depths = []
+        self.options = {}  # Queue index -> (area, special_flags)
+
+    def clear(self):
+        self.surfaces.clear()
+        self.dests.clear()
+        self.layers.clear()
+        self.depths.clear()
+        self.options.clear()
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def on_layer(self, layer):
+        return _LayerTarget(self, layer)
+
+    def blit(self, source, dest, layer=LAYER_ENTITIES, area=None, special_flags=0):
+        """Queue a single sprite; dest is a Rect or a top-left (x, y), area and special_flags as in Surface.blit."""
+        if isinstance(dest, pygame.Rect):
+            depth = dest.bottom
+            dest = dest.topleft
+        else:
+            depth = dest[1] + (pygame.Rect(area).height if area is not None else source.get_height())
+        if area is not None or special_flags:
+            self.options[len(self.surfaces)] = (area, special_flags)
+        self.surfaces.append(source)
+        self.dests.append(dest)
+        self.layers.append(layer)
+        self.depths.append(depth)
+
+    def submit_enemies(self, enemies, layer=LAYER_ENTITIES, hurt_tint=True):
+        """
+        Queue the current frame of every visible enemy. The sprite anchor
+        math (centered on x, bottom-aligned to the enemy's feet) is done on
+        arrays for the whole batch. Returns enemies without a sprite so the
+        caller can draw their fallback directly.
+        """
+        frames = []
+        anchors = []
+        fallback = []
+        for enemy in enemies:
+            if not enemy.visible:
+                continue
+            frame = enemy.logic.current_frame(hurt_tint) if enemy.logic is not None else None
+            if frame is None:
+                fallback.append(enemy)
+                continue
+            frames.append(frame)
+            anchors.append(enemy.logic.draw_anchor())
+        if not frames:
+            return fallback
+        anchor = np.array(anchors, dtype=np.int32).reshape(-1, 3)
+        sizes = np.array([frame.get_size() for frame in frames], dtype=np.int32)
+        # anchor columns: center x, center y, enemy size
+        bottom = anchor[:, 1] + anchor[:, 2] // 2
+        left = anchor[:, 0] - sizes[:, 0] // 2
+        top = bottom - sizes[:, 1]
+        self.surfaces.extend(frames)
+        self.dests.extend(zip(left.tolist(), top.tolist()))
+        self.layers.extend([layer] * len(frames))
+        self.depths.extend(bottom.tolist())
+        return fallback
+
+    def flush(self, target, offset=(0, 0)):
+        """
+        Sort queued sprites by (layer, depth) and draw them in one blits call.
+        offset translates world coordinates to the target (see Camera.offset).
+        """
+        if not self.surfaces:
+            return
+        order = np.lexsort((np.asarray(self.depths), np.asarray(self.layers)))
+        surfaces = self.surfaces
+        dests = self.dests
+        ox, oy = offset
+        if ox or oy:
+            entries = [(surfaces[i], (dests[i][0] + ox, dests[i][1] + oy)) for i in order.tolist()]
+        else:
+            entries = [(surfaces[i], dests[i]) for i in order.tolist()]
+        if self.options:
+            options = self.options
+            entries = [entry + options[i] if i in options else entry for entry, i in zip(entries, order.tolist())]
+        target.blits(entries, doreturn=False)
+        self.clear()
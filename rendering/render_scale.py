@@ -0,0 +1,88 @@
+"""
+Internal render resolution.
+The world is drawn into an offscreen surface smaller than the window and
+upscaled once per frame, so map, sprite and particle blits fill fewer pixels;
+the HUD is drawn afterwards at native resolution.
+"""
+import weakref
+import pygame
+from config import RENDER_SCALE_SMOOTH
+
+
+class ScaledSurface:
+    """
+    Surface-like render target for world drawing at scale (0 < scale < 1).
+    blit/blits take native-resolution sources, coordinates and source areas:
+    sources are downscaled once and cached for as long as they are alive
+    (so callers should hand in long-lived surfaces, not per-frame ones),
+    coordinates and areas are multiplied by scale. present() upscales the
+    frame onto the window.
+    """
+    def __init__(self, size, scale, smooth=RENDER_SCALE_SMOOTH):
+        self.size = size  # Native (window) size
+        self.scale = scale
+        self.smooth = smooth
+        self.surface = pygame.Surface((max(1, round(size[0] * scale)), max(1, round(size[1] * scale))))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        # Source surface -> downscaled copy; entries go away with their source
+        self._cache = weakref.WeakKeyDictionary()
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def fill(self, color):
+        self.surface.fill(color)
+
+    def scaled(self, source):
+        """Downscaled copy of a native-resolution source (cached)."""
+        scaled = self._cache.get(source)
+        if scaled is None:
+            w, h = source.get_size()
+            size = (max(1, round(w * self.scale)), max(1, round(h * self.scale)))
+            try:
+                scaled = pygame.transform.smoothscale(source, size)
+            except ValueError:
+                # smoothscale only handles 24/32-bit surfaces
+                scaled = pygame.transform.scale(source, size)
+            self._cache[source] = scaled
+        return scaled
+
+    def _area(self, area):
+        """A native-resolution source area in the downscaled source's pixels."""
+        if area is None:
+            return None
+        x, y, w, h = pygame.Rect(area)
+        s = self.scale
+        return pygame.Rect(round(x * s), round(y * s), max(1, round(w * s)), max(1, round(h * s)))
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        s = self.scale
+        self.surface.blit(self.scaled(source), (round(dest[0] * s), round(dest[1] * s)), self._area(area),
+                          special_flags)
+
+    def blits(self, blit_sequence, doreturn=True):
+        """Surface.blits over (source, dest[, area[, special_flags]]) entries; dest is a Rect or (x, y)."""
+        s = self.scale
+        scaled = self.scaled
+        entries = []
+        for entry in blit_sequence:
+            dest = entry[1]
+            scaled_entry = (scaled(entry[0]), (round(dest[0] * s), round(dest[1] * s)))
+            if len(entry) > 2:
+                scaled_entry += (self._area(entry[2]),) + tuple(entry[3:])
+            entries.append(scaled_entry)
+        return self.surface.blits(entries, doreturn)
+
+    def present(self, screen):
+        """Upscale the world frame onto screen (nearest neighbour unless smooth)."""
+        if self.smooth:
+            pygame.transform.smoothscale(self.surface, screen.get_size(), screen)
+        else:
+            pygame.transform.scale(self.surface, screen.get_size(), screen)
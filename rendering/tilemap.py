@@ -0,0 +1,190 @@
+"""
+Tilemap storage and chunked background rendering.
+
+Map files are a small header followed by raw row-major tile ids, opened with
+numpy.memmap so large maps are paged in on demand instead of living in RAM as
+Python lists. The renderer bakes the map into fixed-size chunk surfaces once
+and keeps the most recently used chunks around the camera in an LRU cache.
+"""
+import math
+import os
+import struct
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+from config import TILE_SIZE, MAP_CHUNK_SIZE, MAP_CHUNK_CACHE_SIZE, TILE_COLORS, SOLID_TILES
+
+# Header: magic, version, width (tiles), height (tiles), tile size (px)
+MAP_MAGIC = b'SLLM'
+MAP_VERSION = 1
+_HEADER = struct.Struct('<4sHIIH')
+
+
+class TileMap:
+    """Grid of tile ids (uint8) backed by a NumPy array or memmap."""
+    def __init__(self, tiles, tile_size=TILE_SIZE):
+        self.tiles = tiles
+        self.tile_size = tile_size
+        self.height, self.width = tiles.shape
+        self._listeners = []
+
+    @property
+    def pixel_size(self):
+        return (self.width * self.tile_size, self.height * self.tile_size)
+
+    @classmethod
+    def load(cls, path, writable=False):
+        with open(path, 'rb') as f:
+            magic, version, width, height, tile_size = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAP_MAGIC or version != MAP_VERSION:
+            raise ValueError(f"{path}: not a v{MAP_VERSION} map file")
+        tiles = np.memmap(path, dtype=np.uint8, mode='r+' if writable else 'c',
+                          offset=_HEADER.size, shape=(height, width))
+        return cls(tiles, tile_size)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(MAP_MAGIC, MAP_VERSION, self.width, self.height, self.tile_size))
+            f.write(np.ascontiguousarray(self.tiles, dtype=np.uint8).tobytes())
+
+    @classmethod
+    def generate(cls, width, height, tile_size=TILE_SIZE, seed=0):
+        """Procedural ground: mostly base tiles with scattered variant patches and solid rock outcrops."""
+        rng = np.random.default_rng(seed)
+        # Coarse noise upsampled to tile resolution gives patchy regions
+        coarse = rng.random((height // 8 + 2, width // 8 + 2))
+        patches = np.kron(coarse, np.ones((8, 8)))[:height, :width]
+        tiles = np.zeros((height, width), dtype=np.uint8)
+        tiles[patches > 0.55] = 1
+        tiles[patches > 0.8] = 2
+        tiles[rng.random((height, width)) < 0.02] = 3  # Sparse detail tiles
+        # Ragged rock outcrops, kept clear of the player's start in the middle
+        blocks = np.kron(rng.random((height // 4 + 2, width // 4 + 2)), np.ones((4, 4)))[:height, :width]
+        rocks = (blocks > 0.97) & (rng.random((height, width)) < 0.8)
+        rocks[max(0, height // 2 - 10):height // 2 + 10, max(0, width // 2 - 10):width // 2 + 10] = False
+        tiles[rocks] = SOLID_TILES[0]
+        return cls(tiles, tile_size)
+
+    def get(self, tx, ty):
+        return int(self.tiles[ty, tx])
+
+    def set(self, tx, ty, tile_id):
+        self.tiles[ty, tx] = tile_id
+        for listener in self._listeners:
+            listener(tx, ty)
+
+    def add_listener(self, fn):
+        """fn(tx, ty) is called after a tile changes."""
+        self._listeners.append(fn)
+
+
+class Tileset:
+    """One pre-built surface per tile id (flat colours until tile art exists)."""
+    def __init__(self, tile_size=TILE_SIZE, colors=TILE_COLORS):
+        self.tile_size = tile_size
+        self.surfaces = []
+        for color in colors:
+            surf = pygame.Surface((tile_size, tile_size))
+            surf.fill(color)
+            # Faint edge so the ground reads as a grid when moving
+            edge = tuple(max(0, c - 8) for c in color)
+            pygame.draw.line(surf, edge, (0, tile_size - 1), (tile_size - 1, tile_size - 1))
+            pygame.draw.line(surf, edge, (tile_size - 1, 0), (tile_size - 1, tile_size - 1))
+            self.surfaces.append(surf)
+
+    def __getitem__(self, tile_id):
+        return self.surfaces[tile_id % len(self.surfaces)]
+
+
+class TileMapRenderer:
+    """
+    Draws a TileMap through baked chunk surfaces.
+    Each visible chunk costs one blit per frame; a chunk is baked (one blit per
+    tile) the first time it is needed and again only after one of its tiles changes.
+    """
+    def __init__(self, tilemap, tileset=None, chunk_size=MAP_CHUNK_SIZE, cache_size=MAP_CHUNK_CACHE_SIZE):
+        self.tilemap = tilemap
+        self.tileset = tileset or Tileset(tilemap.tile_size)
+        # Chunk edge in tiles (rounded so chunks hold whole tiles)
+        self.chunk_tiles = max(1, chunk_size // tilemap.tile_size)
+        self.chunk_px = self.chunk_tiles * tilemap.tile_size
+        self.cache_size = cache_size
+        self.chunks = OrderedDict()  # (cx, cy) -> Surface, least recently used first
+        self.bakes = 0
+        tilemap.add_listener(self.invalidate_tile)
+
+    def invalidate_tile(self, tx, ty):
+        # Dropped chunks are rebaked lazily the next time they are visible
+        self.chunks.pop((tx // self.chunk_tiles, ty // self.chunk_tiles), None)
+
+    def invalidate_all(self):
+        self.chunks.clear()
+
+    def _chunk(self, cx, cy):
+        key = (cx, cy)
+        surf = self.chunks.get(key)
+        if surf is not None:
+            self.chunks.move_to_end(key)
+            return surf
+        surf = self._bake(cx, cy)
+        self.chunks[key] = surf
+        while len(self.chunks) > self.cache_size:
+            self.chunks.popitem(last=False)
+        return surf
+
+    def _bake(self, cx, cy):
+        tilemap = self.tilemap
+        ts = tilemap.tile_size
+        n = self.chunk_tiles
+        tx0, ty0 = cx * n, cy * n
+        block = np.asarray(tilemap.tiles[ty0:ty0 + n, tx0:tx0 + n])
+        rows, cols = block.shape
+        surf = pygame.Surface((cols * ts, rows * ts))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        tileset = self.tileset
+        surf.blits([(tileset[tile_id], (col * ts, row * ts))
+                    for row, line in enumerate(block.tolist())
+                    for col, tile_id in enumerate(line)], doreturn=False)
+        self.bakes += 1
+        return surf
+
+    def draw(self, surface, camera):
+        """Blit the chunks intersecting the camera view."""
+        view = camera.rect
+        size = self.chunk_px
+        max_cx = (self.tilemap.width - 1) // self.chunk_tiles
+        max_cy = (self.tilemap.height - 1) // self.chunk_tiles
+        cx0, cx1 = max(0, view.left // size), min(max_cx, (view.right - 1) // size)
+        cy0, cy1 = max(0, view.top // size), min(max_cy, (view.bottom - 1) // size)
+        ox, oy = camera.offset
+        surface.blits([(self._chunk(cx, cy), (cx * size + ox, cy * size + oy))
+                       for cy in range(cy0, cy1 + 1)
+                       for cx in range(cx0, cx1 + 1)], doreturn=False)
+
+
+def load_tilemap(path, width_px, height_px):
+    """
+    Load the map file, generating and saving a default arena if it does not exist.
+    The map always covers the whole world (partial edge tiles included), so the
+    renderer never has to clear behind it; a map file smaller than the world is
+    replaced by a generated arena for this run.
+    """
+    cols, rows = math.ceil(width_px / TILE_SIZE), math.ceil(height_px / TILE_SIZE)
+    if os.path.exists(path):
+        tilemap = TileMap.load(path)
+        map_w, map_h = tilemap.pixel_size
+        if map_w >= width_px and map_h >= height_px:
+            return tilemap
+        print(f"[MAP] {path} is {map_w}x{map_h} px, smaller than the {width_px}x{height_px} px world; "
+              f"generating default arena")
+        return TileMap.generate(cols, rows)
+    print(f"[MAP] {path} not found, generating default arena")
+    tilemap = TileMap.generate(cols, rows)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tilemap.save(path)
+    except OSError as e:
+        print(f"[MAP] Could not save {path}: {e}")
+    return tilemap
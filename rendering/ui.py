@@ -5,9 +5,10 @@ import pygame
 import os
 from config import (
     HUD_TOP_HEIGHT, HUD_BOTTOM_HEIGHT, HUD_LEFT_WIDTH, HUD_RIGHT_WIDTH,
-    HUD_ALPHA, HUD_COLOR, HUD_LABEL_COLOR, HUD_LABEL_FONT_SIZE,
+    HUD_ALPHA, HUD_COLOR, HUD_LABEL_COLOR, HUD_LABEL_FONT_SIZE, HUD_TEXT_ALPHA_STEP,
     COLOR_HEALTH_BAR_BG, COLOR_HEALTH_BAR_FILL, COLOR_BARRIER_BAR_BG, COLOR_BARRIER_BAR_FILL
 )
+from core.input import skill_slots
 
 # Cache for HUD surfaces and font
 _hud_cache = {
@@ -16,49 +17,78 @@ _hud_cache = {
     'bottom': None,
     'left': None,
     'right': None,
-    'font': None
+    'font': None,
+    'key_font': None,
+    'notification_font': None,
+    'text': {},
+    'skill_slots': (None, None),  # (skill names, slots) last computed
+    'skill_images': {}
 }
+# Skill bar icons by skill name
+SKILL_ICON_PATHS = {
+    'slash': r'C:\Repos\SLL\resources\images\UI\hud\skill_bar\skill_slash.jpg',
+    'dash': r'C:\Repos\SLL\resources\images\UI\hud\skill_bar\skill_dash.jpg',
+}
+
+def _render_text(font, text, color, alpha=255):
+    """
+    font.render with a cache; HUD text mostly repeats frame to frame.
+    The surfaces are shared, so callers must not modify them: faded text
+    (alpha < 255) is a cached copy per HUD_TEXT_ALPHA_STEP of alpha.
+    """
+    if alpha < 255:
+        alpha = alpha - alpha % HUD_TEXT_ALPHA_STEP
+    cache = _hud_cache['text']
+    key = (id(font), text, color, alpha)
+    surf = cache.get(key)
+    if surf is None:
+        if len(cache) > 512:
+            cache.clear()
+        if alpha < 255:
+            surf = _render_text(font, text, color).copy()
+            surf.set_alpha(alpha)
+        else:
+            surf = font.render(text, True, color)
+        cache[key] = surf
+    return surf
+
+def _skill_icon(skill_name, size):
+    """Skill bar icon for skill_name (loaded and scaled once), or None."""
+    images = _hud_cache['skill_images']
+    if skill_name not in images:
+        path = SKILL_ICON_PATHS.get(skill_name)
+        if path and os.path.exists(path):
+            img = pygame.image.load(path).convert_alpha()
+            images[skill_name] = pygame.transform.smoothscale(img, (size, size))
+        else:
+            images[skill_name] = None
+    return images[skill_name]
 
-def draw_hud(screen, player, fps=None, game_mode=None, active_events=None, event_notifications=None):
+def draw_hud(screen, player, fps=None, game_mode=None, active_events=None, event_notifications=None, quality=None):
     width, height = screen.get_size()
     # --- Skill Bar ---
     # Skill bar config
     SKILL_BOX_SIZE = 64
     SKILL_BOX_GAP = 16
-    SKILL_BOX_COUNT = 7
+    # One box per bound slot (core.input.skill_slots over config.SKILL_BINDINGS)
+    names = tuple(player.skills)
+    if _hud_cache['skill_slots'][0] != names:
+        _hud_cache['skill_slots'] = (names, skill_slots(names))
+    slots = _hud_cache['skill_slots'][1]
+    SKILL_BOX_COUNT = len(slots)
     SKILL_BOX_ALPHA = int(0.8 * 255)
     SKILL_BAR_Y = height - HUD_BOTTOM_HEIGHT + 10
     SKILL_BAR_WIDTH = SKILL_BOX_COUNT * SKILL_BOX_SIZE + (SKILL_BOX_COUNT - 1) * SKILL_BOX_GAP
     SKILL_BAR_X = (width - SKILL_BAR_WIDTH) // 2
-    # Key labels for each skill slot (first is SPACE, rest empty)
-    SKILL_KEYS = ["LMB", "RMB", "SPACE", "1", "2", "3", "4"]
-    # Load slash and dash skill images (cache them)
-    if not hasattr(draw_hud, '_slash_img'):
-        slash_img_path = r'C:\Repos\SLL\resources\images\UI\hud\skill_bar\skill_slash.jpg'
-        if os.path.exists(slash_img_path):
-            img = pygame.image.load(slash_img_path).convert_alpha()
-            draw_hud._slash_img = pygame.transform.smoothscale(img, (SKILL_BOX_SIZE, SKILL_BOX_SIZE))
-        else:
-            draw_hud._slash_img = None
-    if not hasattr(draw_hud, '_dash_img'):
-        dash_img_path = r'C:\Repos\SLL\resources\images\UI\hud\skill_bar\skill_dash.jpg'
-        if os.path.exists(dash_img_path):
-            img = pygame.image.load(dash_img_path).convert_alpha()
-            draw_hud._dash_img = pygame.transform.smoothscale(img, (SKILL_BOX_SIZE, SKILL_BOX_SIZE))
-        else:
-            draw_hud._dash_img = None
     # Draw skill boxes and cooldown bars
-    skill_names = ["slash", None, "dash", None, None, None, None]
-    for i in range(SKILL_BOX_COUNT):
+    for i, (key_label, _, _, skill_name) in enumerate(slots):
         box_x = SKILL_BAR_X + i * (SKILL_BOX_SIZE + SKILL_BOX_GAP)
         box_y = SKILL_BAR_Y
         box_rect = pygame.Rect(box_x, box_y, SKILL_BOX_SIZE, SKILL_BOX_SIZE)
         # Draw cooldown bar above box if skill exists
-        skill_name = skill_names[i]
         if skill_name and skill_name in player.skills:
             skill = player.skills[skill_name]
-            now = pygame.time.get_ticks() / 1000
-            cd = max(0, skill.cooldown - (now - skill.last_used)) if not getattr(skill, 'active', False) else skill.cooldown
+            cd = player.skills.cooldown_left(skill_name) if not skill.active else skill.cooldown
             cd_frac = min(cd / skill.cooldown, 1.0) if skill.cooldown > 0 else 0
             bar_w = SKILL_BOX_SIZE
             bar_h = 8
@@ -74,22 +104,20 @@ def draw_hud(screen, player, fps=None, game_mode=None, active_events=None, event
         box_surface = pygame.Surface((SKILL_BOX_SIZE, SKILL_BOX_SIZE), pygame.SRCALPHA)
         box_surface.fill((80, 80, 80, SKILL_BOX_ALPHA))
         screen.blit(box_surface, (box_x, box_y))
-        # Draw slash skill image in first box, dash skill image in third box
-        if i == 0 and draw_hud._slash_img:
-            screen.blit(draw_hud._slash_img, (box_x, box_y))
-        if i == 2 and draw_hud._dash_img:
-            screen.blit(draw_hud._dash_img, (box_x, box_y))
+        # Draw the bound skill's icon
+        icon = _skill_icon(skill_name, SKILL_BOX_SIZE)
+        if icon:
+            screen.blit(icon, (box_x, box_y))
         # Draw border
         pygame.draw.rect(screen, (200, 200, 200), box_rect, 2)
         # Draw key label below box (no visual box, move text up)
-        key_label = SKILL_KEYS[i]
         if key_label:
-            key_font = pygame.font.SysFont(None, 24)
-            label_surf = key_font.render(key_label, True, (220, 220, 220))
+            if _hud_cache['key_font'] is None:
+                _hud_cache['key_font'] = pygame.font.SysFont(None, 24)
+            label_surf = _render_text(_hud_cache['key_font'], key_label, (220, 220, 220))
             label_rect = label_surf.get_rect(center=(box_x + SKILL_BOX_SIZE // 2, box_y + SKILL_BOX_SIZE + 10))
             screen.blit(label_surf, label_rect)
     width, height = screen.get_size()
-    global _hud_cache
     # Remove HUD backgrounds for a cleaner look
     if _hud_cache['size'] != (width, height):
         _hud_cache['size'] = (width, height)
@@ -113,7 +141,7 @@ def draw_hud(screen, player, fps=None, game_mode=None, active_events=None, event
     pygame.draw.rect(screen, COLOR_HEALTH_BAR_BG, (BAR_X, BAR_Y, BAR_WIDTH, BAR_HEIGHT), border_radius=8)
     pygame.draw.rect(screen, COLOR_HEALTH_BAR_FILL, (BAR_X, BAR_Y, int(BAR_WIDTH * health_frac), BAR_HEIGHT), border_radius=8)
     health_text = f"{health_val}/{max_health}"
-    health_label = font.render(health_text, True, (255,255,255))
+    health_label = _render_text(font, health_text, (255,255,255))
     health_label_rect = health_label.get_rect(center=(BAR_X + BAR_WIDTH // 2, BAR_Y + BAR_HEIGHT // 2))
     screen.blit(health_label, health_label_rect)
     # Shield bar (blue), below health
@@ -124,7 +152,7 @@ def draw_hud(screen, player, fps=None, game_mode=None, active_events=None, event
     pygame.draw.rect(screen, COLOR_BARRIER_BAR_BG, (BAR_X, shield_y, BAR_WIDTH, BAR_HEIGHT), border_radius=8)
     pygame.draw.rect(screen, COLOR_BARRIER_BAR_FILL, (BAR_X, shield_y, int(BAR_WIDTH * shield_frac), BAR_HEIGHT), border_radius=8)
     shield_text = f"{shield_val}/{max_shield}"
-    shield_label = font.render(shield_text, True, (255,255,255))
+    shield_label = _render_text(font, shield_text, (255,255,255))
     shield_label_rect = shield_label.get_rect(center=(BAR_X + BAR_WIDTH // 2, shield_y + BAR_HEIGHT // 2))
     screen.blit(shield_label, shield_label_rect)
 
@@ -136,7 +164,7 @@ def draw_hud(screen, player, fps=None, game_mode=None, active_events=None, event
     # --- Right HUD Display (FPS and Game Mode) ---
     # Show FPS in the top right corner
     if fps is not None:
-        fps_text = font.render(f"FPS: {int(fps)}", True, HUD_LABEL_COLOR)
+        fps_text = _render_text(font, f"FPS: {int(fps)}", HUD_LABEL_COLOR)
         text_rect = fps_text.get_rect(topright=(width - 20, 10))
         screen.blit(fps_text, text_rect)
 
@@ -148,10 +176,18 @@ def draw_hud(screen, player, fps=None, game_mode=None, active_events=None, event
             'Hard': (255, 100, 100)     # Red
         }.get(game_mode, (255, 255, 255))
         
-        mode_text = font.render(f"Mode: {game_mode}", True, mode_color)
+        mode_text = _render_text(font, f"Mode: {game_mode}", mode_color)
         mode_rect = mode_text.get_rect(topright=(width - 20, 35))
         screen.blit(mode_text, mode_rect)
 
+    # Show adaptive quality level and its last decision (profiler overlay)
+    if quality is not None:
+        quality_text = _render_text(font, f"Quality: {quality.settings['name']} (p{quality.percentile} {quality.last_percentile_ms:.1f}ms)", HUD_LABEL_COLOR)
+        screen.blit(quality_text, quality_text.get_rect(topright=(width - 20, 60)))
+        if quality.last_decision:
+            decision_text = _render_text(_hud_cache['key_font'] or font, quality.last_decision, HUD_LABEL_COLOR)
+            screen.blit(decision_text, decision_text.get_rect(topright=(width - 20, 85)))
+
     # --- Active Events Display (Top HUD, Left) ---
     if active_events:
         event_y = 50
@@ -172,7 +208,7 @@ def draw_hud(screen, player, fps=None, game_mode=None, active_events=None, event
                 'enemy_weakness': 'Enemy Weakness'
             }.get(event['type'], event['type'].title())
             
-            event_text = font.render(f"{event_name} ({time_str})", True, event_color)
+            event_text = _render_text(font, f"{event_name} ({time_str})", event_color)
             screen.blit(event_text, (20, event_y))
             event_y += 25
 
@@ -216,9 +252,9 @@ def draw_hud(screen, player, fps=None, game_mode=None, active_events=None, event
                     event_color = (255, 100, 255)
                 
                 # Render with alpha
-                notification_font = pygame.font.SysFont(None, 36)
-                text_surface = notification_font.render(notification_text, True, event_color)
-                text_surface.set_alpha(alpha)
+                if _hud_cache['notification_font'] is None:
+                    _hud_cache['notification_font'] = pygame.font.SysFont(None, 36)
+                text_surface = _render_text(_hud_cache['notification_font'], notification_text, event_color, alpha)
                 
                 # Draw background with alpha
                 bg_rect = text_surface.get_rect(center=(notification_x, notification_y))
@@ -2,12 +2,34 @@ import pygame
 from abc import ABC, abstractmethod
 
 class Skill(ABC):
-    def __init__(self, user, cooldown=0.5):
+    def __init__(self, user, definition):
         self.user = user
-        self.cooldown = cooldown
+        self.definition = definition
+        self.name = definition.name
+        self.cooldown = definition.cooldown
+        self.targeting = definition.targeting
+        self.is_movement_skill = definition.movement
+        # Set when added to a SkillBook, which then owns the cooldown and active flag
+        self.book = None
+        self.slot = -1
         self.last_used = -float('inf')
-        self.active = False
+        self._active = False
         self.animation_frame = 0
+        self.particles = None  # ParticleSystem for visual effects, attached by the Game
+        self.tiles = None  # TileCollider for skills that move their user, attached by the Game
+
+    @property
+    def active(self):
+        if self.book is None:
+            return self._active
+        return bool(self.book.active[self.slot])
+
+    @active.setter
+    def active(self, value):
+        if self.book is None:
+            self._active = value
+        else:
+            self.book.active[self.slot] = value
 
     @abstractmethod
     def use(self, target_pos=None):
@@ -22,4 +44,11 @@ class Skill(ABC):
         pass
 
     def can_use(self, now):
+        if self.book is not None:
+            return self.book.remaining[self.slot] <= 0
         return (now - self.last_used) >= self.cooldown
+
+    def start_cooldown(self, now):
+        self.last_used = now
+        if self.book is not None:
+            self.book.remaining[self.slot] = self.cooldown
@@ -0,0 +1,49 @@
+"""
+Per-user skill set with array-backed cooldowns.
+"""
+import numpy as np
+
+
+class SkillBook(dict):
+    """
+    A user's skills by name. Remaining cooldowns and active flags live in
+    arrays indexed by each skill's slot, so tick() advances every cooldown in
+    one operation and ready() is a single mask however many skills there are.
+    """
+    def __init__(self, skills=()):
+        super().__init__()
+        self.slots = []  # Skills in slot order
+        self.remaining = np.zeros(0, dtype=np.float64)  # Seconds until ready
+        self.active = np.zeros(0, dtype=bool)
+        self.movement = np.zeros(0, dtype=bool)  # Movement skills are never auto-cast
+        for skill in skills:
+            self.add(skill)
+
+    def add(self, skill):
+        active = skill.active
+        skill.book = self
+        skill.slot = len(self.slots)
+        self.slots.append(skill)
+        self.remaining = np.append(self.remaining, 0.0)
+        self.active = np.append(self.active, active)
+        self.movement = np.append(self.movement, skill.is_movement_skill)
+        self[skill.name] = skill
+        return skill
+
+    def tick(self, dt):
+        """Advance every cooldown by dt."""
+        remaining = self.remaining
+        remaining -= dt
+        np.maximum(remaining, 0.0, out=remaining)
+
+    def ready(self):
+        """Mask of skills whose cooldown has run out."""
+        return self.remaining <= 0
+
+    def pressed(self, controls):
+        """Mask of skills the input source holds down this tick."""
+        return np.fromiter((controls.is_skill_pressed(skill.name) for skill in self.slots),
+                           dtype=bool, count=len(self.slots))
+
+    def cooldown_left(self, name):
+        return float(self.remaining[self[name].slot])
@@ -0,0 +1,80 @@
+import pygame
+from skills.base import Skill
+from rendering.audio import play_sound
+from core.clock import game_clock
+from systems.animation import AnimationClip, Animator, ONCE
+
+BURST_RING_FRAMES = 6
+BURST_RING_COLOR = (140, 200, 255, 200)
+BURST_RING_WIDTH = 4
+
+class BurstSkill(Skill):
+    """Hits every enemy inside a circle around the user; an expanding ring plays over the cast time."""
+    # Ring frames per radius
+    _ring_cache = {}
+
+    def __init__(self, user, definition):
+        super().__init__(user, definition)
+        self.radius = definition.shape.get('radius', definition.range)
+        self.duration = definition.cast_time
+        frames = BurstSkill._ring_cache.get(self.radius)
+        if frames is None:
+            frames = BurstSkill._ring_cache[self.radius] = self._ring_frames(self.radius)
+        clip = AnimationClip(frames, self.duration / BURST_RING_FRAMES, ONCE)
+        self.animator = Animator({'burst': clip}, on_complete=self._on_burst_end)
+        self.active = False
+        self.center = None
+        self._pending_hit = False
+
+    @staticmethod
+    def _ring_frames(radius):
+        frames = []
+        size = radius * 2 + BURST_RING_WIDTH
+        for i in range(BURST_RING_FRAMES):
+            frame = pygame.Surface((size, size), pygame.SRCALPHA)
+            ring_radius = max(BURST_RING_WIDTH, int(radius * (i + 1) / BURST_RING_FRAMES))
+            pygame.draw.circle(frame, BURST_RING_COLOR, (size // 2, size // 2), ring_radius, BURST_RING_WIDTH)
+            frames.append(frame)
+        return frames
+
+    def use(self, target_pos=None):
+        now = game_clock.now()
+        if not self.can_use(now):
+            return False
+        self.start_cooldown(now)
+        self.active = True
+        self.center = (int(self.user.x), int(self.user.y))
+        self._pending_hit = True
+        self.animator.play('burst', now)
+        return True
+
+    def update(self, dt, entities):
+        if not self.active:
+            return
+        if self._pending_hit:
+            # The whole area is hit once, on the first update after the cast
+            self._pending_hit = False
+            damage = self.definition.damage_for(self.user)
+            cx, cy = self.center
+            reach_sq = self.radius * self.radius
+            hit = False
+            for entity in entities:
+                if entity is self.user or not entity.alive:
+                    continue
+                ex, ey = entity.rect.center
+                if (ex - cx) ** 2 + (ey - cy) ** 2 <= reach_sq:
+                    entity.take_damage(damage)
+                    hit = True
+            if hit:
+                play_sound('hit')
+        self.animator.update(game_clock.now())
+
+    def _on_burst_end(self, name):
+        self.active = False
+
+    def draw(self, surface, last_move=(1,0)):
+        if not self.active:
+            return
+        frame = self.animator.frame(game_clock.now())
+        if frame is not None:
+            surface.blit(frame, frame.get_rect(center=self.center))
@@ -1,18 +1,14 @@
-import pygame
 import math
 import os
 from skills.base import Skill
-
-DASH_RANGE = 100
-DASH_COOLDOWN = 2.0
-DASH_DURATION = 0.15  # seconds
+from core.clock import game_clock
+from config import PLAYER_COLLIDER_RADIUS
 
 class DashSkill(Skill):
-    is_movement_skill = True
-    def __init__(self, user, cooldown=DASH_COOLDOWN, dash_range=DASH_RANGE, duration=DASH_DURATION):
-        super().__init__(user, cooldown)
-        self.dash_range = dash_range
-        self.duration = duration
+    def __init__(self, user, definition):
+        super().__init__(user, definition)
+        self.dash_range = definition.range
+        self.duration = definition.cast_time
         self.active = False
         self.dash_vector = (0, 0)
         self.dash_start = None
@@ -20,10 +16,10 @@ class DashSkill(Skill):
         self.elapsed = 0.0
 
     def use(self, target_pos=None):
-        now = pygame.time.get_ticks() / 1000
+        now = game_clock.now()
         if not self.can_use(now):
             return False
-        self.last_used = now
+        self.start_cooldown(now)
         self.active = True
         self.elapsed = 0.0
         # Use WASD movement direction for dash
@@ -47,15 +43,21 @@ class DashSkill(Skill):
         # Linear interpolation from start to end
         new_x = self.dash_start[0] + (self.dash_end[0] - self.dash_start[0]) * t
         new_y = self.dash_start[1] + (self.dash_end[1] - self.dash_start[1]) * t
+        if self.tiles is not None:
+            # Rock stops the dash (sliding along its face)
+            new_x, new_y = self.tiles.slide(self.user.x, self.user.y, new_x, new_y, PLAYER_COLLIDER_RADIUS)
         self.user.x = new_x
         self.user.y = new_y
         self.user.position = (new_x, new_y)
         self.user.rect.center = (int(new_x), int(new_y))
+        # Trail is emitted as particles and drawn by the particle system
+        if self.particles is not None:
+            self.particles.emit('dash', new_x, new_y)
         if t >= 1.0:
             self.active = False
 
     def draw(self, surface, last_move=(1,0)):
-        # Optionally, draw a dash effect (e.g., a trail or afterimage)
+        # Dash trail is drawn by the particle system (see update)
         pass
 
     def can_use(self, now):
@@ -1,11 +1,143 @@
+"""
+Data-driven skill registry.
+Loads skill definitions (cooldown, cast time, hit shape, damage scaling,
+targeting rule) from JSON, validates them and resolves the class that
+implements each skill.
+"""
+import importlib
+import json
+import os
+from config import SKILL_DATA_PATH
 
-from skills.slash import SlashSkill
-from skills.dash import DashSkill
+# How a skill picks its target point (resolved once per tick by skills/targeting.py);
+# priority prefers elites over closer regular enemies
+TARGETING_RULES = ('aim', 'nearest_enemy', 'nearest_in_range', 'priority')
 
-SKILL_REGISTRY = {
-    'slash': SlashSkill,
-    'dash': DashSkill,
+# field: (accepted types, default or _REQUIRED)
+_REQUIRED = object()
+_FIELDS = {
+    'class': ((str,), _REQUIRED),
+    'cooldown': ((int, float), _REQUIRED),
+    'cast_time': ((int, float), 0.0),
+    'targeting': ((str,), 'nearest_enemy'),
+    'movement': ((bool,), False),
+    'shape': ((dict,), None),
+    'range': ((int, float), 0),
+    'damage': ((int, float), 0),
+    'damage_scaling': ((dict,), None),
 }
 
+
+class SkillDefinition:
+    """
+    One validated skill declaration.
+    Calling it with a user builds the skill (so it stands in for a skill class).
+    """
+    def __init__(self, name, skill_cls, cooldown, cast_time=0.0, targeting='nearest_enemy', movement=False,
+                 shape=None, range=0, damage=0, damage_scaling=None):
+        self.name = name
+        self.skill_cls = skill_cls
+        self.cooldown = cooldown
+        self.cast_time = cast_time
+        self.targeting = targeting
+        self.movement = movement
+        self.shape = shape or {}
+        self.range = range
+        self.damage = damage
+        # user attribute -> damage added per point (e.g. {'barrier': 0.25})
+        self.damage_scaling = damage_scaling or {}
+
+    def damage_for(self, user):
+        """Base damage plus the scaled user stats."""
+        return self.damage + sum(coef * getattr(user, stat, 0) for stat, coef in self.damage_scaling.items())
+
+    def __call__(self, user):
+        return self.skill_cls(user, self)
+
+
+class SkillRegistry:
+    """Holds every SkillDefinition by name."""
+    def __init__(self):
+        self._by_name = {}
+
+    def load(self, path):
+        """Load, validate and register every definition in a JSON file."""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: expected an object mapping skill names to definitions")
+        for name, definition in data.items():
+            self.register(name, definition)
+        return self
+
+    def register(self, name, definition):
+        if name in self._by_name:
+            raise ValueError(f"Skill '{name}' is already registered")
+        fields = _validate(name, definition)
+        skill_cls = _resolve_class(name, fields.pop('class'))
+        skill_def = SkillDefinition(name, skill_cls, **fields)
+        self._by_name[name] = skill_def
+        return skill_def
+
+    def get(self, name):
+        return self._by_name.get(name)
+
+    def all(self):
+        return list(self._by_name.values())
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __len__(self):
+        return len(self._by_name)
+
+
+def _validate(name, definition):
+    if not isinstance(definition, dict):
+        raise ValueError(f"Skill '{name}': definition must be an object")
+    unknown = set(definition) - set(_FIELDS)
+    if unknown:
+        raise ValueError(f"Skill '{name}': unknown fields {sorted(unknown)}")
+    fields = {}
+    for field, (types, default) in _FIELDS.items():
+        if field not in definition:
+            if default is _REQUIRED:
+                raise ValueError(f"Skill '{name}': missing required field '{field}'")
+            fields[field] = default
+            continue
+        value = definition[field]
+        # bool is an int subclass; only accept it where a bool is expected
+        if (isinstance(value, bool) and bool not in types) or not isinstance(value, types):
+            raise ValueError(f"Skill '{name}': field '{field}' has invalid type {type(value).__name__}")
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value < 0:
+            raise ValueError(f"Skill '{name}': field '{field}' must not be negative")
+        fields[field] = value
+    if fields['targeting'] not in TARGETING_RULES:
+        raise ValueError(f"Skill '{name}': targeting must be one of {list(TARGETING_RULES)}")
+    for stat, coef in (fields['damage_scaling'] or {}).items():
+        if isinstance(coef, bool) or not isinstance(coef, (int, float)):
+            raise ValueError(f"Skill '{name}': damage scaling for '{stat}' must be a number")
+    return fields
+
+
+def _resolve_class(name, dotted_path):
+    module_name, _, cls_name = dotted_path.rpartition('.')
+    try:
+        return getattr(importlib.import_module(module_name), cls_name)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise ValueError(f"Skill '{name}': cannot resolve class '{dotted_path}': {e}")
+
+
+def load_skill_registry(path=SKILL_DATA_PATH):
+    """Build a registry from a data file (relative paths resolve against the project root)."""
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(__file__), '..', path)
+    return SkillRegistry().load(path)
+
+
+SKILL_REGISTRY = load_skill_registry()
+
+
 def get_skill(name):
+    """The SkillDefinition for name (call it with a user to build the skill), or None."""
     return SKILL_REGISTRY.get(name)
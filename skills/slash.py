@@ -3,67 +3,90 @@ import pygame
 import math
 import os
 from skills.base import Skill
+from rendering.audio import play_sound
+from core.clock import game_clock
+from systems.animation import AnimationClip, Animator, ONCE, load_strip
 
 SLASH_SHEET_PATH = os.path.join('resources', 'images', 'player_melee', 'slash', 'player_melee_slash.png')
 SLASH_FRAME_COUNT = 5
+SLASH_ROTATION_STEP = 3  # Degrees between cached rotations of the slash frames
 
 class SlashSkill(Skill):
     # Class-level cache for frames
     _cached_frames = None
+    # (frame, rotation step) -> rotated frame; the same surfaces come back every swing,
+    # so rotating is a dict lookup and the render scale's downscale cache stays warm
+    _rotations = {}
 
-    def __init__(self, user, cooldown=0.5, damage=10, arc_deg=190, duration=0.25):
-        super().__init__(user, cooldown)
-        self.damage = damage
-        self.arc_deg = arc_deg
-        self.duration = duration
+    def __init__(self, user, definition):
+        super().__init__(user, definition)
+        self.damage = definition.damage
+        self.arc_deg = definition.shape.get('arc_deg', 190)
+        self.duration = duration = definition.cast_time
         # Use class-level cache for frames
         if SlashSkill._cached_frames is None:
             SlashSkill._cached_frames = self._load_frames()
         self.frames = SlashSkill._cached_frames
         self.total_frames = len(self.frames)
         self.frame_time = duration / max(1, self.total_frames)
+        # One swing is a one-shot clip; its completion event ends the slash
+        clip = AnimationClip(self.frames, self.frame_time, ONCE)
+        self.animator = Animator({'slash': clip}, on_complete=self._on_swing_end)
         self.active = False
-        self.animation_frame = 0
         self.hit_entities = set()
         self.start_angle = None
         self.end_angle = None
         self.center = None
 
     def _load_frames(self):
-        frames = []
         if not os.path.exists(SLASH_SHEET_PATH):
-            return frames
-        sheet = pygame.image.load(SLASH_SHEET_PATH).convert_alpha()
-        sheet_width, sheet_height = sheet.get_width(), sheet.get_height()
-        frame_width = sheet_width // SLASH_FRAME_COUNT
-        for i in range(SLASH_FRAME_COUNT):
-            frame = sheet.subsurface((i * frame_width, 0, frame_width, sheet_height))
-            frames.append(frame)
-        return frames
+            return []
+        return load_strip(SLASH_SHEET_PATH, count=SLASH_FRAME_COUNT)
 
     def use(self, target_pos=None):
-        now = pygame.time.get_ticks() / 1000
+        now = game_clock.now()
         if not self.can_use(now):
             return False
-        self.last_used = now
+        self.start_cooldown(now)
+        self.damage = self.definition.damage_for(self.user)
         self.active = True
-        self.animation_frame = 0
+        self.animator.play('slash', now)
         self.hit_entities.clear()
         # Calculate arc center and angles
         self.center = self.user.rect.center
-        self.target_pos = target_pos if target_pos else pygame.mouse.get_pos()
+        self.target_pos = target_pos if target_pos else self._facing_point()
         dx, dy = self.target_pos[0] - self.center[0], self.target_pos[1] - self.center[1]
         angle = math.degrees(math.atan2(dy, dx)) % 360
         self.start_angle = (angle - self.arc_deg / 2) % 360
         self.end_angle = (angle + self.arc_deg / 2) % 360
         return True
 
+    @staticmethod
+    def _rotated(frame, angle):
+        """frame rotated to face angle (degrees, 0 = right), to the nearest SLASH_ROTATION_STEP."""
+        step = round(angle / SLASH_ROTATION_STEP) % (360 // SLASH_ROTATION_STEP)
+        key = (frame, step)
+        rotated = SlashSkill._rotations.get(key)
+        if rotated is None:
+            # Sprite faces right (0°) by default, so rotate by -angle
+            rotated = SlashSkill._rotations[key] = pygame.transform.rotate(frame, -step * SLASH_ROTATION_STEP)
+        return rotated
+
+    def _facing_point(self):
+        """Point just ahead of the user along its last movement (used when no target is given)."""
+        cx, cy = self.user.rect.center
+        dx, dy = getattr(self.user, 'last_move', (1, 0))
+        return (cx + dx * PLAYER_SIZE, cy + dy * PLAYER_SIZE)
+
     def update(self, dt, entities):
         if not self.active:
             return
-        self.animation_frame += dt / self.frame_time
-        if self.animation_frame >= self.total_frames:
-            self.active = False
+        if not self.frames:
+            # No sprite means no hitbox; the swing ends at once
+            self._on_swing_end('slash')
+            return
+        self.animator.update(game_clock.now())
+        if not self.active:
             return
         # Hit detection
         for entity in entities:
@@ -72,24 +95,27 @@ class SlashSkill(Skill):
             if self._in_slash_arc(entity):
                 entity.take_damage(self.damage)
                 self.hit_entities.add(entity)
+                play_sound('hit')  # Coalesced: one voice however many enemies are hit
+
+    def _on_swing_end(self, name):
+        self.active = False
+        # Drop references to the enemies hit (they may be dead and pooled by now)
+        self.hit_entities.clear()
 
     def draw(self, surface, last_move=(1,0)):
         if not self.active or not self.frames:
             return
-        # Calculate current frame index
-        frame_idx = min(int(self.animation_frame), self.total_frames - 1)
-        frame = self.frames[frame_idx]
+        frame = self.animator.frame(game_clock.now())
         # Always face the target_pos direction and rotate the sprite
         if not hasattr(self, 'target_pos') or self.target_pos is None:
-            self.target_pos = pygame.mouse.get_pos()
+            self.target_pos = self._facing_point()
         if hasattr(self.user, 'x') and hasattr(self.user, 'y'):
             px, py = int(self.user.x), int(self.user.y)
         else:
             px, py = self.user.rect.center
         dx, dy = self.target_pos[0] - px, self.target_pos[1] - py
         angle = math.degrees(math.atan2(dy, dx)) % 360
-        # Sprite faces right (0°) by default, so rotate by -angle
-        draw_frame = pygame.transform.rotate(frame, -angle)
+        draw_frame = self._rotated(frame, angle)
         # Offset: place slash just next to player in target direction
         offset_dist = PLAYER_SIZE // 2 + 4
         norm = math.hypot(dx, dy)
@@ -104,10 +130,9 @@ class SlashSkill(Skill):
 
     def _in_slash_arc(self, entity):
         # Use the current slash sprite's rect as the hitbox, placed by target_pos
-        frame_idx = min(int(self.animation_frame), self.total_frames - 1)
-        frame = self.frames[frame_idx]
+        frame = self.animator.frame(game_clock.now())
         if not hasattr(self, 'target_pos') or self.target_pos is None:
-            self.target_pos = pygame.mouse.get_pos()
+            self.target_pos = self._facing_point()
         if hasattr(self.user, 'x') and hasattr(self.user, 'y'):
             px, py = int(self.user.x), int(self.user.y)
         else:
@@ -121,7 +146,6 @@ class SlashSkill(Skill):
         offset_x = int(px + dir_x * offset_dist)
         offset_y = int(py + dir_y * offset_dist)
         angle = math.degrees(math.atan2(dy, dx)) % 360
-        draw_frame = pygame.transform.rotate(frame, -angle)
-        rect = draw_frame.get_rect(center=(offset_x, offset_y))
+        rect = self._rotated(frame, angle).get_rect(center=(offset_x, offset_y))
         hit = rect.colliderect(entity.rect)
         return hit
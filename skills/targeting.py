@@ -0,0 +1,108 @@
+"""
+Per-tick target acquisition for skills.
+"""
+import numpy as np
+from config import TARGET_SEARCH_RADIUS, TARGET_MAX_SEARCH_RADIUS, TARGET_SWITCH_RATIO, TARGET_ELITE_PRIORITY
+
+
+class TargetAcquisition:
+    """
+    Living targets around the user, gathered once per tick from the shared
+    enemy spatial index (the search radius doubles while it comes up empty,
+    up to max_radius) and served to every skill that fires that tick:
+    nearest, k-nearest and highest-priority. The nearest target persists
+    across ticks and only changes when another enemy is closer by more than
+    switch_ratio, so auto-aim doesn't flip between equidistant enemies.
+    """
+    def __init__(self, index, radius=TARGET_SEARCH_RADIUS, switch_ratio=TARGET_SWITCH_RATIO,
+                 max_radius=TARGET_MAX_SEARCH_RADIUS):
+        self.index = index
+        self.radius = radius
+        self.max_radius = max(radius, max_radius)
+        self.switch_ratio = switch_ratio
+        self.current = None  # Target kept between ticks (hysteresis)
+        self.user = None
+        self.aim = None
+        self.auto_aim = False
+        self._candidates = None  # (enemies sorted by distance, squared distances), computed on first use
+
+    def begin_tick(self, user, aim, auto_aim):
+        """Start a new tick: drop the memo."""
+        self.user = user
+        self.aim = aim
+        self.auto_aim = auto_aim
+        self._candidates = None
+
+    def reset(self):
+        self.current = None
+        self._candidates = None
+
+    def _gather(self):
+        if self._candidates is None:
+            x, y = self.user.x, self.user.y
+            radius = self.radius
+            found = [enemy for enemy in self.index.query_radius(x, y, radius) if enemy.alive]
+            # Nothing close by: widen the search ring by ring, never scanning the whole population
+            while not found and radius < self.max_radius:
+                radius = min(radius * 2, self.max_radius)
+                found = [enemy for enemy in self.index.query_radius(x, y, radius) if enemy.alive]
+            n = len(found)
+            ex = np.fromiter((enemy.position[0] for enemy in found), dtype=np.float64, count=n)
+            ey = np.fromiter((enemy.position[1] for enemy in found), dtype=np.float64, count=n)
+            dist_sq = (ex - x) ** 2 + (ey - y) ** 2
+            order = np.argsort(dist_sq, kind='stable')
+            self._candidates = ([found[i] for i in order.tolist()], dist_sq[order])
+        return self._candidates
+
+    def nearest(self):
+        """The nearest living enemy (kept from earlier ticks unless clearly beaten) and its squared distance."""
+        found, dist_sq = self._gather()
+        if not found:
+            self.current = None
+            return None, float('inf')
+        best, best_sq = found[0], float(dist_sq[0])
+        current = self.current
+        if current is not None and current is not best and current.alive:
+            try:
+                i = found.index(current)
+            except ValueError:
+                i = -1
+            # Keep the current target unless the new one is meaningfully closer
+            if i >= 0 and best_sq >= float(dist_sq[i]) * self.switch_ratio * self.switch_ratio:
+                return current, float(dist_sq[i])
+        self.current = best
+        return best, best_sq
+
+    def k_nearest(self, k):
+        """Up to k living enemies, closest first."""
+        return self._gather()[0][:k]
+
+    def highest_priority(self):
+        """The living enemy with the best priority: elites weigh TARGET_ELITE_PRIORITY times more, then closeness."""
+        found, dist_sq = self._gather()
+        if not found:
+            return None, float('inf')
+        weight = np.fromiter((TARGET_ELITE_PRIORITY if enemy.elite else 1.0 for enemy in found),
+                             dtype=np.float64, count=len(found))
+        i = int(np.argmax(weight / (1.0 + np.sqrt(dist_sq))))
+        return found[i], float(dist_sq[i])
+
+    def resolve(self, skill):
+        """Target point for skill by its targeting rule, or None to hold the skill."""
+        rule = skill.targeting
+        # Without auto aim, enemy-seeking skills go where the player aims
+        if rule == 'aim' or (rule in ('nearest_enemy', 'priority') and not self.auto_aim):
+            return self.aim
+        if rule == 'priority':
+            enemy, dist_sq = self.highest_priority()
+        elif rule == 'nearest_in_range':
+            # Range checks go by the true nearest, not the persistent target
+            found, dists = self._gather()
+            enemy, dist_sq = (found[0], float(dists[0])) if found else (None, float('inf'))
+        else:
+            enemy, dist_sq = self.nearest()
+        if enemy is None:
+            return None
+        if rule == 'nearest_in_range' and dist_sq > skill.definition.range ** 2:
+            return None
+        return enemy.rect.center
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Long-run soak test.
+Runs one headless game for a long simulated duration with an immortal bot
+player, samples tracemalloc snapshots and live object counts per type at
+intervals and tracks tick-time drift. Exits non-zero with the top growing
+allocation sites when memory or tick time keeps climbing.
+
+    python soak_test.py --duration 3600 --enemies 400
+
+The live enemy count is held at SOAK_ENEMY_CAP by default, so tick-time
+drift measures slowdown at a steady population rather than wave growth;
+--enemies 0 lets the waves grow unchecked.
+
+tracemalloc slows ticks down several times over; --trace-frames 0 turns it
+off and judges memory by interpreter-allocated blocks and object counts only.
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+from config import (
+    SOAK_WARMUP, SOAK_SAMPLE_INTERVAL, SOAK_MAX_MEMORY_GROWTH_MB, SOAK_MAX_BLOCK_GROWTH, SOAK_MAX_TICK_DRIFT,
+    SOAK_TOP_ALLOCATIONS, SOAK_ENEMY_CAP
+)
+from core.game_modes import GAME_MODES
+from core.bot import POLICIES
+from core.headless import HeadlessRun
+
+# Allocations made by the measuring itself
+_TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+class SoakSample:
+    """Memory, object counts and tick time at one point of the run."""
+    def __init__(self, sim_time, snapshot, objects, tick_ms, enemies):
+        self.sim_time = sim_time
+        self.snapshot = snapshot  # None when tracing is off
+        self.objects = objects
+        self.tick_ms = tick_ms  # Mean tick time over the interval ending here (None for the baseline)
+        self.enemies = enemies
+        self.blocks = sys.getallocatedblocks()
+        self.traced_mb = 0.0
+        if snapshot is not None:
+            self.traced_mb = sum(stat.size for stat in snapshot.statistics('filename')) / (1024 * 1024)
+
+
+def _take_sample(run):
+    gc.collect()
+    snapshot = None
+    if tracemalloc.is_tracing():
+        snapshot = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+    objects = Counter(type(obj).__name__ for obj in gc.get_objects())
+    tick_ms = sum(run.tick_ms) / len(run.tick_ms) if run.tick_ms else None
+    # Tick times are consumed per interval so the harness itself doesn't grow
+    run.tick_ms.clear()
+    return SoakSample(run.ticks * run.dt, snapshot, objects, tick_ms, len(run.logic.enemies))
+
+
+def _advance(run, seconds):
+    for _ in range(int(round(seconds / run.dt))):
+        run.step()
+
+
+def soak(mode='Normal', seed=0, policy='kite', duration=3600.0, enemy_cap=SOAK_ENEMY_CAP,
+         warmup=SOAK_WARMUP, interval=SOAK_SAMPLE_INTERVAL, trace_frames=1):
+    """Run the soak and return (baseline, samples after warmup)."""
+    if trace_frames > 0:
+        tracemalloc.start(trace_frames)
+    try:
+        run = HeadlessRun(mode, seed, policy, immortal=True, enemy_cap=enemy_cap)
+        _advance(run, warmup)
+        baseline = _take_sample(run)
+        baseline.tick_ms = None
+        print(f"[SOAK] baseline t={baseline.sim_time:.0f}s traced={baseline.traced_mb:.1f}MB "
+              f"blocks={baseline.blocks} enemies={baseline.enemies}")
+        samples = []
+        while run.ticks * run.dt < warmup + duration:
+            _advance(run, min(interval, warmup + duration - run.ticks * run.dt))
+            sample = _take_sample(run)
+            samples.append(sample)
+            # Only the baseline and the latest snapshot are needed for the diff
+            if len(samples) > 1:
+                samples[-2].snapshot = None
+            print(f"[SOAK] t={sample.sim_time:.0f}s traced={sample.traced_mb:.1f}MB "
+                  f"({sample.traced_mb - baseline.traced_mb:+.2f}) blocks={sample.blocks} "
+                  f"({sample.blocks - baseline.blocks:+d}) tick={sample.tick_ms:.2f}ms "
+                  f"enemies={sample.enemies} objects={sum(sample.objects.values())}")
+        return baseline, samples
+    finally:
+        tracemalloc.stop()
+
+
+def check(baseline, samples, max_growth_mb=SOAK_MAX_MEMORY_GROWTH_MB, max_drift=SOAK_MAX_TICK_DRIFT,
+          max_blocks=SOAK_MAX_BLOCK_GROWTH):
+    """Return a list of failure messages (empty when the run is healthy)."""
+    failures = []
+    if not samples:
+        return failures
+    last = samples[-1]
+    growth = last.traced_mb - baseline.traced_mb
+    if growth > max_growth_mb:
+        failures.append(f"traced memory grew {growth:.2f}MB after warmup (limit {max_growth_mb:.2f}MB)")
+    blocks = last.blocks - baseline.blocks
+    # With tracing on, the retained snapshots themselves account for many blocks
+    if baseline.snapshot is None and blocks > max_blocks:
+        failures.append(f"allocated blocks grew by {blocks} after warmup (limit {max_blocks})")
+    if len(samples) > 1 and samples[0].tick_ms:
+        drift = last.tick_ms / samples[0].tick_ms
+        if drift > max_drift:
+            failures.append(f"mean tick time drifted {samples[0].tick_ms:.2f}ms -> {last.tick_ms:.2f}ms "
+                            f"(x{drift:.2f}, limit x{max_drift:.2f})")
+    return failures
+
+
+def report_growth(baseline, last, top=SOAK_TOP_ALLOCATIONS):
+    """Print the allocation sites and object types that grew the most since the baseline."""
+    if last.snapshot is not None:
+        print("[SOAK] Top growing allocation sites:")
+        for stat in last.snapshot.compare_to(baseline.snapshot, 'lineno')[:top]:
+            if stat.size_diff <= 0:
+                break
+            frame = stat.traceback[0]
+            print(f"  {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  {frame.filename}:{frame.lineno}")
+    print("[SOAK] Top growing object types:")
+    grown = last.objects.copy()
+    grown.subtract(baseline.objects)
+    for name, diff in grown.most_common(top):
+        if diff <= 0:
+            break
+        print(f"  {diff:+10d}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a long headless game and fail on memory or tick-time growth.")
+    parser.add_argument('--mode', default='Normal', choices=list(GAME_MODES))
+    parser.add_argument('--policy', default='kite', choices=list(POLICIES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--duration', type=float, default=3600.0, help="Simulated seconds after warmup")
+    parser.add_argument('--enemies', type=int, default=SOAK_ENEMY_CAP,
+                        help="Hold the live enemy count at this ceiling (0 for no ceiling)")
+    parser.add_argument('--warmup', type=float, default=SOAK_WARMUP)
+    parser.add_argument('--interval', type=float, default=SOAK_SAMPLE_INTERVAL)
+    parser.add_argument('--max-growth-mb', type=float, default=SOAK_MAX_MEMORY_GROWTH_MB)
+    parser.add_argument('--max-blocks', type=int, default=SOAK_MAX_BLOCK_GROWTH)
+    parser.add_argument('--max-drift', type=float, default=SOAK_MAX_TICK_DRIFT)
+    parser.add_argument('--trace-frames', type=int, default=1,
+                        help="Traceback depth kept per allocation (0 disables tracemalloc)")
+    args = parser.parse_args()
+
+    # Sprites and sounds are loaded by relative path
+    os.chdir(REPO_DIR)
+    start = time.perf_counter()
+    baseline, samples = soak(args.mode, args.seed, args.policy, args.duration, args.enemies or None,
+                             args.warmup, args.interval, args.trace_frames)
+    print(f"[SOAK] {args.duration:.0f}s simulated in {time.perf_counter() - start:.1f}s")
+    failures = check(baseline, samples, args.max_growth_mb, args.max_drift, args.max_blocks)
+    if samples:
+        report_growth(baseline, samples[-1])
+    if failures:
+        for failure in failures:
+            print(f"[SOAK] FAIL: {failure}")
+        sys.exit(1)
+    print("[SOAK] OK")
+
+
+if __name__ == '__main__':
+    main()
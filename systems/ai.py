@@ -1,6 +1,34 @@
 """
 Enemy AI logic.
 """
-def run_enemy_ai(enemy, game_state):
-    # AI decision making
-    pass
+def run_enemy_ai(enemy, game_state, stop_distance=0.0):
+    """
+    Return the movement direction for an enemy this tick.
+
+    Follows the shared flow field toward the player (falling back to a
+    straight line in open areas or once in the player's cell), stops pulling
+    inside stop_distance, and blends in the crowd separation vector
+    (enemy.steer). The result has length <= 1.
+    """
+    player = game_state.player
+    x, y = enemy.position
+    dx = player.position[0] - x
+    dy = player.position[1] - y
+    dist_sq = dx * dx + dy * dy
+    move_x, move_y = enemy.steer
+    if dist_sq > stop_distance * stop_distance:
+        flow = game_state.flow_field
+        fx, fy = flow.direction_at(x, y) if flow.has_obstacles else (0.0, 0.0)
+        if fx or fy:
+            move_x += fx
+            move_y += fy
+        else:
+            dist = dist_sq ** 0.5
+            move_x += dx / dist
+            move_y += dy / dist
+    norm_sq = move_x * move_x + move_y * move_y
+    if norm_sq > 1.0:
+        norm = norm_sq ** 0.5
+        move_x /= norm
+        move_y /= norm
+    return move_x, move_y
@@ -0,0 +1,219 @@
+"""
+Sprite animation clips.
+An AnimationClip maps time since the clip started to a frame index through a
+lookup table built once per clip, so nothing steps per-entity frame timers.
+Single objects (player, skills) play clips through an Animator; ECS entities
+store a clip id and start timestamp in their Animation component and
+animation_system derives every frame index in one vectorized pass.
+"""
+import numpy as np
+import pygame
+from config import ANIMATION_LUT_RATE
+from core.clock import game_clock
+from entities.components import Animation, Handle
+
+# Playback modes
+LOOP = 'loop'  # Wrap around forever
+ONCE = 'once'  # Play through once, then raise a completion event (stays on the last frame)
+HOLD = 'hold'  # Play through once and stay on the last frame without completing
+
+
+class AnimationClip:
+    """
+    Frames with per-frame durations and a playback mode.
+    frame_time is one duration for every frame or a sequence with one per
+    frame. frames may hold anything (surfaces, per-direction rows, or nothing
+    when sprites are missing); count defaults to len(frames).
+    """
+    def __init__(self, frames, frame_time, mode=LOOP, count=None):
+        self.frames = frames
+        self.mode = mode
+        self.count = max(1, len(frames) if count is None else count)
+        durations = np.broadcast_to(np.asarray(frame_time, dtype=np.float64), (self.count,))
+        ends = np.cumsum(durations)
+        self.duration = float(ends[-1])
+        # Frame index at the middle of each 1/ANIMATION_LUT_RATE step (midpoints keep
+        # frame boundaries that fall exactly on a step from rounding either way)
+        steps = max(1, int(round(self.duration * ANIMATION_LUT_RATE)))
+        samples = (np.arange(steps) + 0.5) / ANIMATION_LUT_RATE
+        self.table = np.minimum(np.searchsorted(ends, samples, side='right'), self.count - 1).astype(np.int16)
+
+    def index(self, elapsed):
+        """Frame index elapsed seconds into the clip."""
+        step = int(elapsed * ANIMATION_LUT_RATE) if elapsed > 0 else 0
+        steps = len(self.table)
+        if self.mode == LOOP:
+            step %= steps
+        elif step >= steps:
+            step = steps - 1
+        return int(self.table[step])
+
+    def indices(self, elapsed):
+        """Vectorized index() over an array of elapsed times."""
+        steps = np.maximum(elapsed * ANIMATION_LUT_RATE, 0).astype(np.int64)
+        if self.mode == LOOP:
+            steps %= len(self.table)
+        else:
+            np.minimum(steps, len(self.table) - 1, out=steps)
+        return self.table[steps]
+
+    def finished(self, elapsed):
+        """True once a ONCE clip has played through (LOOP and HOLD clips never finish)."""
+        return self.mode == ONCE and elapsed >= self.duration
+
+    def frame(self, elapsed):
+        """The frame to show elapsed seconds into the clip, or None without frames."""
+        if not self.frames:
+            return None
+        return self.frames[min(self.index(elapsed), len(self.frames) - 1)]
+
+
+class ClipSet(dict):
+    """name -> AnimationClip, built by loader(name) on first use (sprites need a display first)."""
+    def __init__(self, loader):
+        super().__init__()
+        self.loader = loader
+
+    def __missing__(self, name):
+        clip = self[name] = self.loader(name)
+        return clip
+
+
+class Animator:
+    """
+    Plays one clip at a time for a single object.
+    Times are absolute (game_clock.now() for gameplay); on_complete(name) is
+    called once from update() when a ONCE clip finishes.
+    """
+    def __init__(self, clips, on_complete=None):
+        self.clips = clips
+        self.on_complete = on_complete
+        self.name = None
+        self.start = 0.0
+        self.done = False
+
+    @property
+    def clip(self):
+        return self.clips[self.name] if self.name is not None else None
+
+    def play(self, name, now, restart=True):
+        """Start clip name at time now (restart=False keeps a clip that is already playing)."""
+        if name == self.name and not restart:
+            return
+        self.name = name
+        self.start = now
+        self.done = False
+
+    def stop(self):
+        self.name = None
+
+    def elapsed(self, now):
+        return now - self.start
+
+    def index(self, now):
+        clip = self.clip
+        return clip.index(now - self.start) if clip is not None else 0
+
+    def frame(self, now):
+        clip = self.clip
+        return clip.frame(now - self.start) if clip is not None else None
+
+    def update(self, now):
+        """Raise the completion event if the current clip finished by now."""
+        clip = self.clip
+        if clip is None or self.done or not clip.finished(now - self.start):
+            return
+        self.done = True
+        if self.on_complete is not None:
+            self.on_complete(self.name)
+
+
+class ClipLibrary:
+    """
+    Clips registered under integer ids for ECS entities.
+    The lookup tables of all clips are concatenated so one set of array ops
+    samples any mix of clips. Id 0 is a single-frame placeholder, so entities
+    created without a clip show frame 0.
+    """
+    def __init__(self):
+        self.clips = []
+        self.register(AnimationClip((), 1.0, HOLD))
+
+    def register(self, clip):
+        """Add a clip and return its id."""
+        self.clips.append(clip)
+        self._compile()
+        return len(self.clips) - 1
+
+    def _compile(self):
+        lengths = [len(clip.table) for clip in self.clips]
+        self.table = np.concatenate([clip.table for clip in self.clips])
+        self.offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.looping = np.asarray([clip.mode == LOOP for clip in self.clips])
+        self.completes = np.asarray([clip.mode == ONCE for clip in self.clips])
+        self.durations = np.asarray([clip.duration for clip in self.clips], dtype=np.float64)
+
+    def sample(self, clip_ids, elapsed):
+        """Return (frame indices, finished mask) for parallel arrays of clip ids and elapsed times."""
+        clip_ids = clip_ids.astype(np.int64)
+        steps = np.maximum(elapsed * ANIMATION_LUT_RATE, 0).astype(np.int64)
+        lengths = self.lengths[clip_ids]
+        steps = np.where(self.looping[clip_ids], steps % lengths, np.minimum(steps, lengths - 1))
+        finished = self.completes[clip_ids] & (elapsed >= self.durations[clip_ids])
+        return self.table[self.offsets[clip_ids] + steps], finished
+
+
+# Shared by every ECS entity type
+clip_library = ClipLibrary()
+
+
+def animation_system(world, dt):
+    """
+    Set every animated entity's frame from its clip and start time (and the
+    anim_frame of Handle objects whose frame changed), then
+    call on_animation_end(clip id) on the Handle object of each entity whose
+    ONCE clip finished since the last tick.
+    """
+    now = game_clock.now()
+    finished_objects = []
+    for archetype in world.query(Animation):
+        if not archetype.count:
+            continue
+        clips = archetype.column(Animation, 'clip')
+        frames, finished = clip_library.sample(clips, now - archetype.column(Animation, 'start'))
+        column = archetype.column(Animation, 'frame')
+        if Handle.name in archetype.columns:
+            # Only rows whose frame advanced need their handle's copy refreshed
+            changed = np.flatnonzero(column != frames)
+            if changed.size:
+                for obj, frame in zip(archetype.column(Handle, 'obj')[changed].tolist(), frames[changed].tolist()):
+                    obj.anim_frame = frame
+        column[:] = frames
+        done = archetype.column(Animation, 'done')
+        rows = np.flatnonzero(finished & (done == 0))
+        if not rows.size:
+            continue
+        done[rows] = 1
+        if Handle.name in archetype.columns:
+            handles = archetype.column(Handle, 'obj')
+            finished_objects.extend((handles[row], int(clips[row])) for row in rows)
+    # Handlers may change components, so they run after the arrays are no longer in use
+    for obj, clip_id in finished_objects:
+        obj.on_animation_end(clip_id)
+
+
+def load_strip(path, frame_width=None, frame_height=None, count=None):
+    """
+    Cut a horizontal sprite strip into frames.
+    Give frame_width to slice fixed-size cells (the frame count follows from
+    the sheet width) or count to split the sheet into that many equal frames.
+    """
+    sheet = pygame.image.load(path).convert_alpha()
+    if frame_width is None:
+        frame_width = sheet.get_width() // count
+    if frame_height is None:
+        frame_height = sheet.get_height()
+    if count is None:
+        count = sheet.get_width() // frame_width
+    return [sheet.subsurface((i * frame_width, 0, frame_width, frame_height)) for i in range(count)]
@@ -0,0 +1,110 @@
+"""
+Player-enemy body collision and contact damage.
+"""
+import numpy as np
+from config import (
+    PLAYER_COLLIDER_RADIUS, ENEMY_COLLIDER_SCALE, COLLISION_ITERATIONS, COLLISION_PLAYER_SHARE,
+    COLLISION_MAX_CANDIDATES, CONTACT_DAMAGE_INTERVAL, WORLD_WIDTH, WORLD_HEIGHT
+)
+from entities.enemy_registry import ENEMY_REGISTRY
+from systems.combat import resolve_combat
+
+
+class BodyCollision:
+    """
+    Circle colliders on the player and living enemies. The broad phase asks
+    the shared spatial index for the enemies near the player (at most
+    max_candidates, so packed crowds cost the same as sparse ones); the narrow
+    phase pushes overlapping pairs apart for a bounded number of iterations,
+    the player taking player_share of each correction. Enemies touching the
+    player in the first pass deal contact damage, at most once per interval.
+    With a tile collider, pushes never move a body into solid tiles.
+    """
+    def __init__(self, index, player_radius=PLAYER_COLLIDER_RADIUS, iterations=COLLISION_ITERATIONS,
+                 player_share=COLLISION_PLAYER_SHARE, max_candidates=COLLISION_MAX_CANDIDATES,
+                 contact_interval=CONTACT_DAMAGE_INTERVAL, tiles=None):
+        self.index = index
+        self.tiles = tiles
+        self.player_radius = player_radius
+        self.iterations = max(1, int(iterations))
+        self.player_share = player_share
+        self.max_candidates = max_candidates
+        self.contact_interval = contact_interval
+        self.contact_cooldown = 0.0
+        # Broad-phase reach covers the largest enemy collider
+        self.reach = player_radius + max((etype.size for etype in ENEMY_REGISTRY.all()), default=0) * ENEMY_COLLIDER_SCALE
+
+    def reset(self):
+        self.contact_cooldown = 0.0
+
+    def update(self, player, dt):
+        """Separate the player from the enemies it overlaps and apply contact damage."""
+        self.contact_cooldown = max(0.0, self.contact_cooldown - dt)
+        px, py = player.x, player.y
+        candidates = [enemy for enemy in self.index.query_radius(px, py, self.reach, max_scan=self.max_candidates)
+                      if enemy.alive]
+        if not candidates:
+            return
+        n = len(candidates)
+        ex = np.fromiter((enemy.position[0] for enemy in candidates), dtype=np.float64, count=n)
+        ey = np.fromiter((enemy.position[1] for enemy in candidates), dtype=np.float64, count=n)
+        radii = np.fromiter((enemy.size for enemy in candidates), dtype=np.float64, count=n) * ENEMY_COLLIDER_SCALE
+        radii += self.player_radius
+        ex0, ey0 = ex.copy(), ey.copy()
+        share = self.player_share
+        moved = np.zeros(n, dtype=bool)
+        touching = None
+        for _ in range(self.iterations):
+            dx = ex - px
+            dy = ey - py
+            dist = np.hypot(dx, dy)
+            depth = radii - dist
+            hit = depth > 0
+            if touching is None:
+                touching = hit
+            if not hit.any():
+                break
+            # Separation normals (player -> enemy); an enemy exactly on the player is pushed along +x
+            stacked = dist < 1e-6
+            dist[stacked] = 1.0
+            nx = np.where(stacked, 1.0, dx / dist)
+            ny = np.where(stacked, 0.0, dy / dist)
+            push = np.where(hit, depth, 0.0)
+            ex += nx * push * (1.0 - share)
+            ey += ny * push * (1.0 - share)
+            px -= float((nx * push).sum()) * share
+            py -= float((ny * push).sum()) * share
+            moved |= hit
+
+        # Keep everything inside the arena
+        r = self.player_radius
+        px = min(max(px, r), WORLD_WIDTH - r)
+        py = min(max(py, r), WORLD_HEIGHT - r)
+        if self.tiles is not None:
+            px, py = self.tiles.slide(player.x, player.y, px, py, r)
+        if (px, py) != (player.x, player.y):
+            player.x, player.y = px, py
+            player.position = [px, py]
+            player.rect.center = (int(px), int(py))
+        if moved.any():
+            np.clip(ex, 0, WORLD_WIDTH, out=ex)
+            np.clip(ey, 0, WORLD_HEIGHT, out=ey)
+            if self.tiles is not None:
+                # Enemies collide with tiles by their centre point, as in movement_system
+                ex, ey = self.tiles.slide_many(ex0, ey0, ex, ey)
+            for i in np.flatnonzero(moved).tolist():
+                candidates[i].teleport(float(ex[i]), float(ey[i]))
+
+        # Contact damage: the hardest-hitting enemy touching the player, once per interval
+        if self.contact_cooldown > 0 or not touching.any():
+            return
+        touching = np.flatnonzero(touching)
+        stats = candidates[0].type.stats
+        type_ids = np.fromiter((candidates[i].type.type_id for i in touching.tolist()), dtype=np.int64,
+                               count=touching.size)
+        damage = stats.arrays['contact_damage'][type_ids]
+        best = int(np.argmax(damage))
+        if damage[best] <= 0:
+            return
+        resolve_combat(candidates[int(touching[best])], player, float(damage[best]))
+        self.contact_cooldown = self.contact_interval
@@ -1,6 +1,27 @@
 """
 Combat system logic.
 """
-def resolve_combat(attacker, defender):
-    # Calculate and apply damage
-    pass
+import numpy as np
+from entities.components import Animation, Handle
+
+
+def resolve_combat(attacker, defender, base_damage):
+    """Apply base_damage scaled by the attacker's damage multiplier to defender."""
+    damage = int(base_damage * attacker.mode_damage_multiplier)
+    defender.take_damage(damage, source=attacker)
+    return damage
+
+
+def hurt_feedback_system(world, dt):
+    """Count down hurt tint timers for every animated entity, refreshing the running ones' handles."""
+    for archetype in world.query(Animation):
+        if not archetype.count:
+            continue
+        timers = archetype.column(Animation, 'hurt_timer')
+        rows = np.flatnonzero(timers > 0)
+        if not rows.size:
+            continue
+        timers[rows] = np.maximum(timers[rows] - dt, 0.0)
+        if Handle.name in archetype.columns:
+            for obj, timer in zip(archetype.column(Handle, 'obj')[rows].tolist(), timers[rows].tolist()):
+                obj._hurt_timer = timer
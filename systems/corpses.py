@@ -0,0 +1,68 @@
+"""
+Render-only store for dying enemies.
+"""
+from config import ENEMY_LOD_VIEW_MARGIN
+
+
+class CorpseStore:
+    """
+    Enemies whose health hit zero, moved out of the live enemy list so
+    simulation, targeting and skill hit tests only ever see living enemies.
+    A corpse costs a visibility test per tick: its death clip advances in
+    the ECS animation system, whose completion event marks the enemy dead,
+    and dead corpses are handed to release (the spawner's pool).
+    """
+    def __init__(self, release, view_margin=ENEMY_LOD_VIEW_MARGIN):
+        self.release = release
+        self.view_margin = view_margin
+        self.corpses = []
+
+    def __iter__(self):
+        return iter(self.corpses)
+
+    def __len__(self):
+        return len(self.corpses)
+
+    def collect(self, enemies):
+        """Move enemies that are no longer alive from the enemies list (in place) into the store."""
+        for enemy in enemies:
+            if not enemy.alive:
+                break
+        else:
+            return
+        live = []
+        corpses = self.corpses
+        for enemy in enemies:
+            if enemy.alive:
+                live.append(enemy)
+            else:
+                enemy.set_velocity(0.0, 0.0)
+                if enemy.logic is None:
+                    enemy.dead = True  # No death animation to wait for
+                corpses.append(enemy)
+        enemies[:] = live
+
+    def update(self, viewport):
+        """Set corpse visibility and release the finished ones. Returns how many were released."""
+        corpses = self.corpses
+        if not corpses:
+            return 0
+        margin = self.view_margin
+        left, top = viewport.left - margin, viewport.top - margin
+        right, bottom = viewport.right + margin, viewport.bottom + margin
+        remaining = []
+        for enemy in corpses:
+            if enemy.dead:
+                self.release(enemy)
+                continue
+            x, y = enemy.position
+            enemy.visible = left <= x <= right and top <= y <= bottom
+            remaining.append(enemy)
+        released = len(corpses) - len(remaining)
+        self.corpses = remaining
+        return released
+
+    def clear(self):
+        for enemy in self.corpses:
+            self.release(enemy)
+        self.corpses = []
@@ -0,0 +1,55 @@
+"""
+Crowd steering: neighbor-limited separation so enemies don't stack.
+"""
+from config import (
+    ENEMY_SEPARATION_RADIUS, ENEMY_SEPARATION_MAX_NEIGHBORS, ENEMY_SEPARATION_STRENGTH,
+    ENEMY_STEERING_REFRESH_INTERVAL
+)
+
+
+class CrowdSteering:
+    """
+    Computes a separation vector per enemy from at most max_neighbors nearby
+    enemies found through the shared spatial index, and stores it in
+    enemy.steer for the enemy logic to blend into its movement.
+    """
+    def __init__(self, index, radius=ENEMY_SEPARATION_RADIUS, max_neighbors=ENEMY_SEPARATION_MAX_NEIGHBORS,
+                 strength=ENEMY_SEPARATION_STRENGTH, refresh_interval=ENEMY_STEERING_REFRESH_INTERVAL):
+        self.index = index
+        self.radius = radius
+        self.max_neighbors = max_neighbors
+        self.strength = strength
+        self.refresh_interval = max(1, int(refresh_interval))
+        self.tick = 0
+
+    def update(self, enemies):
+        """Refresh enemy.steer for this tick's share of living enemies."""
+        self.tick += 1
+        tick = self.tick
+        interval = self.refresh_interval
+        radius = self.radius
+        inv_radius = 1.0 / radius
+        limit = self.max_neighbors
+        strength = self.strength
+        max_scan = limit * 4
+        query = self.index.query_radius
+        for enemy in enemies:
+            if not enemy.alive or (tick + enemy.lod_slot) % interval:
+                continue
+            x, y = enemy.position
+            sx = sy = 0.0
+            for other in query(x, y, radius, limit, enemy, max_scan):
+                ox, oy = other.position
+                dx = x - ox
+                dy = y - oy
+                d_sq = dx * dx + dy * dy
+                if d_sq == 0.0:
+                    # Exactly stacked: break the tie deterministically
+                    sx += 1.0 if enemy.lod_slot >= other.lod_slot else -1.0
+                    continue
+                d = d_sq ** 0.5
+                # Push harder the closer the neighbor is
+                weight = (1.0 - d * inv_radius) / d
+                sx += dx * weight
+                sy += dy * weight
+            enemy.steer = (sx * strength, sy * strength)
@@ -0,0 +1,345 @@
+"""
+Grid flow field toward a single goal (the player), shared by all enemies.
+"""
+import math
+import numpy as np
+from config import FLOW_FIELD_CELL_SIZE, FLOW_FIELD_SWEEPS_PER_TICK, SOLID_TILES
+
+_DIAG = math.sqrt(2.0)
+# (row offset, col offset, step cost) of the 8 neighbors
+_NEIGHBORS = (
+    (-1, 0, 1.0), (1, 0, 1.0), (0, -1, 1.0), (0, 1, 1.0),
+    (-1, -1, _DIAG), (-1, 1, _DIAG), (1, -1, _DIAG), (1, 1, _DIAG),
+)
+# Unit (dx, dy) toward each neighbor, then the zero direction
+_DIRECTIONS = [(dc / math.hypot(dr, dc), dr / math.hypot(dr, dc)) for dr, dc, _ in _NEIGHBORS] + [(0.0, 0.0)]
+
+
+def _shifted(arr, dr, dc, fill):
+    """Return arr[r + dr, c + dc] for every (r, c), padding out-of-range with fill."""
+    out = np.full_like(arr, fill)
+    rows, cols = arr.shape
+    dst_r = slice(max(0, -dr), rows - max(0, dr))
+    dst_c = slice(max(0, -dc), cols - max(0, dc))
+    src_r = slice(max(0, dr), rows - max(0, -dr))
+    src_c = slice(max(0, dc), cols - max(0, -dc))
+    out[dst_r, dst_c] = arr[src_r, src_c]
+    return out
+
+
+def _span_any(mask, first, last, axis):
+    """any(mask[first[i]:last[i] + 1]) along axis, for ascending contiguous spans (last[i] <= first[i + 1])."""
+    return np.logical_or.reduceat(mask, first, axis=axis) | np.take(mask, last, axis=axis)
+
+
+class FlowField:
+    """
+    Integration field (cost to reach the goal cell) plus a per-cell unit
+    direction toward the cheapest neighbor, so sampling a direction is a
+    single list lookup no matter how many enemies ask. Obstacles come from the
+    map's solid tiles (bind_tilemap). On an open grid the cost has a closed
+    form and is built on first sample (an unsampled open field costs nothing
+    per tick). With obstacles the wavefront integration is time-sliced: step()
+    spends at most sweeps_per_tick sweeps per tick on it, and enemies keep
+    sampling the last finished field until the new one is ready. A goal move
+    changes every cell's cost and integrates from scratch; an obstacle change
+    under the same goal only resets the cells whose cheapest path it cuts and
+    integrates from the previous field, within the bounding box of the reset
+    cells when no cell was opened.
+    """
+    def __init__(self, width, height, cell_size=FLOW_FIELD_CELL_SIZE, sweeps_per_tick=FLOW_FIELD_SWEEPS_PER_TICK):
+        self.cell_size = cell_size
+        self.sweeps_per_tick = sweeps_per_tick
+        self.cols = max(1, int(math.ceil(width / cell_size)))
+        self.rows = max(1, int(math.ceil(height / cell_size)))
+        self.walkable = np.ones((self.rows, self.cols), dtype=bool)
+        self.cost = np.zeros((self.rows, self.cols), dtype=np.float32)
+        self.goal_cell = None
+        self.has_obstacles = False
+        self.rebuilds = 0
+        self._dirty = True
+        self._stale = True  # Goal or obstacles changed since the last build
+        self._job = None  # Obstacle rebuild in progress (_IntegrationJob)
+        # Goal and walkability the current obstacle field was integrated on (None: open grid or not built)
+        self._built_goal = None
+        self._built_walkable = None
+        self._tilemap = None
+        self._solid_tiles = ()
+        # Flat list of (dx, dy) per cell, index = row * cols + col
+        self._directions = [(0.0, 0.0)] * (self.rows * self.cols)
+
+    def cell_of(self, x, y):
+        """Return (row, col) of a world position, clamped to the grid."""
+        col = min(self.cols - 1, max(0, int(x // self.cell_size)))
+        row = min(self.rows - 1, max(0, int(y // self.cell_size)))
+        return row, col
+
+    def set_blocked_rect(self, rect, blocked=True):
+        """Mark every cell overlapping a world-space pygame.Rect as (un)walkable."""
+        cs = self.cell_size
+        c0, c1 = max(0, rect.left // cs), min(self.cols, (rect.right - 1) // cs + 1)
+        r0, r1 = max(0, rect.top // cs), min(self.rows, (rect.bottom - 1) // cs + 1)
+        self.walkable[r0:r1, c0:c1] = not blocked
+        self._obstacles_changed()
+
+    def bind_tilemap(self, tilemap, solid_tiles=SOLID_TILES):
+        """Block the cells covering solid tiles of tilemap, now and whenever a tile changes."""
+        self._tilemap = tilemap
+        self._solid_tiles = tuple(solid_tiles)
+        self._refresh_cells(0, self.rows, 0, self.cols)
+        tilemap.add_listener(self._on_tile_changed)
+
+    def _on_tile_changed(self, tx, ty):
+        ts, cs = self._tilemap.tile_size, self.cell_size
+        r0, r1 = ty * ts // cs, ((ty + 1) * ts - 1) // cs + 1
+        c0, c1 = tx * ts // cs, ((tx + 1) * ts - 1) // cs + 1
+        self._refresh_cells(max(0, r0), min(self.rows, r1), max(0, c0), min(self.cols, c1))
+
+    def _refresh_cells(self, r0, r1, c0, c1):
+        """Recompute walkability of cells [r0, r1) x [c0, c1) from the bound tilemap."""
+        if r0 >= r1 or c0 >= c1:
+            return
+        tilemap = self._tilemap
+        ts, cs = tilemap.tile_size, self.cell_size
+        # Tile span (first, last) covered by each cell row / column, clipped to the map
+        rows, cols = np.arange(r0, r1), np.arange(c0, c1)
+        first_r = np.minimum(rows * cs // ts, tilemap.height)
+        last_r = np.minimum(((rows + 1) * cs - 1) // ts, tilemap.height - 1)
+        first_c = np.minimum(cols * cs // ts, tilemap.width)
+        last_c = np.minimum(((cols + 1) * cs - 1) // ts, tilemap.width - 1)
+        blocked = np.zeros((r1 - r0, c1 - c0), dtype=bool)
+        # Cells past the edge of the map stay walkable
+        on_map_r = first_r < tilemap.height
+        on_map_c = first_c < tilemap.width
+        if on_map_r.any() and on_map_c.any():
+            ty0, ty1 = int(first_r[0]), int(last_r[on_map_r][-1]) + 1
+            tx0, tx1 = int(first_c[0]), int(last_c[on_map_c][-1]) + 1
+            solid = np.isin(np.asarray(tilemap.tiles[ty0:ty1, tx0:tx1]), self._solid_tiles)
+            solid = _span_any(solid, first_r[on_map_r] - ty0, last_r[on_map_r] - ty0, axis=0)
+            solid = _span_any(solid, first_c[on_map_c] - tx0, last_c[on_map_c] - tx0, axis=1)
+            blocked[np.ix_(on_map_r, on_map_c)] = solid
+        walkable = ~blocked
+        if not np.array_equal(self.walkable[r0:r1, c0:c1], walkable):
+            self.walkable[r0:r1, c0:c1] = walkable
+            self._obstacles_changed()
+
+    def _obstacles_changed(self):
+        self.has_obstacles = not bool(self.walkable.all())
+        self._dirty = True
+        self._stale = True
+
+    def update(self, goal_x, goal_y):
+        """Move the goal; the field follows on the next sample or step. Returns True if it changed."""
+        cell = self.cell_of(goal_x, goal_y)
+        if cell == self.goal_cell and not self._dirty:
+            return False
+        self.goal_cell = cell
+        self._dirty = False
+        self._stale = True
+        return True
+
+    def step(self):
+        """Spend this tick's sweep budget on the obstacle field rebuild (no-op on an open grid)."""
+        self._advance(self.sweeps_per_tick)
+
+    def rebuild(self):
+        """Bring the field up to date with the current goal and obstacles right away."""
+        if not self.has_obstacles:
+            self._ensure_built()
+            return
+        while self._stale or self._job is not None:
+            self._advance(None)
+
+    def _advance(self, sweeps):
+        if not self.has_obstacles:
+            self._job = None
+            return
+        if self._job is None:
+            if not self._stale or self.goal_cell is None:
+                return
+            # A running rebuild finishes with its goal; a newer goal starts the next one
+            self._stale = False
+            self._job = self._start_job()
+            if self._job is None:
+                return
+        if self._job.sweep(sweeps):
+            job, self._job = self._job, None
+            self.cost = job.result()
+            self._build_directions(job.walkable)
+            self._built_goal = job.goal
+            self._built_walkable = job.walkable
+            self.rebuilds += 1
+
+    def _start_job(self):
+        """Integration job for the current goal and obstacles, None if the finished field already matches them."""
+        walkable = self.walkable.copy()
+        if self._built_walkable is None or self.goal_cell != self._built_goal:
+            return _IntegrationJob(walkable, self.goal_cell)
+        blocked = self._built_walkable & ~walkable
+        opened = walkable & ~self._built_walkable
+        if not blocked.any() and not opened.any():
+            return None
+        # The previous costs are still reachable (or too high) wherever the change cut no path:
+        # relaxing down from them gives the same field as a fresh integration
+        cost = self.cost.copy()
+        window = None
+        if blocked.any():
+            reset = self._downstream_of(blocked)
+            cost[reset] = np.inf
+            cost[self.goal_cell] = 0.0
+            if not opened.any():
+                # Nothing else can get cheaper: only the reset cells (and their neighbors) need sweeping
+                rows, cols = np.nonzero(reset)
+                window = (slice(max(0, rows.min() - 1), rows.max() + 2),
+                          slice(max(0, cols.min() - 1), cols.max() + 2))
+        return _IntegrationJob(walkable, self.goal_cell, cost, window)
+
+    def _downstream_of(self, blocked):
+        """Cells whose cheapest path in the finished field runs through or diagonally past a blocked cell."""
+        seed = blocked.copy()
+        for dr, dc, _ in _NEIGHBORS:
+            seed |= _shifted(blocked, dr, dc, False)
+        hit = seed.ravel()
+        parents = _parents(self.cost, self._built_walkable)
+        # Pointer jumping: each pass doubles the length of path checked
+        while True:
+            hit |= hit[parents]
+            ancestors = parents[parents]
+            if np.array_equal(ancestors, parents):
+                return hit.reshape(blocked.shape)
+            parents = ancestors
+
+    def _ensure_built(self):
+        # Open grid only: the obstacle field is rebuilt by step()
+        if self._stale and self.goal_cell is not None and not self.has_obstacles:
+            self._stale = False
+            self.cost = _octile_cost(self.rows, self.cols, self.goal_cell)
+            self._build_directions(None)
+            self._built_walkable = None
+            self.rebuilds += 1
+
+    def direction_at(self, x, y):
+        """Unit direction toward the goal for a world position, (0, 0) at the goal or if unreachable."""
+        if self._stale and not self.has_obstacles:
+            self._ensure_built()
+        cs = self.cell_size
+        col = int(x // cs)
+        row = int(y // cs)
+        if col < 0:
+            col = 0
+        elif col >= self.cols:
+            col = self.cols - 1
+        if row < 0:
+            row = 0
+        elif row >= self.rows:
+            row = self.rows - 1
+        return self._directions[row * self.cols + col]
+
+    def cost_at(self, x, y):
+        self._ensure_built()
+        row, col = self.cell_of(x, y)
+        return float(self.cost[row, col])
+
+    def _build_directions(self, walkable):
+        """Directions from self.cost; walkable is the grid it was integrated on (None when open)."""
+        inf = np.float32(np.inf)
+        cost = self.cost
+        candidates = []
+        for dr, dc, step in _NEIGHBORS:
+            candidate = _shifted(cost, dr, dc, inf)
+            if walkable is not None and dr and dc:
+                ok = _shifted(walkable, dr, 0, False) & _shifted(walkable, 0, dc, False)
+                candidate = np.where(ok, candidate, inf)
+            candidates.append(candidate)
+        stack = np.stack(candidates)
+        best = np.argmin(stack, axis=0)
+        best_cost = np.take_along_axis(stack, best[None], axis=0)[0]
+        # No downhill neighbor (goal cell, unreachable or blocked): no direction
+        stuck = ~(best_cost < cost) | ~np.isfinite(cost)
+        best[stuck] = len(_NEIGHBORS)
+        # Cells share the nine direction tuples instead of each holding its own
+        self._directions = list(map(_DIRECTIONS.__getitem__, best.ravel().tolist()))
+
+
+def _octile_cost(rows, cols, goal):
+    """Open grid: octile distance has a closed form, no wavefront needed."""
+    gr, gc = goal
+    dr = np.abs(np.arange(rows, dtype=np.float32) - gr)[:, None]
+    dc = np.abs(np.arange(cols, dtype=np.float32) - gc)[None, :]
+    return (np.maximum(dr, dc) + (_DIAG - 1.0) * np.minimum(dr, dc)).astype(np.float32)
+
+
+def _parents(cost, walkable):
+    """
+    Flat index of the neighbor each cell's converged cost was reached through
+    (the cell itself at the goal and wherever the goal is unreachable).
+    """
+    rows, cols = cost.shape
+    parents = np.arange(rows * cols).reshape(rows, cols)
+    found = ~np.isfinite(cost) | (cost == 0)
+    for dr, dc, step in _NEIGHBORS:
+        ok = walkable
+        if dr and dc:
+            ok = ok & _shifted(walkable, dr, 0, False) & _shifted(walkable, 0, dc, False)
+        # Same float32 sum as the integration, so the converged cost matches exactly
+        via = ok & ~found & (_shifted(cost, dr, dc, np.float32(np.inf)) + np.float32(step) == cost)
+        parents[via] += dr * cols + dc
+        found |= via
+    return parents.ravel()
+
+
+class _IntegrationJob:
+    """
+    Vectorized wavefront relaxation toward one goal (the Dijkstra result on an
+    8-connected grid), run a bounded number of sweeps at a time. initial warm
+    starts it from costs that are nowhere below the result (the goal at 0),
+    and window limits the sweeps to a sub-grid whose border cells are final.
+    """
+    def __init__(self, walkable, goal, initial=None, window=None):
+        self.walkable = walkable
+        self.goal = goal
+        inf = np.float32(np.inf)
+        if initial is None:
+            initial = np.full(walkable.shape, inf, dtype=np.float32)
+            initial[goal] = 0.0
+        self.initial = initial
+        self.window = window if window is not None else (slice(None), slice(None))
+        walkable = walkable[self.window]
+        rows, cols = walkable.shape
+        # Work in a buffer padded with one blocked ring so every neighbor is a view
+        self.padded = np.full((rows + 2, cols + 2), inf, dtype=np.float32)
+        self.cost = self.padded[1:-1, 1:-1]
+        self.cost[...] = initial[self.window]
+        blocked = ~walkable
+        self.views = []
+        for dr, dc, step in _NEIGHBORS:
+            view = self.padded[1 + dr:rows + 1 + dr, 1 + dc:cols + 1 + dc]
+            if dr and dc:
+                # Diagonal steps may not cut the corner of a blocked cell
+                no_entry = blocked | ~(_shifted(walkable, dr, 0, False) & _shifted(walkable, 0, dc, False))
+            else:
+                no_entry = blocked
+            # Per-cell step cost, infinite where the step is not allowed
+            self.views.append((view, np.where(no_entry, inf, np.float32(step)).astype(np.float32)))
+        self.previous = np.empty_like(self.cost)
+        self.candidate = np.empty_like(self.cost)
+
+    def sweep(self, limit=None):
+        """Run up to limit sweeps (None: until done). Returns True once the cost has converged."""
+        cost, previous, candidate = self.cost, self.previous, self.candidate
+        done = 0
+        while limit is None or done < limit:
+            np.copyto(previous, cost)
+            # Updating in place lets each directional pass build on the previous one
+            for view, step in self.views:
+                np.add(view, step, out=candidate)
+                np.minimum(cost, candidate, out=cost)
+            done += 1
+            if np.array_equal(previous, cost):
+                return True
+        return False
+
+    def result(self):
+        """The converged cost over the whole grid."""
+        self.initial[self.window] = self.cost
+        return self.initial
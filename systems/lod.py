@@ -0,0 +1,94 @@
+"""
+Level-of-detail scheduling for enemy updates.
+"""
+from config import ENEMY_LOD_NEAR_RADIUS, ENEMY_LOD_FAR_UPDATE_INTERVAL, ENEMY_LOD_VIEW_MARGIN
+
+
+class EnemyLOD:
+    """
+    Decides per tick which enemies get a full update.
+
+    Enemies that are visible and within near_radius of the player update every
+    tick; they come from a spatial index query of the viewport, so that part
+    costs what is on screen rather than the whole population. Everything else
+    sits in far_interval buckets keyed by lod_slot, and one bucket updates per
+    tick with the time elapsed since each enemy's last update, so far enemies
+    update every far_interval ticks with the work spread evenly across ticks.
+    Animation frames come from clip start times (systems/animation.py) and
+    stay smooth either way. Enemies join through add(); dead ones leave their
+    bucket the next time it comes up.
+    """
+    def __init__(self, near_radius=ENEMY_LOD_NEAR_RADIUS, far_interval=ENEMY_LOD_FAR_UPDATE_INTERVAL,
+                 view_margin=ENEMY_LOD_VIEW_MARGIN):
+        self.near_radius = near_radius
+        self.far_interval = max(1, int(far_interval))
+        self.view_margin = view_margin
+        self.tick = 0
+        self.time = 0.0  # Simulated time; enemies store when they last updated
+        # Enemy -> None per bucket (insertion ordered, no duplicates when pooled enemies come back)
+        self.buckets = [{} for _ in range(self.far_interval)]
+        self.visible = []  # Enemies flagged visible by the last update
+        self.full_updates = 0  # Stats for the last tick
+        self.reduced_updates = 0
+
+    def add(self, enemies):
+        """Start scheduling newly spawned enemies."""
+        now = self.time
+        interval = self.far_interval
+        buckets = self.buckets
+        for enemy in enemies:
+            enemy.lod_time = now
+            buckets[enemy.lod_slot % interval][enemy] = None
+
+    def clear(self):
+        self.buckets = [{} for _ in range(self.far_interval)]
+        self.visible = []
+
+    def update(self, player, dt, viewport, index):
+        """
+        Update enemies according to their LOD tier and set enemy.visible.
+        viewport: pygame.Rect of the visible world area.
+        index: SpatialHash of the living enemies, rebuilt this tick.
+        """
+        self.tick += 1
+        self.time += dt
+        now = self.time
+        margin = self.view_margin
+        # Visibility only changes for enemies entering or leaving the view query
+        for enemy in self.visible:
+            enemy.visible = False
+        visible = self.visible = index.query_rect(viewport.inflate(margin * 2, margin * 2))
+        for enemy in visible:
+            enemy.visible = True
+
+        near_sq = self.near_radius * self.near_radius
+        px, py = player.position[0], player.position[1]
+        full = 0
+        for enemy in visible:
+            x, y = enemy.position
+            dx = x - px
+            dy = y - py
+            if dx * dx + dy * dy <= near_sq:
+                enemy.update(now - enemy.lod_time, player)
+                enemy.lod_time = now
+                full += 1
+
+        interval = self.far_interval
+        slot = -self.tick % interval
+        bucket = self.buckets[slot]
+        reduced = 0
+        gone = []
+        for enemy in bucket:
+            # Dead, or pooled and respawned with a slot in another bucket
+            if not enemy.alive or enemy.lod_slot % interval != slot:
+                gone.append(enemy)
+                continue
+            if enemy.lod_time == now:
+                continue  # Already had its full update this tick
+            enemy.update(now - enemy.lod_time, player, animate=enemy.visible)
+            enemy.lod_time = now
+            reduced += 1
+        for enemy in gone:
+            del bucket[enemy]
+        self.full_updates = full
+        self.reduced_updates = reduced
@@ -1,6 +1,41 @@
 """
 Movement system logic.
 """
-def move_entity(entity, direction):
-    # Update entity position
-    pass
+import numpy as np
+from entities.components import Position, Velocity, Handle
+
+
+def movement_system(world, dt, tiles=None):
+    """
+    Integrate Position += Velocity * dt for every moving entity, then copy
+    the new positions back to the owning objects of the rows that actually
+    moved, so per-entity logic keeps reading a plain .position tuple while
+    standing entities (attacking, dying) cost nothing. With a TileCollider,
+    moves into solid tiles are resolved against it (by the entity's centre:
+    the flow field already routes enemies through open cells, this only stops
+    separation and straight-line moves from carrying them onto rock).
+    """
+    for archetype in world.query(Position, Velocity):
+        if not archetype.count:
+            continue
+        vx = archetype.column(Velocity, 'x')
+        vy = archetype.column(Velocity, 'y')
+        rows = np.flatnonzero((vx != 0.0) | (vy != 0.0))
+        if not rows.size:
+            continue
+        px = archetype.column(Position, 'x')
+        py = archetype.column(Position, 'y')
+        if tiles is None:
+            px[rows] += vx[rows] * dt
+            py[rows] += vy[rows] * dt
+        else:
+            x0, y0 = px[rows], py[rows]
+            px[rows], py[rows] = tiles.slide_many(x0, y0, x0 + vx[rows] * dt, y0 + vy[rows] * dt)
+        if Handle.name not in archetype.key:
+            continue
+        x, y = px[rows], py[rows]
+        # Rect centers truncate like int() does
+        for obj, fx, fy, ix, iy in zip(archetype.column(Handle, 'obj')[rows].tolist(), x.tolist(), y.tolist(),
+                                       x.astype(np.int64).tolist(), y.astype(np.int64).tolist()):
+            obj.position = (fx, fy)
+            obj.rect.center = (ix, iy)
@@ -0,0 +1,138 @@
+"""
+Array-backed particle effects (hit sparks, death bursts, dash trails).
+Particles live in fixed-size NumPy arrays used as a ring buffer: emitting
+past the budget overwrites the oldest particles first. Simulation is a few
+vectorized ops per tick and drawing is one blits call over pre-baked sprites.
+"""
+import numpy as np
+import pygame
+from config import PARTICLE_BUDGET, PARTICLE_EMITTERS, PARTICLE_COLORS, PARTICLE_SIZES, PARTICLE_FADE_STEPS
+
+
+class ParticleSystem:
+    """Fixed-budget particle pool; emitters are named presets from config."""
+    def __init__(self, budget=PARTICLE_BUDGET, emitters=PARTICLE_EMITTERS):
+        self.budget = budget
+        self.emitters = emitters
+        self.x = np.zeros(budget, dtype=np.float32)
+        self.y = np.zeros(budget, dtype=np.float32)
+        self.vx = np.zeros(budget, dtype=np.float32)
+        self.vy = np.zeros(budget, dtype=np.float32)
+        self.age = np.zeros(budget, dtype=np.float32)
+        self.life = np.zeros(budget, dtype=np.float32)  # 0 = free slot
+        self.drag = np.zeros(budget, dtype=np.float32)
+        self.color = np.zeros(budget, dtype=np.uint8)  # Index into PARTICLE_COLORS
+        self.size = np.zeros(budget, dtype=np.uint8)  # Index into PARTICLE_SIZES
+        self.head = 0  # Next slot to write; the oldest particle sits here once full
+        self.limit = budget  # Active budget, may be lowered by the quality controller
+        self._rng = np.random.default_rng()
+        self._sprites = None
+
+    def emit(self, name, x, y, direction=None):
+        """
+        Spawn a burst from the named emitter preset at (x, y).
+        direction: optional (dx, dy) the burst is biased toward.
+        """
+        if direction is None:
+            self.emit_many(name, (x,), (y,))
+        else:
+            self.emit_many(name, (x,), (y,), (direction[0],), (direction[1],))
+
+    def emit_many(self, name, xs, ys, dxs=None, dys=None):
+        """
+        Spawn one burst per (xs[i], ys[i]) in a single pass (e.g. every hit of a tick).
+        dxs, dys: optional per-burst direction the burst is biased toward.
+        """
+        preset = self.emitters[name]
+        bursts = len(xs)
+        n = min(preset['count'] * bursts, self.limit)
+        if n <= 0:
+            return
+        # Burst each particle belongs to (the newest ones when over the budget)
+        src = np.repeat(np.arange(bursts), preset['count'])[-n:]
+        rng = self._rng
+        spread = np.radians(preset.get('spread', 360))
+        base = np.arctan2(np.asarray(dys), np.asarray(dxs))[src] if dxs is not None else 0.0
+        angle = base + (rng.random(n) - 0.5) * spread
+        speed = preset['speed'] * (0.5 + rng.random(n))
+        idx = (self.head + np.arange(n)) % self.limit
+        self.head = (self.head + n) % self.limit
+        jitter = preset.get('jitter', 0)
+        self.x[idx] = np.asarray(xs)[src] + (rng.random(n) - 0.5) * jitter
+        self.y[idx] = np.asarray(ys)[src] + (rng.random(n) - 0.5) * jitter
+        self.vx[idx] = np.cos(angle) * speed
+        self.vy[idx] = np.sin(angle) * speed
+        self.age[idx] = 0.0
+        self.life[idx] = preset['life'] * (0.75 + 0.5 * rng.random(n))
+        self.drag[idx] = preset.get('drag', 0.0)
+        self.color[idx] = rng.choice(preset['colors'], n)
+        self.size[idx] = preset.get('size', 0)
+
+    def set_limit(self, limit):
+        """Shrink or restore the active budget (particles beyond it are dropped)."""
+        limit = max(1, min(int(limit), self.budget))
+        if limit < self.limit:
+            self.life[limit:] = 0.0
+        self.limit = limit
+        self.head %= limit
+
+    def update(self, dt):
+        n = self.limit
+        alive = self.age[:n] < self.life[:n]
+        if not alive.any():
+            return
+        damp = np.exp(-self.drag[:n] * dt)
+        self.vx[:n] *= damp
+        self.vy[:n] *= damp
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.age[:n] += dt
+        # Expired slots become free (life 0) so they are skipped cheaply next tick
+        self.life[:n][~alive] = 0.0
+
+    def alive_count(self):
+        n = self.limit
+        return int(np.count_nonzero(self.age[:n] < self.life[:n]))
+
+    def _bake_sprites(self):
+        # sprites[color][size][fade step] -> small alpha circle
+        sprites = []
+        for color in PARTICLE_COLORS:
+            by_size = []
+            for radius in PARTICLE_SIZES:
+                steps = []
+                for step in range(PARTICLE_FADE_STEPS):
+                    alpha = int(255 * (1.0 - step / PARTICLE_FADE_STEPS))
+                    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+                    steps.append(surf)
+                by_size.append(steps)
+            sprites.append(by_size)
+        return sprites
+
+    def draw(self, surface, camera):
+        n = self.limit
+        live = np.nonzero(self.age[:n] < self.life[:n])[0]
+        if not live.size:
+            return
+        view = camera.rect
+        x = self.x[live]
+        y = self.y[live]
+        on_screen = (x >= view.left) & (x < view.right) & (y >= view.top) & (y < view.bottom)
+        live = live[on_screen]
+        if not live.size:
+            return
+        if self._sprites is None:
+            self._sprites = self._bake_sprites()
+        sprites = self._sprites
+        steps = np.minimum((self.age[live] / self.life[live] * PARTICLE_FADE_STEPS).astype(np.int32),
+                           PARTICLE_FADE_STEPS - 1)
+        radii = np.asarray(PARTICLE_SIZES, dtype=np.int32)[self.size[live]]
+        ox, oy = camera.offset
+        left = (self.x[live] + ox).astype(np.int32) - radii
+        top = (self.y[live] + oy).astype(np.int32) - radii
+        surface.blits([
+            (sprites[c][s][f], (lx, ty))
+            for c, s, f, lx, ty in zip(self.color[live].tolist(), self.size[live].tolist(),
+                                       steps.tolist(), left.tolist(), top.tolist())
+        ], doreturn=False)
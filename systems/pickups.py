@@ -0,0 +1,163 @@
+"""
+Array-backed loot and XP pickups.
+Pickups live in fixed-size NumPy arrays used as a pool: dropping takes free
+slots, collecting frees them. Magnet attraction and collection are radius
+queries over the live slots, and once too many XP orbs lie on the floor the
+ones sharing a grid cell are merged into one orb carrying their total value.
+"""
+import numpy as np
+import pygame
+from config import (
+    PICKUP_BUDGET, PICKUP_MERGE_THRESHOLD, PICKUP_MERGE_CELL_SIZE, PICKUP_MAGNET_RADIUS, PICKUP_MAGNET_SPEED,
+    PICKUP_COLLECT_RADIUS, PICKUP_SCATTER, PICKUP_COLORS, PICKUP_SIZES
+)
+
+# Pickup kinds (index into PICKUP_COLORS)
+PICKUP_XP = 0
+PICKUP_GOLD = 1
+
+
+class PickupSystem:
+    """Fixed-budget pool of XP orbs and gold; collected values are returned to the caller."""
+    def __init__(self, budget=PICKUP_BUDGET, magnet_radius=PICKUP_MAGNET_RADIUS,
+                 collect_radius=PICKUP_COLLECT_RADIUS, merge_threshold=PICKUP_MERGE_THRESHOLD):
+        self.budget = budget
+        self.magnet_radius = magnet_radius
+        self.collect_radius = collect_radius
+        self.merge_threshold = merge_threshold
+        self.x = np.zeros(budget, dtype=np.float64)
+        self.y = np.zeros(budget, dtype=np.float64)
+        self.value = np.zeros(budget, dtype=np.float32)
+        self.kind = np.zeros(budget, dtype=np.uint8)
+        self.alive = np.zeros(budget, dtype=bool)
+        self.homing = np.zeros(budget, dtype=bool)  # Caught by the magnet; flies to the player until collected
+        self.live = 0
+        self._drops = 0  # Spreads the scatter pattern of successive drops
+        self._sprites = None
+
+    def clear(self):
+        self.alive[:] = False
+        self.homing[:] = False
+        self.live = 0
+
+    def spawn_many(self, kind, xs, ys, values):
+        """Drop one pickup of kind per (xs[i], ys[i]) worth values[i]; extra drops are lost if the pool is full."""
+        count = len(xs)
+        if not count:
+            return
+        if self.live + count > self.budget:
+            self.merge()
+        slots = np.flatnonzero(~self.alive)[:count]
+        count = slots.size
+        if not count:
+            return
+        # Scatter around the drop point on a golden-angle spiral (deterministic, no RNG)
+        angle = (self._drops + np.arange(count)) * 2.399963
+        self._drops += count
+        self.x[slots] = np.asarray(xs, dtype=np.float64)[:count] + np.cos(angle) * PICKUP_SCATTER
+        self.y[slots] = np.asarray(ys, dtype=np.float64)[:count] + np.sin(angle) * PICKUP_SCATTER
+        self.value[slots] = np.asarray(values, dtype=np.float32)[:count]
+        self.kind[slots] = kind
+        self.alive[slots] = True
+        self.homing[slots] = False
+        self.live += count
+
+    def query_radius(self, x, y, radius):
+        """Slots of the live pickups within radius of (x, y)."""
+        live = np.flatnonzero(self.alive)
+        if not live.size:
+            return live
+        dx = self.x[live] - x
+        dy = self.y[live] - y
+        return live[dx * dx + dy * dy <= radius * radius]
+
+    def update(self, dt, x, y):
+        """
+        Pull pickups toward the collector at (x, y) and collect those in reach.
+        Returns the collected (xp, gold).
+        """
+        if not self.live:
+            return 0.0, 0.0
+        self.homing[self.query_radius(x, y, self.magnet_radius)] = True
+        homing = np.flatnonzero(self.homing)
+        if homing.size:
+            dx = x - self.x[homing]
+            dy = y - self.y[homing]
+            dist = np.maximum(np.hypot(dx, dy), 1e-6)
+            # Faster the closer they get, and never past the target
+            speed = PICKUP_MAGNET_SPEED * (2.0 - np.minimum(dist / self.magnet_radius, 1.0))
+            step = np.minimum(speed * dt / dist, 1.0)
+            self.x[homing] += dx * step
+            self.y[homing] += dy * step
+        xp = gold = 0.0
+        collected = self.query_radius(x, y, self.collect_radius)
+        if collected.size:
+            values = self.value[collected]
+            kinds = self.kind[collected]
+            xp = float(values[kinds == PICKUP_XP].sum())
+            gold = float(values[kinds == PICKUP_GOLD].sum())
+            self.alive[collected] = False
+            self.homing[collected] = False
+            self.live -= collected.size
+        if self.live > self.merge_threshold:
+            self.merge()
+        return xp, gold
+
+    def merge(self, cell_size=PICKUP_MERGE_CELL_SIZE):
+        """Fold the resting XP orbs that share a grid cell into one orb at their value-weighted centre."""
+        orbs = np.flatnonzero(self.alive & ~self.homing & (self.kind == PICKUP_XP))
+        if orbs.size < 2:
+            return
+        cx = (self.x[orbs] // cell_size).astype(np.int64)
+        cy = (self.y[orbs] // cell_size).astype(np.int64)
+        keys = cx * 1_000_003 + cy
+        _, first, group, sizes = np.unique(keys, return_index=True, return_inverse=True, return_counts=True)
+        if sizes.max() < 2:
+            return
+        values = self.value[orbs].astype(np.float64)
+        total = np.bincount(group, weights=values)
+        keep = orbs[first]
+        self.x[keep] = np.bincount(group, weights=values * self.x[orbs]) / total
+        self.y[keep] = np.bincount(group, weights=values * self.y[orbs]) / total
+        self.value[keep] = total
+        merged = np.ones(orbs.size, dtype=bool)
+        merged[first] = False
+        self.alive[orbs[merged]] = False
+        self.live -= int(merged.sum())
+
+    def _bake_sprites(self):
+        # sprites[kind][size] -> small filled circle with a dark rim
+        sprites = []
+        for color in PICKUP_COLORS:
+            by_size = []
+            for radius in PICKUP_SIZES:
+                surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(surf, color, (radius, radius), radius)
+                pygame.draw.circle(surf, (20, 20, 30), (radius, radius), radius, 1)
+                by_size.append(surf)
+            sprites.append(by_size)
+        return sprites
+
+    def draw(self, surface, camera):
+        live = np.flatnonzero(self.alive)
+        if not live.size:
+            return
+        view = camera.rect
+        x = self.x[live]
+        y = self.y[live]
+        live = live[(x >= view.left) & (x < view.right) & (y >= view.top) & (y < view.bottom)]
+        if not live.size:
+            return
+        if self._sprites is None:
+            self._sprites = self._bake_sprites()
+        sprites = self._sprites
+        # Bigger sprites for more valuable (e.g. merged) pickups
+        sizes = np.minimum(np.log2(np.maximum(self.value[live], 1.0)).astype(np.int32) // 2, len(PICKUP_SIZES) - 1)
+        radii = np.asarray(PICKUP_SIZES, dtype=np.int32)[sizes]
+        ox, oy = camera.offset
+        left = (self.x[live] + ox).astype(np.int32) - radii
+        top = (self.y[live] + oy).astype(np.int32) - radii
+        surface.blits([
+            (sprites[k][s], (lx, ty))
+            for k, s, lx, ty in zip(self.kind[live].tolist(), sizes.tolist(), left.tolist(), top.tolist())
+        ], doreturn=False)
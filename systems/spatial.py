@@ -0,0 +1,107 @@
+"""
+Spatial index for broad-phase neighbor queries.
+"""
+
+
+class SpatialHash:
+    """
+    Uniform grid that buckets entities by their position.
+    Rebuilt once per tick; queries only touch the cells overlapping the
+    query circle, so cost depends on local density rather than total count.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+
+    def clear(self):
+        self.cells.clear()
+        self.count = 0
+
+    def rebuild(self, entities):
+        """Rebuild the index from entities exposing a .position (x, y)."""
+        cells = {}
+        cs = self.cell_size
+        for entity in entities:
+            x, y = entity.position
+            key = (int(x // cs), int(y // cs))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [entity]
+            else:
+                bucket.append(entity)
+        self.cells = cells
+        self.count = len(entities)
+
+    def insert(self, entity):
+        x, y = entity.position
+        key = self.cell_of(x, y)
+        self.cells.setdefault(key, []).append(entity)
+        self.count += 1
+
+    def cell_of(self, x, y):
+        cs = self.cell_size
+        return (int(x // cs), int(y // cs))
+
+    def query_rect(self, rect):
+        """Return entities whose position lies inside rect (a pygame.Rect in world space)."""
+        cs = self.cell_size
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        cells = self.cells
+        found = []
+        for cx in range(int(left // cs), int(right // cs) + 1):
+            for cy in range(int(top // cs), int(bottom // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                # Only border cells can hold entities outside the rect
+                if left <= cx * cs and (cx + 1) * cs <= right and top <= cy * cs and (cy + 1) * cs <= bottom:
+                    found.extend(bucket)
+                    continue
+                for entity in bucket:
+                    x, y = entity.position
+                    if left <= x <= right and top <= y <= bottom:
+                        found.append(entity)
+        return found
+
+    def query_radius(self, x, y, radius, limit=None, exclude=None, max_scan=None):
+        """
+        Return entities within radius of (x, y).
+        Stops early once limit results have been collected, or once max_scan
+        candidates have been examined (bounds the cost in packed crowds).
+        """
+        cs = self.cell_size
+        r_sq = radius * radius
+        x0, x1 = int((x - radius) // cs), int((x + radius) // cs)
+        y0, y1 = int((y - radius) // cs), int((y + radius) // cs)
+        # Visit the home cell first so capped scans favor the closest candidates
+        home = (int(x // cs), int(y // cs))
+        keys = [home]
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                if cx != home[0] or cy != home[1]:
+                    keys.append((cx, cy))
+        cells = self.cells
+        found = []
+        scanned = 0
+        for key in keys:
+            bucket = cells.get(key)
+            if not bucket:
+                continue
+            if max_scan is not None:
+                if scanned >= max_scan:
+                    return found
+                scanned += len(bucket)
+                if scanned > max_scan:
+                    bucket = bucket[:len(bucket) - (scanned - max_scan)]
+            for entity in bucket:
+                if entity is exclude:
+                    continue
+                ex, ey = entity.position
+                dx = ex - x
+                dy = ey - y
+                if dx * dx + dy * dy <= r_sq:
+                    found.append(entity)
+                    if limit is not None and len(found) >= limit:
+                        return found
+        return found
@@ -0,0 +1,112 @@
+"""
+Solid map tiles as movement obstacles.
+"""
+import math
+import numpy as np
+from config import SOLID_TILES
+
+
+class TileCollider:
+    """
+    Keeps bodies out of the map's solid tiles. The solid mask is a boolean
+    copy of the tile grid, kept current through the map's change listener.
+    A body is a square of half-size radius (under half a tile, so testing its
+    four corners is enough); radius 0 tests the centre point only. Moves are
+    resolved one axis at a time, x then y, so bodies slide along rock faces
+    instead of sticking to them. A body that already overlaps rock (spawned
+    there, or the tile changed under it) may move freely until it is out.
+    """
+    def __init__(self, tilemap, solid_tiles=SOLID_TILES):
+        self.tilemap = tilemap
+        self.tile_size = tilemap.tile_size
+        self.solid_tiles = tuple(solid_tiles)
+        self.solid = np.isin(np.asarray(tilemap.tiles), self.solid_tiles)
+        self.any_solid = bool(self.solid.any())
+        tilemap.add_listener(self._on_tile_changed)
+
+    def _on_tile_changed(self, tx, ty):
+        self.solid[ty, tx] = self.tilemap.get(tx, ty) in self.solid_tiles
+        self.any_solid = bool(self.solid.any())
+
+    def blocked(self, x, y, radius=0.0):
+        """True if a body of radius at (x, y) overlaps a solid tile (off the map counts as open)."""
+        if not self.any_solid:
+            return False
+        ts = self.tile_size
+        solid = self.solid
+        rows, cols = solid.shape
+        for cx in (x - radius, x + radius):
+            tx = int(cx // ts)
+            if not 0 <= tx < cols:
+                continue
+            for cy in (y - radius, y + radius):
+                ty = int(cy // ts)
+                if 0 <= ty < rows and solid[ty, tx]:
+                    return True
+        return False
+
+    def blocked_many(self, xs, ys, radius=0.0):
+        """Mask of the bodies (arrays of positions, scalar or per-body radius) overlapping solid tiles."""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if not np.isscalar(radius):
+            radius = np.asarray(radius, dtype=np.float64)
+        hit = np.zeros(xs.shape, dtype=bool)
+        if not self.any_solid or not hit.size:
+            return hit
+        ts = self.tile_size
+        solid = self.solid
+        rows, cols = solid.shape
+        corners = ((0.0, 0.0),) if np.isscalar(radius) and radius == 0 else ((-1, -1), (-1, 1), (1, -1), (1, 1))
+        for sx, sy in corners:
+            tx = np.floor((xs + sx * radius) / ts).astype(np.int64)
+            ty = np.floor((ys + sy * radius) / ts).astype(np.int64)
+            on_map = (tx >= 0) & (tx < cols) & (ty >= 0) & (ty < rows)
+            hit[on_map] |= solid[ty[on_map], tx[on_map]]
+        return hit
+
+    def slide(self, x0, y0, x1, y1, radius=0.0):
+        """
+        Where a body at (x0, y0) moving to (x1, y1) ends up. Long moves are
+        taken in steps of at most half a tile so nothing tunnels through rock.
+        """
+        if not self.any_solid or self.blocked(x0, y0, radius):
+            return x1, y1
+        dx, dy = x1 - x0, y1 - y0
+        steps = max(1, math.ceil(max(abs(dx), abs(dy)) / (self.tile_size * 0.5)))
+        if steps == 1 and not self.blocked(x1, y1, radius):
+            return x1, y1
+        sx, sy = dx / steps, dy / steps
+        x, y = x0, y0
+        for _ in range(steps):
+            if sx and not self.blocked(x + sx, y, radius):
+                x += sx
+            if sy and not self.blocked(x, y + sy, radius):
+                y += sy
+        return x, y
+
+    def slide_many(self, x0, y0, x1, y1, radius=0.0):
+        """
+        slide() for arrays of bodies taking short moves (under half a tile,
+        e.g. one tick of enemy movement). Returns the resolved (x, y) arrays.
+        """
+        x1 = np.asarray(x1, dtype=np.float64)
+        y1 = np.asarray(y1, dtype=np.float64)
+        if not self.any_solid:
+            return x1, y1
+        x0 = np.asarray(x0, dtype=np.float64)
+        y0 = np.asarray(y0, dtype=np.float64)
+        hit = self.blocked_many(x1, y1, radius)
+        if not hit.any():
+            return x1, y1
+        # Bodies already in rock are let out; the rest resolve x, then y
+        hit &= ~self.blocked_many(x0, y0, radius)
+        rows = np.flatnonzero(hit)
+        if not rows.size:
+            return x1, y1
+        r = radius if np.isscalar(radius) else np.asarray(radius)[rows]
+        x = x1.copy()
+        y = y1.copy()
+        x[rows] = np.where(self.blocked_many(x1[rows], y0[rows], r), x0[rows], x1[rows])
+        y[rows] = np.where(self.blocked_many(x[rows], y1[rows], r), y0[rows], y1[rows])
+        return x, y
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the simulated game clock and the timers that read it.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from core.clock import GameClock, game_clock
+from skills.registry import get_skill
+
+
+class Walker:
+    """Minimal dash user: position, facing and rect."""
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.position = (x, y)
+        self.rect = pygame.Rect(0, 0, 24, 24)
+        self.rect.center = (int(x), int(y))
+        self.last_move = (1, 0)
+
+
+def test_clock_advances_and_resets():
+    """The clock only moves when advanced, and reset starts it over"""
+    clock = GameClock()
+    assert clock.now() == 0.0
+    clock.advance(0.5)
+    clock.advance(0.25)
+    assert clock.now() == 0.75
+    clock.reset()
+    assert clock.now() == 0.0
+
+
+def test_cooldowns_follow_simulated_time():
+    """Skill cooldowns count game time, so a paused (unadvanced) clock holds them"""
+    game_clock.reset()
+    dash = get_skill('dash')(Walker(100.0, 100.0))
+    assert dash.use()
+    assert dash.last_used == 0.0
+    dash.update(1.0, [])  # Finish the dash; only the cooldown holds it now
+    game_clock.advance(dash.cooldown - 0.1)
+    assert not dash.use()
+    game_clock.advance(0.1)
+    assert dash.use()
+    assert dash.last_used == game_clock.now()
+    game_clock.reset()
+
+
+if __name__ == "__main__":
+    test_clock_advances_and_resets()
+    test_cooldowns_follow_simulated_time()
+    print("All clock tests passed.")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for player-enemy body collision and contact damage.
+"""
+
+import sys
+import os
+import math
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+from core.ecs import World
+from entities.enemy import Enemy, EnemyType
+from entities.enemy_registry import EnemyStatTable
+from systems.collision import BodyCollision
+from systems.spatial import SpatialHash
+
+ENEMY_SIZE = 40  # Collider radius 10 at ENEMY_COLLIDER_SCALE 0.25
+PLAYER_RADIUS = 12
+
+
+class Target:
+    """Minimal player: a position and the damage it took."""
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.position = [x, y]
+        self.rect = pygame.Rect(0, 0, 24, 24)
+        self.rect.center = (int(x), int(y))
+        self.hits = []
+
+    def take_damage(self, amount, source=None):
+        self.hits.append((amount, source))
+
+
+def make_types():
+    types = [
+        EnemyType('harmless', max_health=10, size=ENEMY_SIZE, contact_damage=0, type_id=0),
+        EnemyType('spiky', max_health=10, size=ENEMY_SIZE, contact_damage=6, type_id=1),
+        EnemyType('brute', max_health=10, size=ENEMY_SIZE, contact_damage=9, type_id=2),
+    ]
+    table = EnemyStatTable(types)
+    for etype in types:
+        etype.stats = table
+    return types
+
+
+def setup(positions, type_ids, **kwargs):
+    world = World()
+    types = make_types()
+    enemies = [Enemy(types[t], pos, world) for pos, t in zip(positions, type_ids)]
+    index = SpatialHash(64)
+    index.rebuild(enemies)
+    collision = BodyCollision(index, player_radius=PLAYER_RADIUS, **kwargs)
+    return collision, enemies
+
+
+def test_push_out_separates_bodies():
+    """Overlapping enemies are pushed clear of the player, who gives way by player_share"""
+    player = Target(1000.0, 1000.0)
+    collision, enemies = setup([(1010.0, 1000.0), (1000.0, 985.0), (1200.0, 1000.0)], [0, 0, 0],
+                               iterations=8, player_share=0.25)
+    collision.update(player, 1 / 60)
+    reach = PLAYER_RADIUS + ENEMY_SIZE * 0.25
+    for enemy in enemies[:2]:
+        dist = math.hypot(enemy.position[0] - player.x, enemy.position[1] - player.y)
+        assert dist >= reach - 0.5
+    # The enemy to the right was pushed right, the one above pushed up, the far one left alone
+    assert enemies[0].position[0] > 1010.0
+    assert enemies[1].position[1] < 985.0
+    assert enemies[2].position == (1200.0, 1000.0)
+    # The player moved away from both, by less than the enemies did
+    assert player.x < 1000.0 and player.y > 1000.0
+    assert 1000.0 - player.x < enemies[0].position[0] - 1010.0
+    assert player.position == [player.x, player.y]
+    assert player.hits == []  # harmless enemies deal no contact damage
+
+
+def test_stacked_enemy_is_pushed_along_x():
+    """An enemy exactly on the player still gets a separation direction"""
+    player = Target(500.0, 500.0)
+    collision, enemies = setup([(500.0, 500.0)], [0], iterations=4, player_share=0.0)
+    collision.update(player, 1 / 60)
+    assert enemies[0].position[0] > 500.0
+    assert enemies[0].position[1] == 500.0
+    assert (player.x, player.y) == (500.0, 500.0)
+
+
+def test_contact_damage_cooldown():
+    """The hardest hitter touching the player deals damage at most once per interval"""
+    player = Target(1000.0, 1000.0)
+    collision, enemies = setup([(1005.0, 1000.0), (995.0, 1000.0), (1000.0, 1300.0)], [1, 2, 2],
+                               iterations=1, player_share=0.0, contact_interval=0.5)
+    collision.update(player, 0.1)
+    assert len(player.hits) == 1
+    amount, source = player.hits[0]
+    assert amount == 9 and source is enemies[1]
+
+    # Kept touching (they close in again every tick), but on cooldown for the next 0.5s
+    hits = []
+    for _ in range(3):
+        for enemy in enemies[:2]:
+            enemy.teleport(1000.0, 1000.0)
+        collision.update(player, 0.2)
+        hits.append(len(player.hits))
+    assert hits == [1, 1, 2]
+
+    collision.reset()
+    assert collision.contact_cooldown == 0.0
+
+
+def test_dead_enemies_are_ignored():
+    """Enemies that are no longer alive neither collide nor deal damage"""
+    player = Target(1000.0, 1000.0)
+    collision, enemies = setup([(1005.0, 1000.0)], [2])
+    enemies[0].alive = False
+    collision.update(player, 0.1)
+    assert enemies[0].position == (1005.0, 1000.0)
+    assert player.hits == []
+
+
+if __name__ == "__main__":
+    test_push_out_separates_bodies()
+    test_stacked_enemy_is_pushed_along_x()
+    test_contact_damage_cooldown()
+    test_dead_enemies_are_ignored()
+    print("All collision tests passed.")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the render-only corpse store.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+from core.ecs import World
+from entities.components import Velocity
+from entities.enemy import Enemy, EnemyType
+from entities.spawner import EnemyPool
+from systems.corpses import CorpseStore
+
+
+class DeathClip:
+    """Logic stand-in: the enemy has a death animation still to play."""
+
+
+def setup(count):
+    world = World()
+    etype = EnemyType('grunt', max_health=10, size=20)
+    enemies = [Enemy(etype, (i * 100.0, 0.0), world) for i in range(count)]
+    pool = EnemyPool()
+    return CorpseStore(pool.release, view_margin=50), pool, world, enemies
+
+
+def test_collect_moves_dead_enemies_in_place():
+    """Dead enemies leave the live list (same list object) and stop moving"""
+    corpses, pool, world, enemies = setup(5)
+    live = enemies[:]
+    for enemy in live:
+        enemy.set_velocity(30.0, 40.0)
+    live[1].alive = False
+    live[3].alive = False
+    live[3].logic = DeathClip()
+    before = live
+
+    corpses.collect(live)
+    assert live is before
+    assert live == [enemies[0], enemies[2], enemies[4]]
+    assert list(corpses) == [enemies[1], enemies[3]]
+    assert world.get(enemies[1].entity, Velocity, 'x') == 0.0
+    assert world.get(enemies[3].entity, Velocity, 'y') == 0.0
+    # No death animation: done right away; with one: wait for it
+    assert enemies[1].dead and not enemies[3].dead
+
+    corpses.collect(live)
+    assert len(corpses) == 2
+
+
+def test_update_releases_finished_and_sets_visibility():
+    """Finished corpses go back to the pool; the others get their visibility updated"""
+    corpses, pool, world, enemies = setup(3)
+    for enemy in enemies:
+        enemy.alive = False
+        enemy.logic = DeathClip()
+    corpses.collect(enemies)
+    assert enemies == []
+    first, second, third = corpses.corpses
+    second.dead = True
+
+    released = corpses.update(pygame.Rect(0, -100, 100, 200))
+    assert released == 1
+    assert len(pool) == 1 and second.entity is None
+    assert list(corpses) == [first, third]
+    assert first.visible          # Inside the view
+    assert not third.visible      # x=200 is past the right edge plus the 50px margin
+
+    corpses.update(pygame.Rect(0, -100, 100, 200).move(60, 0))
+    assert third.visible
+
+    corpses.clear()
+    assert len(corpses) == 0
+    assert len(pool) == 3
+    assert len(world) == 0
+
+
+if __name__ == "__main__":
+    test_collect_moves_dead_enemies_in_place()
+    test_update_releases_finished_and_sets_visibility()
+    print("All corpse store tests passed.")
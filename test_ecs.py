@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the archetype ECS world.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.ecs import World
+from entities.components import Position, Velocity, Health, Handle
+from entities.enemy import Enemy, EnemyType
+
+
+class Owner:
+    """Stand-in for an object referenced through a Handle."""
+    def __init__(self, name):
+        self.name = name
+
+
+def test_create_and_grow():
+    """Archetypes grow past their initial capacity without losing rows"""
+    world = World()
+    entities = [world.create({Position: {'x': i, 'y': -i}, Velocity: {}}) for i in range(200)]
+    archetype = world.query(Position, Velocity)[0]
+    assert archetype.count == 200
+    assert archetype.capacity >= 200
+    assert len(world) == 200
+    for i, entity in enumerate(entities):
+        assert world.get(entity, Position, 'x') == i
+        assert world.get(entity, Position, 'y') == -i
+        assert world.get(entity, Velocity, 'x') == 0
+
+
+def test_destroy_swap_removes_and_keeps_handles():
+    """Destroying a row moves the last row into it and keeps locations and handles in step"""
+    world = World()
+    owners = [Owner(f"e{i}") for i in range(5)]
+    entities = [world.create({Position: {'x': i}, Handle: {'obj': owner}}) for i, owner in enumerate(owners)]
+    archetype = world.query(Position, Handle)[0]
+    last = archetype.count - 1
+
+    world.destroy(entities[1])
+    assert not world.is_alive(entities[1])
+    assert archetype.count == 4
+    # The last entity now sits in the freed row, with its own handle and fields
+    assert world.locations[entities[4]] == (archetype, 1)
+    assert archetype.column(Handle, 'obj')[1] is owners[4]
+    assert world.get(entities[4], Position, 'x') == 4
+    # The vacated slot drops its object reference
+    assert archetype.columns[Handle.name]['obj'][last] is None
+    for i in (0, 2, 3, 4):
+        assert world.get(entities[i], Handle, 'obj') is owners[i]
+
+    # Removing the last row moves nothing
+    world.destroy(entities[3])
+    assert archetype.count == 3
+    assert [o.name for o in archetype.column(Handle, 'obj')] == ['e0', 'e4', 'e2']
+
+
+def test_enemy_handles_follow_swap_remove():
+    """Enemy setters keep writing their own row after another enemy's entity is destroyed"""
+    world = World()
+    etype = EnemyType('grunt', max_health=10, size=20)
+    enemies = [Enemy(etype, (i * 10.0, 0.0), world) for i in range(3)]
+    enemies[0].despawn()
+    moved = enemies[2]
+    moved.health = 4
+    moved.teleport(55.0, 66.0)
+    assert world.get(moved.entity, Health, 'current') == 4
+    assert world.get(moved.entity, Position, 'x') == 55.0
+    assert world.get(enemies[1].entity, Health, 'current') == 10
+    assert world.get(moved.entity, Handle, 'obj') is moved
+
+
+def test_add_and_remove_component():
+    """Adding or removing a component moves the entity between archetypes with its data"""
+    world = World()
+    a = world.create({Position: {'x': 1, 'y': 2}})
+    b = world.create({Position: {'x': 3, 'y': 4}})
+    assert world.query(Position, Health) == []
+
+    world.add_component(a, Health, {'current': 7, 'max': 10})
+    with_health = world.query(Position, Health)
+    assert len(with_health) == 1 and with_health[0].count == 1
+    assert world.get(a, Position, 'y') == 2
+    assert world.get(a, Health, 'current') == 7
+    # b was swapped into a's old row
+    assert world.locations[b][1] == 0
+    assert world.get(b, Position, 'x') == 3
+    # Position queries see both archetypes
+    assert sum(arch.count for arch in world.query(Position)) == 2
+
+    world.remove_component(a, Health)
+    assert world.locations[a][0] is world.locations[b][0]
+    assert world.get(a, Position, 'x') == 1
+    assert with_health[0].count == 0
+
+
+if __name__ == "__main__":
+    test_create_and_grow()
+    test_destroy_swap_removes_and_keeps_handles()
+    test_enemy_handles_follow_swap_remove()
+    test_add_and_remove_component()
+    print("All ECS tests passed.")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the typed gameplay event bus.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from core.events import EventBus, EventQueue, EventType, PHASE_EARLY, PHASE_LATE
+
+Ping = EventType('ping', value=np.int32, source=object)
+Echo = EventType('echo', value=np.int32)
+Early = EventType('early', phase=PHASE_EARLY, value=np.int32)
+
+
+def test_queue_grows_past_capacity():
+    """Appending past capacity doubles the columns and keeps every event"""
+    queue = EventQueue(Ping, capacity=4)
+    for i in range(10):
+        queue.append({'value': i})
+    assert queue.capacity == 16
+    assert queue.count == 10
+    assert queue.batch(queue.count).value.tolist() == list(range(10))
+
+
+def test_consume_keeps_later_events_and_drops_references():
+    """consume() shifts the unconsumed events forward and clears object slots"""
+    queue = EventQueue(Ping, capacity=8)
+    owner = object()
+    for i in range(5):
+        queue.append({'value': i, 'source': owner})
+    queue.consume(3)
+    assert queue.count == 2
+    assert queue.batch(2).value.tolist() == [3, 4]
+    assert queue.columns['source'][2:5].tolist() == [None, None, None]
+    queue.clear()
+    assert queue.count == 0
+    assert queue.columns['source'][0] is None
+
+
+def test_dispatch_batches_by_phase():
+    """Listeners get one batch per dispatch, only for events of that phase"""
+    bus = EventBus(capacity=4)
+    seen = []
+    bus.subscribe(Ping, lambda batch: seen.append(('ping', batch.value.tolist())))
+    bus.subscribe(Early, lambda batch: seen.append(('early', batch.value.tolist())))
+    for i in range(6):
+        bus.emit(Ping, value=i)
+    bus.emit(Early, value=99)
+
+    bus.dispatch(PHASE_EARLY)
+    assert seen == [('early', [99])]
+    bus.dispatch(PHASE_LATE)
+    assert seen == [('early', [99]), ('ping', [0, 1, 2, 3, 4, 5])]
+    bus.dispatch(PHASE_LATE)
+    assert len(seen) == 2
+
+
+def test_events_raised_during_dispatch_are_kept():
+    """Events a listener raises (even ones that grow the queue) reach the next dispatch"""
+    bus = EventBus(capacity=2)
+    seen = []
+
+    def on_ping(batch):
+        values = batch.value.tolist()
+        seen.append(values)
+        # Re-raise more events than the queue holds while its batch is being read
+        if values[0] < 10:
+            for value in values:
+                bus.emit(Ping, value=value + 10)
+                bus.emit(Ping, value=value + 20)
+        # The batch still reads the events it was handed
+        assert batch.value.tolist() == values
+
+    bus.subscribe(Ping, on_ping)
+    bus.emit(Ping, value=1)
+    bus.emit(Ping, value=2)
+    bus.dispatch(PHASE_LATE)
+    assert seen == [[1, 2]]
+    assert bus.queues[Ping].count == 4
+
+    bus.dispatch(PHASE_LATE)
+    assert seen == [[1, 2], [11, 21, 12, 22]]
+    assert bus.queues[Ping].count == 0
+
+
+def test_reset_drops_events_and_listeners():
+    """reset() empties the queues and forgets the listeners"""
+    bus = EventBus()
+    calls = []
+    bus.subscribe(Echo, calls.append)
+    bus.emit(Echo, value=1)
+    bus.reset()
+    bus.emit(Echo, value=2)
+    bus.dispatch(PHASE_LATE)
+    assert calls == []
+    assert bus.queues[Echo].count == 0
+
+
+if __name__ == "__main__":
+    test_queue_grows_past_capacity()
+    test_consume_keeps_later_events_and_drops_references()
+    test_dispatch_batches_by_phase()
+    test_events_raised_during_dispatch_are_kept()
+    test_reset_drops_events_and_listeners()
+    print("All event bus tests passed.")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared enemy flow field.
+"""
+
+import sys
+import os
+import heapq
+import math
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pygame
+from rendering.tilemap import TileMap
+from systems.flow_field import FlowField
+
+CELL = 32
+STEPS = [(dr, dc, math.sqrt(2.0) if dr and dc else 1.0)
+         for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+
+def dijkstra(walkable, goal):
+    """Reference cost on an 8-connected grid; diagonals may not cut a blocked corner."""
+    rows, cols = walkable.shape
+    cost = np.full((rows, cols), np.inf)
+    cost[goal] = 0.0
+    heap = [(0.0, goal)]
+    while heap:
+        c, (r, col) = heapq.heappop(heap)
+        if c > cost[r, col]:
+            continue
+        for dr, dc, step in STEPS:
+            nr, nc = r + dr, col + dc
+            if not (0 <= nr < rows and 0 <= nc < cols) or not walkable[nr, nc]:
+                continue
+            if dr and dc and not (walkable[r + dr, col] and walkable[r, col + dc]):
+                continue
+            if c + step < cost[nr, nc]:
+                cost[nr, nc] = c + step
+                heapq.heappush(heap, (c + step, (nr, nc)))
+    return cost
+
+
+def check_against_reference(field):
+    """Costs match Dijkstra and every direction steps to a cheaper neighbor (none at the goal)."""
+    reference = dijkstra(field.walkable, field.goal_cell)
+    reachable = np.isfinite(reference)
+    assert np.allclose(field.cost[reachable], reference[reachable], atol=1e-3)
+    for r in range(field.rows):
+        for c in range(field.cols):
+            dx, dy = field.direction_at(c * CELL + CELL / 2, r * CELL + CELL / 2)
+            if not reachable[r, c] or (r, c) == field.goal_cell:
+                assert (dx, dy) == (0.0, 0.0)
+                continue
+            step_r, step_c = int(round(np.sign(dy))), int(round(np.sign(dx)))
+            assert (step_r, step_c) != (0, 0)
+            assert abs(math.hypot(dx, dy) - 1.0) < 1e-6
+            assert reference[r + step_r, c + step_c] < reference[r, c]
+
+
+def block_cells(field, mask):
+    """Block every cell set in mask."""
+    for r, c in zip(*np.nonzero(mask)):
+        field.set_blocked_rect(pygame.Rect(c * CELL, r * CELL, CELL, CELL))
+
+
+def test_open_grid_matches_dijkstra():
+    """Without obstacles the closed-form field equals the Dijkstra result"""
+    field = FlowField(12 * CELL, 9 * CELL, cell_size=CELL)
+    field.update(5 * CELL + 4, 3 * CELL + 4)
+    field.rebuild()
+    assert not field.has_obstacles
+    check_against_reference(field)
+
+
+def test_obstacle_field_matches_dijkstra():
+    """A wall with a gap is routed around, and walled-off cells get no direction"""
+    field = FlowField(12 * CELL, 10 * CELL, cell_size=CELL)
+    # Wall across column 6 with a gap at row 8
+    field.set_blocked_rect(pygame.Rect(6 * CELL, 0, CELL, 8 * CELL))
+    # A pocket sealed off on every side
+    field.set_blocked_rect(pygame.Rect(0, 0, 3 * CELL, CELL))
+    field.set_blocked_rect(pygame.Rect(0, 2 * CELL, 3 * CELL, CELL))
+    field.set_blocked_rect(pygame.Rect(2 * CELL, CELL, CELL, CELL))
+    field.update(2 * CELL, 5 * CELL)
+    field.rebuild()
+    assert field.has_obstacles
+    check_against_reference(field)
+    # Right of the wall the way to the goal leads down toward the gap
+    assert field.direction_at(9 * CELL, 2 * CELL)[1] > 0
+    assert field.direction_at(CELL // 2, CELL + CELL // 2) == (0.0, 0.0)
+
+
+def test_field_builds_on_first_sample():
+    """Moving the goal only marks the field stale; the first sample rebuilds it once"""
+    field = FlowField(12 * CELL, 9 * CELL, cell_size=CELL)
+    field.update(5 * CELL, 3 * CELL)
+    field.update(6 * CELL, 3 * CELL)
+    assert field.rebuilds == 0
+    assert field.direction_at(0, 3 * CELL + 4) == (1.0, 0.0)
+    assert field.cost_at(0, 3 * CELL + 4) == 6.0
+    assert field.rebuilds == 1
+    # Same cell again: nothing to rebuild
+    assert not field.update(6 * CELL + 8, 3 * CELL + 8)
+    field.direction_at(0, 0)
+    assert field.rebuilds == 1
+
+
+def test_rebuild_is_time_sliced():
+    """step() spends a bounded sweep budget and the old field serves until the new one is done"""
+    field = FlowField(40 * CELL, 40 * CELL, cell_size=CELL, sweeps_per_tick=1)
+    field.set_blocked_rect(pygame.Rect(20 * CELL, 0, CELL, 39 * CELL))
+    field.update(CELL, CELL)
+    field.rebuild()
+    before = field.rebuilds
+    old_cost = field.cost.copy()
+
+    field.update(38 * CELL, CELL)
+    field.step()
+    assert field.rebuilds == before
+    assert np.array_equal(field.cost, old_cost)
+    ticks = 1
+    while field.rebuilds == before:
+        field.step()
+        ticks += 1
+    assert ticks > 1
+    check_against_reference(field)
+
+
+def test_bound_tilemap_blocks_solid_tiles():
+    """Solid tiles block their cells, and editing the map updates the field"""
+    tiles = np.zeros((8, 8), dtype=np.uint8)
+    tiles[3, 2:6] = 4
+    tilemap = TileMap(tiles, tile_size=CELL)
+    field = FlowField(8 * CELL, 8 * CELL, cell_size=CELL)
+    field.bind_tilemap(tilemap, solid_tiles=(4,))
+    assert not field.walkable[3, 2:6].any()
+    assert field.walkable.sum() == 64 - 4
+
+    field.update(4 * CELL, 6 * CELL)
+    field.rebuild()
+    check_against_reference(field)
+
+    tilemap.set(3, 3, 0)
+    assert field.walkable[3, 3]
+    field.rebuild()
+    check_against_reference(field)
+    # Straight down through the opened tile
+    assert field.direction_at(3 * CELL + 4, 2 * CELL + 4) == (0.0, 1.0)
+
+
+def test_obstacle_change_repairs_the_field():
+    """Edits under a fixed goal give exactly the field a fresh integration would"""
+    rng = np.random.default_rng(5)
+    field = FlowField(30 * CELL, 24 * CELL, cell_size=CELL)
+    rocks = rng.random(field.walkable.shape) < 0.25
+    rocks[12, 15] = False
+    block_cells(field, rocks)
+    field.update(15 * CELL, 12 * CELL)
+    field.rebuild()
+    for _ in range(12):
+        r, c = rng.integers(0, 24), rng.integers(0, 30)
+        field.set_blocked_rect(pygame.Rect(c * CELL, r * CELL, 2 * CELL, CELL), blocked=rng.random() < 0.6)
+        field.rebuild()
+        fresh = FlowField(30 * CELL, 24 * CELL, cell_size=CELL)
+        block_cells(fresh, ~field.walkable)
+        fresh.update(15 * CELL, 12 * CELL)
+        fresh.rebuild()
+        assert np.array_equal(field.cost, fresh.cost)
+        assert field._directions == fresh._directions
+    check_against_reference(field)
+
+
+def test_blocking_sweeps_only_the_cut_paths():
+    """Blocking a cell re-integrates the box of cells routed through it, not the whole grid"""
+    field = FlowField(40 * CELL, 40 * CELL, cell_size=CELL, sweeps_per_tick=1)
+    field.update(5 * CELL, 20 * CELL)
+    field.set_blocked_rect(pygame.Rect(30 * CELL, 0, CELL, CELL))
+    field.rebuild()
+    old_cost = field.cost.copy()
+    # A cell right of the goal: only the cells behind it (further right) route through it
+    field.set_blocked_rect(pygame.Rect(34 * CELL, 20 * CELL, CELL, CELL))
+    field.step()
+    rows, cols = field._job.window
+    assert cols.start >= 32 and rows.stop - rows.start < 40
+    field.rebuild()
+    changed = field.cost != old_cost
+    assert changed.any() and not changed[:, :33].any()
+    check_against_reference(field)
+
+
+if __name__ == "__main__":
+    test_open_grid_matches_dijkstra()
+    test_obstacle_field_matches_dijkstra()
+    test_field_builds_on_first_sample()
+    test_rebuild_is_time_sliced()
+    test_bound_tilemap_blocks_solid_tiles()
+    test_obstacle_change_repairs_the_field()
+    test_blocking_sweeps_only_the_cut_paths()
+    print("All flow field tests passed.")
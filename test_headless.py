@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for seeded headless runs and the balance sweep output.
+"""
+
+import sys
+import os
+import csv
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from balance_sweep import FIELDS, write_results
+from core.clock import game_clock
+from core.headless import HeadlessRun, run_headless
+
+TIMING = ('mean_tick_ms', 'p95_tick_ms')
+
+
+def outcome(row):
+    """A result row without its wall-clock timings."""
+    return {key: value for key, value in row.items() if key not in TIMING}
+
+
+def test_runs_step_simulated_time():
+    """A run advances the game clock by its fixed timestep, not wall time"""
+    run = HeadlessRun('Normal', seed=3, policy='kite', dt=1 / 30)
+    for _ in range(30):
+        assert run.step()
+    assert abs(game_clock.now() - 1.0) < 1e-9
+    row = run.results()
+    assert row['survived_s'] == 1.0
+    assert set(row) == set(FIELDS)
+
+
+def test_same_seed_same_outcome():
+    """Two runs with the same mode, seed and policy play out identically"""
+    first = run_headless('Hard', seed=7, policy='stand_and_fight', duration=15.0)
+    second = run_headless('Hard', seed=7, policy='stand_and_fight', duration=15.0)
+    print(outcome(first))
+    assert outcome(first) == outcome(second)
+    assert first['peak_enemies'] > 0
+
+
+def test_write_results_csv():
+    """Rows are written as CSV with the sweep's columns"""
+    row = run_headless('Easy', seed=1, policy='auto_attack', duration=2.0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.csv')
+        write_results([row, row], path)
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+    assert len(rows) == 2
+    assert list(rows[0]) == FIELDS
+    assert rows[0]['mode'] == 'Easy' and rows[0]['policy'] == row['policy']
+
+
+if __name__ == "__main__":
+    test_runs_step_simulated_time()
+    test_same_seed_same_outcome()
+    test_write_results_csv()
+    print("All headless tests passed.")
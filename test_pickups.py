@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled XP/gold pickups.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from systems.pickups import PickupSystem, PICKUP_XP, PICKUP_GOLD
+
+
+def totals(pickups):
+    """Value on the floor per kind."""
+    live = pickups.alive
+    return (float(pickups.value[live & (pickups.kind == PICKUP_XP)].sum()),
+            float(pickups.value[live & (pickups.kind == PICKUP_GOLD)].sum()))
+
+
+def test_merge_conserves_value():
+    """Merging folds XP orbs per cell without changing the total, and leaves gold alone"""
+    rng = np.random.default_rng(3)
+    pickups = PickupSystem(budget=512, merge_threshold=10000)
+    xs = rng.uniform(0, 1000, 300)
+    ys = rng.uniform(0, 1000, 300)
+    pickups.spawn_many(PICKUP_XP, xs, ys, rng.integers(1, 5, 300))
+    pickups.spawn_many(PICKUP_GOLD, xs[:40], ys[:40], np.full(40, 2))
+    before = totals(pickups)
+    assert pickups.live == 340
+
+    pickups.merge(cell_size=200)
+    after = totals(pickups)
+    assert abs(after[0] - before[0]) < 1e-3
+    assert after[1] == before[1] == 80
+    assert pickups.live == int(pickups.alive.sum())
+    # At most one XP orb per 200px cell is left (scatter can push a few past the edge)
+    xp = np.flatnonzero(pickups.alive & (pickups.kind == PICKUP_XP))
+    cells = set(zip((pickups.x[xp] // 200).astype(int).tolist(), (pickups.y[xp] // 200).astype(int).tolist()))
+    assert len(xp) == len(cells)
+    assert len(xp) <= 49
+    assert int((pickups.alive & (pickups.kind == PICKUP_GOLD)).sum()) == 40
+
+
+def test_merge_places_orb_at_weighted_centre():
+    """A merged orb sits at the value-weighted centre of the orbs it replaced"""
+    pickups = PickupSystem(budget=16, merge_threshold=10000)
+    pickups.spawn_many(PICKUP_XP, [40.0, 40.0], [40.0, 40.0], [1.0, 3.0])
+    x, y = pickups.x[:2].copy(), pickups.y[:2].copy()
+    pickups.merge(cell_size=1000)
+    assert pickups.live == 1
+    slot = int(np.flatnonzero(pickups.alive)[0])
+    assert pickups.value[slot] == 4.0
+    assert abs(pickups.x[slot] - (x[0] + 3 * x[1]) / 4) < 1e-9
+    assert abs(pickups.y[slot] - (y[0] + 3 * y[1]) / 4) < 1e-9
+
+
+def test_full_pool_merges_to_make_room():
+    """Dropping into a full pool merges first, so XP value isn't lost"""
+    pickups = PickupSystem(budget=64, merge_threshold=10000)
+    pickups.spawn_many(PICKUP_XP, np.full(64, 500.0), np.full(64, 500.0), np.ones(64))
+    assert pickups.live == 64
+    pickups.spawn_many(PICKUP_XP, [500.0] * 10, [500.0] * 10, [1.0] * 10)
+    assert totals(pickups)[0] == 74.0
+    assert pickups.live <= 64
+
+
+def test_update_collects_and_returns_values():
+    """Pickups in the magnet fly in and are collected; their values are returned per kind"""
+    pickups = PickupSystem(budget=32, magnet_radius=200, collect_radius=20, merge_threshold=10000)
+    pickups.spawn_many(PICKUP_XP, [100.0, 150.0], [0.0, 0.0], [2.0, 5.0])
+    pickups.spawn_many(PICKUP_GOLD, [0.0], [120.0], [3.0])
+    pickups.spawn_many(PICKUP_XP, [2000.0], [2000.0], [7.0])  # Out of reach
+    xp = gold = 0.0
+    for _ in range(120):
+        got_xp, got_gold = pickups.update(1 / 60, 0.0, 0.0)
+        xp += got_xp
+        gold += got_gold
+    assert (xp, gold) == (7.0, 3.0)
+    assert pickups.live == 1
+    assert totals(pickups) == (7.0, 0.0)
+
+
+if __name__ == "__main__":
+    test_merge_conserves_value()
+    test_merge_places_orb_at_weighted_centre()
+    test_full_pool_merges_to_make_room()
+    test_update_collects_and_returns_values()
+    print("All pickup tests passed.")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the sprite render queue.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from rendering.render_queue import RenderQueue, LAYER_GROUND, LAYER_EFFECTS
+
+
+class RecordingTarget:
+    """Surface stand-in that keeps what flush() hands to blits."""
+    def __init__(self):
+        self.entries = []
+
+    def blits(self, entries, doreturn=True):
+        self.entries.extend(entries)
+
+
+def test_flush_orders_by_layer_then_depth():
+    """Lower layers draw first; within a layer, sprites whose bottom is higher up draw first"""
+    queue = RenderQueue()
+    tall = pygame.Surface((10, 40))
+    short = pygame.Surface((10, 10))
+    queue.blit(short, (0, 100), layer=LAYER_EFFECTS)         # effects, bottom 110
+    queue.blit(tall, (0, 50))                                # entities, bottom 90
+    queue.blit(short, (0, 70))                               # entities, bottom 80
+    queue.blit(short, (0, 500), layer=LAYER_GROUND)          # ground, bottom 510
+    queue.blit(tall, pygame.Rect(0, 0, 10, 95))              # entities, bottom 95 (Rect dest)
+    queue.on_layer(LAYER_GROUND).blit(tall, (0, -20))        # ground, bottom 20
+
+    target = RecordingTarget()
+    queue.flush(target, offset=(5, -5))
+    dests = [entry[1] for entry in target.entries]
+    assert dests == [(5, -25), (5, 495), (5, 65), (5, 45), (5, -5), (5, 95)]
+    assert len(queue) == 0
+
+
+def test_area_and_flags_pass_through():
+    """Source areas and blend flags reach the target, and the area height sets the depth"""
+    queue = RenderQueue()
+    sheet = pygame.Surface((64, 64))
+    sprite = pygame.Surface((8, 8))
+    frame = pygame.Rect(16, 0, 16, 16)
+    queue.blit(sheet, (0, 0), area=frame)                            # bottom 16, not 64
+    queue.blit(sprite, (0, 20), special_flags=pygame.BLEND_ADD)      # bottom 28
+    queue.blit(sprite, (0, 4))                                       # bottom 12
+
+    target = RecordingTarget()
+    queue.flush(target)
+    assert target.entries == [
+        (sprite, (0, 4)),
+        (sheet, (0, 0), frame, 0),
+        (sprite, (0, 20), None, pygame.BLEND_ADD),
+    ]
+    assert not queue.options
+
+
+def test_flush_onto_surface():
+    """A flushed queue draws onto a real Surface"""
+    queue = RenderQueue()
+    red = pygame.Surface((4, 4))
+    red.fill((255, 0, 0))
+    blue = pygame.Surface((4, 4))
+    blue.fill((0, 0, 255))
+    queue.blit(blue, (0, 1))   # Lower on screen, drawn over red
+    queue.blit(red, (0, 0))
+    target = pygame.Surface((8, 8))
+    queue.flush(target)
+    assert target.get_at((1, 2))[:3] == (0, 0, 255)
+    assert target.get_at((1, 0))[:3] == (255, 0, 0)
+
+
+if __name__ == "__main__":
+    test_flush_orders_by_layer_then_depth()
+    test_area_and_flags_pass_through()
+    test_flush_onto_surface()
+    print("All render queue tests passed.")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the array-backed skill book.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from skills.base import Skill
+from skills.book import SkillBook
+from skills.registry import SkillDefinition
+
+
+class IdleSkill(Skill):
+    """Skill that does nothing when used, for cooldown bookkeeping."""
+    def use(self, target_pos=None):
+        pass
+
+    def update(self, dt, entities):
+        pass
+
+    def draw(self, surface):
+        pass
+
+
+class HeldControls:
+    """Input source holding down a fixed set of skills."""
+    def __init__(self, held):
+        self.held = set(held)
+
+    def is_skill_pressed(self, name):
+        return name in self.held
+
+
+def make_book():
+    definitions = [
+        SkillDefinition('slash', IdleSkill, cooldown=0.5),
+        SkillDefinition('dash', IdleSkill, cooldown=2.0, movement=True),
+        SkillDefinition('burst', IdleSkill, cooldown=1.0),
+    ]
+    return SkillBook(definition(None) for definition in definitions)
+
+
+def test_slots_follow_insertion_order():
+    """Skills get consecutive slots and movement skills are flagged"""
+    book = make_book()
+    assert [skill.slot for skill in book.slots] == [0, 1, 2]
+    assert book['dash'].book is book
+    assert book.movement.tolist() == [False, True, False]
+    assert book.ready().tolist() == [True, True, True]
+
+
+def test_tick_and_ready_masks():
+    """Cooldowns count down together and clamp at zero"""
+    book = make_book()
+    for name in ('slash', 'dash', 'burst'):
+        book[name].start_cooldown(0.0)
+    assert book.ready().tolist() == [False, False, False]
+    assert not book['slash'].can_use(0.0)
+
+    book.tick(0.6)
+    assert book.ready().tolist() == [True, False, False]
+    assert book.cooldown_left('slash') == 0.0
+    assert abs(book.cooldown_left('dash') - 1.4) < 1e-9
+    assert book['slash'].can_use(0.6)
+
+    book.tick(0.5)
+    assert book.ready().tolist() == [True, False, True]
+    book.tick(10.0)
+    assert book.ready().all()
+    assert book.remaining.min() == 0.0
+
+
+def test_pressed_and_active_masks():
+    """pressed() follows the input source and active flags write through to the book"""
+    book = make_book()
+    assert book.pressed(HeldControls({'dash', 'burst'})).tolist() == [False, True, True]
+    assert book.pressed(HeldControls(())).tolist() == [False, False, False]
+
+    book['burst'].active = True
+    assert book.active.tolist() == [False, False, True]
+    assert book['burst'].active
+    castable = book.ready() & ~book.movement & ~book.active
+    assert castable.tolist() == [True, False, False]
+
+
+if __name__ == "__main__":
+    test_slots_follow_insertion_order()
+    test_tick_and_ready_masks()
+    test_pressed_and_active_masks()
+    print("All skill book tests passed.")
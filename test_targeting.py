@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for per-tick skill target acquisition.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.ecs import World
+from entities.enemy import Enemy, EnemyType
+from skills.targeting import TargetAcquisition
+from systems.spatial import SpatialHash
+
+
+class User:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+
+class Rule:
+    """Skill stand-in carrying a targeting rule and range."""
+    def __init__(self, targeting, range=0):
+        self.targeting = targeting
+        self.definition = self
+        self.range = range
+
+
+def setup(positions, **kwargs):
+    world = World()
+    etype = EnemyType('grunt', max_health=10, size=20)
+    enemies = [Enemy(etype, pos, world) for pos in positions]
+    index = SpatialHash(64)
+    index.rebuild(enemies)
+    return TargetAcquisition(index, switch_ratio=0.8, **kwargs), index, enemies
+
+
+def tick(targets, index, enemies, user, auto_aim=True):
+    index.rebuild([enemy for enemy in enemies if enemy.alive])
+    targets.begin_tick(user, (0, 0), auto_aim)
+
+
+def test_nearest_keeps_target_within_switch_ratio():
+    """The current target stays until another enemy is closer than switch_ratio of its distance"""
+    user = User(0.0, 0.0)
+    targets, index, enemies = setup([(100.0, 0.0), (0.0, 120.0)])
+    a, b = enemies
+    tick(targets, index, enemies, user)
+    assert targets.nearest()[0] is a
+
+    # b is now slightly closer, but not by enough to switch
+    b.teleport(0.0, 90.0)
+    tick(targets, index, enemies, user)
+    target, dist_sq = targets.nearest()
+    assert target is a and dist_sq == 100.0 ** 2
+    # True nearest is still used for range checks
+    assert targets.k_nearest(1) == [b]
+
+    # Closer than 0.8 * 100: switch
+    b.teleport(0.0, 79.0)
+    tick(targets, index, enemies, user)
+    assert targets.nearest()[0] is b
+    # And the hysteresis now protects b
+    a.teleport(70.0, 0.0)
+    tick(targets, index, enemies, user)
+    assert targets.nearest()[0] is b
+
+
+def test_dead_or_lost_target_is_replaced():
+    """A target that died or left the search area is dropped"""
+    user = User(0.0, 0.0)
+    targets, index, enemies = setup([(100.0, 0.0), (0.0, 110.0)])
+    a, b = enemies
+    tick(targets, index, enemies, user)
+    assert targets.nearest()[0] is a
+    a.alive = False
+    tick(targets, index, enemies, user)
+    assert targets.nearest()[0] is b
+    b.alive = False
+    tick(targets, index, enemies, user)
+    assert targets.nearest() == (None, float('inf'))
+    assert targets.current is None
+
+
+def test_search_widens_up_to_max_radius():
+    """Far enemies are found by widening the search, but not past max_radius"""
+    user = User(0.0, 0.0)
+    targets, index, enemies = setup([(1500.0, 0.0)], radius=200, max_radius=1600)
+    tick(targets, index, enemies, user)
+    assert targets.nearest()[0] is enemies[0]
+    enemies[0].teleport(1700.0, 0.0)
+    tick(targets, index, enemies, user)
+    assert targets.nearest()[0] is None
+
+
+def test_resolve_rules():
+    """resolve() aims, holds out-of-range skills and prefers elites for priority"""
+    user = User(0.0, 0.0)
+    targets, index, enemies = setup([(50.0, 0.0), (0.0, 120.0)])
+    near, far = enemies
+    far.elite = True
+    tick(targets, index, enemies, user)
+    assert targets.resolve(Rule('nearest_enemy')) == near.rect.center
+    assert targets.resolve(Rule('priority')) == far.rect.center
+    assert targets.resolve(Rule('nearest_in_range', range=60)) == near.rect.center
+    assert targets.resolve(Rule('nearest_in_range', range=40)) is None
+    assert targets.resolve(Rule('aim')) == (0, 0)
+    tick(targets, index, enemies, user, auto_aim=False)
+    assert targets.resolve(Rule('nearest_enemy')) == (0, 0)
+
+
+if __name__ == "__main__":
+    test_nearest_keeps_target_within_switch_ratio()
+    test_dead_or_lost_target_is_replaced()
+    test_search_widens_up_to_max_radius()
+    test_resolve_rules()
+    print("All targeting tests passed.")
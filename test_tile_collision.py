@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for solid map tiles blocking the player and enemies.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+from core.ecs import World
+from core.player_movement import handle_player_movement
+from entities.components import Position, Velocity
+from entities.enemy import Enemy, EnemyType
+from entities.enemy_registry import EnemyStatTable
+from rendering.tilemap import TileMap
+from systems.collision import BodyCollision
+from systems.movement import movement_system
+from systems.spatial import SpatialHash
+from systems.tile_collision import TileCollider
+
+TS = 32
+ROCK = 4
+
+
+def make_tiles(rocks):
+    """A 20x20 tile map of open ground with rock at the given (tx, ty) tiles."""
+    grid = np.zeros((20, 20), dtype=np.uint8)
+    for tx, ty in rocks:
+        grid[ty, tx] = ROCK
+    tilemap = TileMap(grid, TS)
+    return tilemap, TileCollider(tilemap)
+
+
+class Walker:
+    """Minimal player: position, speed and the last move."""
+    def __init__(self, x, y, speed=4.0):
+        self.x, self.y = x, y
+        self.position = [x, y]
+        self.rect = pygame.Rect(0, 0, 24, 24)
+        self.rect.center = (int(x), int(y))
+        self.movement_speed = speed
+        self.last_move = (0, 0)
+        self.hits = []
+
+    def take_damage(self, amount, source=None):
+        self.hits.append((amount, source))
+
+
+def test_blocked_checks_body_corners():
+    """A body overlaps rock when any corner of its box does; off the map is open"""
+    _, tiles = make_tiles([(5, 5)])
+    assert tiles.blocked(5 * TS + 16, 5 * TS + 16)
+    assert not tiles.blocked(5 * TS - 4, 5 * TS + 16)
+    assert tiles.blocked(5 * TS - 4, 5 * TS + 16, radius=8)
+    assert not tiles.blocked(-100, -100, radius=8)
+    hit = tiles.blocked_many([5 * TS + 16, 5 * TS - 4, 5 * TS - 4], [5 * TS + 16] * 3, radius=[0, 0, 8])
+    assert hit.tolist() == [True, False, True]
+
+
+def test_slide_stops_at_rock_and_keeps_the_free_axis():
+    """Moving into a wall stops on that axis only, and long moves can't tunnel through"""
+    _, tiles = make_tiles([(5, y) for y in range(20)])  # A vertical wall at x 160..192
+    x, y = tiles.slide(140.0, 100.0, 150.0, 110.0, radius=12)
+    assert x == 140.0 and y == 110.0
+    # A 100 px dash straight at the wall ends in front of it
+    x, y = tiles.slide(140.0, 100.0, 240.0, 100.0, radius=12)
+    assert x + 12 < 5 * TS and y == 100.0
+    # Bodies already in rock may walk out
+    assert tiles.slide(170.0, 100.0, 140.0, 100.0) == (140.0, 100.0)
+
+
+def test_collider_follows_tile_changes():
+    """Tiles set after the collider was built block (and unblock) movement"""
+    tilemap, tiles = make_tiles([])
+    assert not tiles.any_solid
+    tilemap.set(2, 2, ROCK)
+    assert tiles.blocked(2 * TS + 1, 2 * TS + 1)
+    tilemap.set(2, 2, 0)
+    assert not tiles.blocked(2 * TS + 1, 2 * TS + 1) and not tiles.any_solid
+
+
+def test_player_movement_slides_along_rock():
+    """Walking diagonally into a wall slides along it"""
+    _, tiles = make_tiles([(5, y) for y in range(20)])
+    player = Walker(5 * TS - 13.0, 100.0)
+    for _ in range(10):
+        handle_player_movement(player, 1 / 60, (1, 1), tiles)
+    assert player.x == 5 * TS - 13.0
+    assert player.y == 140.0
+    assert player.position == [player.x, player.y]
+    assert player.last_move == (1, 1)
+
+
+def test_movement_system_keeps_enemies_off_rock():
+    """Enemy bodies stop at rock faces; the rest move as before"""
+    _, tiles = make_tiles([(5, y) for y in range(20)])
+    world = World()
+    blocked = world.create({Position: {'x': 150.0, 'y': 100.0}, Velocity: {'x': 600.0, 'y': 60.0}})
+    free = world.create({Position: {'x': 300.0, 'y': 100.0}, Velocity: {'x': 600.0, 'y': 60.0}})
+    for _ in range(5):
+        movement_system(world, 1 / 60, tiles)
+    assert world.get(blocked, Position, 'x') < 5 * TS
+    assert abs(world.get(blocked, Position, 'y') - 105.0) < 1e-9
+    assert abs(world.get(free, Position, 'x') - 350.0) < 1e-9
+
+
+def test_body_collision_does_not_push_into_rock():
+    """Separation pushes stop at rock for both the player and the enemies"""
+    _, tiles = make_tiles([(6, y) for y in range(20)])  # Wall at x 192..224
+    world = World()
+    etype = EnemyType('blob', max_health=10, size=40, contact_damage=0, type_id=0)
+    etype.stats = EnemyStatTable([etype])
+    enemy = Enemy(etype, (186.0, 100.0), world)
+    index = SpatialHash(64)
+    index.rebuild([enemy])
+    collision = BodyCollision(index, player_radius=12, iterations=4, player_share=0.5, tiles=tiles)
+    player = Walker(176.0, 100.0)
+    collision.update(player, 1 / 60)
+    assert enemy.position == (186.0, 100.0)
+    assert player.x < 176.0
+    assert not tiles.blocked(player.x, player.y, 12)
+
+
+if __name__ == "__main__":
+    test_blocked_checks_body_corners()
+    test_slide_stops_at_rock_and_keeps_the_free_axis()
+    test_collider_follows_tile_changes()
+    test_player_movement_slides_along_rock()
+    test_movement_system_keeps_enemies_off_rock()
+    test_body_collision_does_not_push_into_rock()
+    print("All tile collision tests passed.")
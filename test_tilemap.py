@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the tile map background data.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import WORLD_WIDTH, WORLD_HEIGHT, MAP_PATH, TILE_SIZE
+from rendering.tilemap import TileMap, load_tilemap
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_shipped_map_covers_the_world():
+    """The baked arena reaches past every edge of the world, partial tiles included"""
+    tilemap = TileMap.load(os.path.join(ROOT, MAP_PATH))
+    width, height = tilemap.pixel_size
+    print(f"Map: {tilemap.width}x{tilemap.height} tiles, {width}x{height} px")
+    assert width >= WORLD_WIDTH and height >= WORLD_HEIGHT
+    assert width - WORLD_WIDTH < TILE_SIZE and height - WORLD_HEIGHT < TILE_SIZE
+
+
+def test_generated_map_rounds_up():
+    """A missing map is generated with enough tiles to cover a world that isn't a tile multiple"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'maps', 'test.map')
+        tilemap = load_tilemap(path, 10 * TILE_SIZE, 5 * TILE_SIZE + 8)
+        assert (tilemap.width, tilemap.height) == (10, 6)
+        assert os.path.exists(path)
+        loaded = load_tilemap(path, 10 * TILE_SIZE, 5 * TILE_SIZE + 8)
+        assert (loaded.width, loaded.height) == (10, 6)
+
+
+def test_short_map_file_is_replaced():
+    """A map file smaller than the world is not used for the run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'short.map')
+        TileMap.generate(10, 4).save(path)
+        tilemap = load_tilemap(path, 10 * TILE_SIZE, 5 * TILE_SIZE)
+        assert (tilemap.width, tilemap.height) == (10, 5)
+        # The file on disk is left alone
+        assert TileMap.load(path).height == 4
+
+
+if __name__ == "__main__":
+    test_shipped_map_covers_the_world()
+    test_generated_map_rounds_up()
+    test_short_map_file_is_replaced()
+    print("All tilemap tests passed.")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for the wave director (spawn curve, surges, weight tables), its alias
+sampler, and the spawner's enemy pool.
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.ecs import World
+from entities.components import Position, Handle
+from entities.enemy import EnemyType
+from entities.spawner import EnemyPool, EnemySpawner
+from entities.wave_director import AliasTable, WaveDirector
+
+CURVE = [(0, 1.0), (10, 3.0), (30, 3.0), (40, 0.0)]
+
+
+def probabilities(table):
+    """Exact sampling distribution of an AliasTable, by item index."""
+    n = len(table.items)
+    p = [0.0] * n
+    for i in range(n):
+        p[i] += table.prob[i] / n
+        p[table.alias[i]] += (1.0 - table.prob[i]) / n
+    return p
+
+
+def test_alias_table_distribution():
+    """Sampled frequencies follow the weights (fixed seed)"""
+    weights = [1.0, 2.0, 3.0, 4.0]
+    table = AliasTable(['a', 'b', 'c', 'd'], weights)
+    rng = random.Random(1234)
+    samples = 100000
+    counts = {item: 0 for item in table.items}
+    for _ in range(samples):
+        counts[table.sample(rng)] += 1
+    total = sum(weights)
+    for item, weight in zip(table.items, weights):
+        frequency = counts[item] / samples
+        print(f"{item}: {frequency:.3f} (expected {weight / total:.3f})")
+        assert abs(frequency - weight / total) < 0.01
+
+
+def test_alias_table_degenerate_weights():
+    """Zero weights sample uniformly, an empty table samples None"""
+    table = AliasTable(['a', 'b'], [0.0, 0.0])
+    rng = random.Random(7)
+    counts = {'a': 0, 'b': 0}
+    for _ in range(20000):
+        counts[table.sample(rng)] += 1
+    assert abs(counts['a'] / 20000 - 0.5) < 0.02
+
+    empty = AliasTable([], [])
+    assert len(empty) == 0
+    assert empty.sample(rng) is None
+
+
+def test_spawn_rate_interpolation():
+    """The spawn rate is linear between curve points and flat past either end"""
+    director = WaveDirector([], curve=CURVE, surges=[])
+    assert director.spawn_rate_at(-5) == 1.0
+    assert director.spawn_rate_at(0) == 1.0
+    assert director.spawn_rate_at(5) == 2.0
+    assert director.spawn_rate_at(10) == 3.0
+    assert director.spawn_rate_at(20) == 3.0
+    assert director.spawn_rate_at(35) == 1.5
+    assert director.spawn_rate_at(40) == 0.0
+    assert director.spawn_rate_at(1000) == 0.0
+
+
+def test_plan_accumulates_fractional_budget():
+    """Fractional spawns carry over between ticks and the rate multiplier scales them"""
+    director = WaveDirector([], curve=[(0, 1.0)], surges=[])
+    counts = [director.plan(0, 0.25) for _ in range(8)]
+    assert counts == [0, 0, 0, 1, 0, 0, 0, 1]
+    assert sum(director.plan(0, 0.25, rate_multiplier=4.0) for _ in range(8)) == 8
+    assert abs(director.spawn_budget) < 1e-9
+
+
+def test_surge_backlog_drains_at_max_per_tick():
+    """A surge is released at its time and spread over ticks of at most max_per_tick"""
+    director = WaveDirector([], curve=[(0, 0.0)], surges=[(5, 25)], max_per_tick=10)
+    assert director.plan(4.9, 0.1) == 0
+    assert [director.plan(5.0 + i * 0.1, 0.1) for i in range(4)] == [10, 10, 5, 0]
+    director.schedule_surge(12)
+    assert director.plan(6, 0.1) == 10
+    assert director.backlog == 2
+    director.schedule_surge(3, at_time=8)
+    assert director.plan(7, 0.1) == 2
+    assert director.plan(8, 0.1) == 3
+
+
+def test_plan_keeps_what_the_limit_holds_back():
+    """Spawns over the caller's limit stay in the backlog instead of being dropped"""
+    director = WaveDirector([], curve=[(0, 0.0)], surges=[(0, 30)], max_per_tick=10)
+    assert director.plan(0, 0.1, limit=4) == 4
+    assert director.backlog == 26
+    assert director.plan(0, 0.1, limit=0) == 0
+    assert director.plan(0, 0.1, limit=-3) == 0
+    assert director.backlog == 26
+    assert director.plan(0, 0.1, limit=50) == 10
+    assert director.plan(0, 0.1) == 10
+    assert director.plan(0, 0.1) == 6
+
+
+def test_weight_table_segment_boundaries():
+    """Weight events apply strictly after their threshold (config: Plant x2 after 60s)"""
+    plant = EnemyType('Plant', max_health=10, size=20)
+    other = EnemyType('Other', max_health=10, size=20)
+    director = WaveDirector([plant, other], curve=CURVE, surges=[])
+    before = probabilities(director.weight_table_at(0))
+    assert abs(before[0] - 0.5) < 1e-9
+    assert director.weight_table_at(60) is director.weight_table_at(59.99)
+    after = director.weight_table_at(60.001)
+    assert after is not director.weight_table_at(60)
+    assert abs(probabilities(after)[0] - 2.0 / 3.0) < 1e-9
+    assert director.weight_table_at(10_000) is after
+
+
+def test_spawner_limit_defers_spawns():
+    """An enemy cap delays spawns rather than losing them, and an empty table consumes nothing"""
+    plant = EnemyType('Plant', max_health=10, size=20)
+    spawner = EnemySpawner([plant])
+    spawner.director = WaveDirector([plant], curve=[(0, 0.0)], surges=[], max_per_tick=8)
+    spawner.schedule_surge(12)
+    assert len(spawner.spawn_tick(0.1, limit=5)) == 5
+    assert len(spawner.spawn_tick(0.1, limit=0)) == 0
+    assert len(spawner.spawn_tick(0.1)) == 7
+    assert spawner.director.backlog == 0
+
+    empty = EnemySpawner([])
+    empty.director = WaveDirector([], curve=[(0, 10.0)], surges=[])
+    empty.schedule_surge(4)
+    assert empty.spawn_tick(1.0) == []
+    assert empty.director.backlog == 4
+    assert empty.director.spawn_budget == 0.0
+
+
+def test_enemy_pool_reuse():
+    """Released enemies are reset and handed out again instead of reallocated"""
+    world = World()
+    pool = EnemyPool()
+    small = EnemyType('small', max_health=10, size=20)
+    big = EnemyType('big', max_health=50, size=40)
+
+    first = pool.acquire(small, (10.0, 20.0), world)
+    first.health = 3
+    first.alive = False
+    pool.release(first)
+    assert len(pool) == 1
+    assert first.entity is None
+    assert len(world) == 0
+
+    again = pool.acquire(big, (100.0, 200.0), world)
+    assert again is first
+    assert len(pool) == 0
+    assert again.alive and not again.dead
+    assert again.type is big
+    assert again.health == 50 and again.size == 40
+    # The reused handle owns a fresh entity at the new position
+    assert world.get(again.entity, Position, 'x') == 100.0
+    assert world.get(again.entity, Handle, 'obj') is again
+
+    other = pool.acquire(small, (0.0, 0.0), world)
+    assert other is not again
+    assert len(world) == 2
+
+
+if __name__ == "__main__":
+    test_alias_table_distribution()
+    test_alias_table_degenerate_weights()
+    test_spawn_rate_interpolation()
+    test_plan_accumulates_fractional_budget()
+    test_surge_backlog_drains_at_max_per_tick()
+    test_plan_keeps_what_the_limit_holds_back()
+    test_weight_table_segment_boundaries()
+    test_spawner_limit_defers_spawns()
+    test_enemy_pool_reuse()
+    print("All wave director tests passed.")
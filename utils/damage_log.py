@@ -1,9 +1,15 @@
 """
 Comprehensive damage log logic.
 """
+from collections import deque
+from itertools import islice
+from config import DAMAGE_LOG_MAX_ENTRIES
+
+
 class DamageLog:
-    def __init__(self):
-        self.entries = []
+    """Keeps only the newest max_entries hits so long sessions don't grow without bound."""
+    def __init__(self, max_entries=DAMAGE_LOG_MAX_ENTRIES):
+        self.entries = deque(maxlen=max_entries)
 
     def add_entry(self, amount, source, target, timestamp):
         self.entries.append({
@@ -14,4 +20,4 @@ class DamageLog:
         })
 
     def get_recent(self, count=10):
-        return self.entries[-count:]
+        return list(islice(self.entries, max(0, len(self.entries) - count), None))